@@ -0,0 +1,427 @@
+#!/usr/bin/env python3
+"""Benchmark the rule engine of ``infer_rules.py`` on synthetic instance graphs.
+
+The generator builds instance graphs in the same shape as
+``create_instances.py`` writes them: representation concepts, reified
+``demo:Mapping`` nodes and asserted ``demo:Alignment`` nodes with their direct
+``demo:aligns`` triples. The ontology support graph is a random
+``rdfs:subClassOf`` hierarchy over the mapped ontology concepts.
+
+Shape parameters:
+- ``--concepts``: number of representation concepts; several sizes may be
+  given to measure how each phase scales;
+- ``--targets``: number of ontology concepts (default: twice the concepts);
+- ``--fanout``: mean number of exact meanings per concept;
+- ``--negative-ratio``: share of exact meanings with negative polarity;
+- ``--aligned-fraction`` and ``--component-size``: share of concepts that
+  take part in asserted alignments, and the size of each aligned chain;
+- ``--hierarchy-depth``: number of levels in the ontology hierarchy.
+
+For every size, each phase of the engine is timed (best of ``--repeat``
+runs), and its peak traced memory is measured in one extra run under
+``tracemalloc``. Phases are the rule functions of ``infer_rules.py``, so the
+report shows R2/R1a/R6 (saturated together), R3, R4a, R4b, R5a, R5b, R7 and
+R8 separately; R1 is reported together with building the output graph.
+
+With ``--max-growth-exponent`` the script exits with status 1 when a phase
+grows faster than that power of the input size between two sizes, which
+catches quadratic regressions in CI.
+
+Example:
+    python benchmark_inference.py --concepts 2000 4000 8000 --max-growth-exponent 1.5
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import random
+import sys
+import time
+import tracemalloc
+from collections import defaultdict
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from functools import wraps
+from itertools import pairwise
+from pathlib import Path
+
+from rdflib import Graph, URIRef
+from rdflib.namespace import RDF, RDFS
+
+import infer_rules
+from infer_rules import DEMO, DEMOI, alignment_uri, mapping_uri
+
+# Engine functions that are timed, in pipeline order, with their report label
+# and the inference counter that holds their result size.
+PHASES = (
+    ("AssertionTable", "collect assertions", None),
+    ("saturate_exact_meanings", "R2/R1a/R6 closure", "R6"),
+    ("rule_r3", "R3", "R3"),
+    ("rule_r5a", "R5a", "R5a"),
+    ("rule_r5b", "R5b", "R5b"),
+    ("rule_r4a", "R4a", "R4a"),
+    ("rule_r4b", "R4b", "R4b"),
+    ("rule_r7", "R7", "R7"),
+    ("rule_r8", "R8", "R8"),
+    ("detect_horizontal_conflicts", "conflicts", "conflicts"),
+    ("build_output_graph", "R1 + output graph", "R1"),
+)
+
+# Phases faster than this at either size are too noisy to judge growth on.
+MIN_GROWTH_SECONDS = 0.02
+
+
+@dataclass(frozen=True)
+class SyntheticShape:
+    concepts: int
+    targets: int
+    fanout: float
+    negative_ratio: float
+    aligned_fraction: float
+    component_size: int
+    hierarchy_depth: int
+
+
+@dataclass
+class PhaseMeasurement:
+    seconds: float = math.inf
+    peak_mib: float = 0.0
+    calls: int = 0
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Benchmark infer_rules.py on synthetic instance graphs."
+    )
+    parser.add_argument(
+        "--concepts",
+        type=int,
+        nargs="+",
+        default=[1000, 2000, 4000],
+        help="Number of representation concepts; one benchmark per value (default: 1000 2000 4000).",
+    )
+    parser.add_argument(
+        "--targets",
+        type=int,
+        default=None,
+        help="Number of ontology concepts (default: twice the number of concepts).",
+    )
+    parser.add_argument(
+        "--fanout",
+        type=float,
+        default=1.2,
+        help="Mean number of exact meanings per concept (default: 1.2).",
+    )
+    parser.add_argument(
+        "--negative-ratio",
+        type=float,
+        default=0.2,
+        help="Share of exact meanings with negative polarity (default: 0.2).",
+    )
+    parser.add_argument(
+        "--aligned-fraction",
+        type=float,
+        default=0.2,
+        help="Share of concepts with asserted alignments (default: 0.2).",
+    )
+    parser.add_argument(
+        "--component-size",
+        type=int,
+        default=3,
+        help="Number of concepts per chain of asserted alignments (default: 3).",
+    )
+    parser.add_argument(
+        "--hierarchy-depth",
+        type=int,
+        default=6,
+        help="Number of levels in the rdfs:subClassOf hierarchy (default: 6).",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="Timed runs per size; the fastest run is reported (default: 3).",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="Random seed of the generator (default: 0).",
+    )
+    parser.add_argument(
+        "--max-growth-exponent",
+        type=float,
+        default=None,
+        help="Fail when a phase grows faster than size**EXPONENT between two sizes.",
+    )
+    parser.add_argument(
+        "--json",
+        default=None,
+        help="Optional path of a JSON file that receives all measurements.",
+    )
+    return parser.parse_args()
+
+
+def generate_graphs(shape: SyntheticShape, seed: int) -> tuple[Graph, Graph]:
+    """Return a synthetic instance graph and its ontology support graph."""
+    rng = random.Random(seed)
+    concepts = [DEMOI[f"bench-concept-{index}"] for index in range(shape.concepts)]
+    targets = [
+        URIRef(f"https://example.org/bench-ontology/T{index}")
+        for index in range(shape.targets)
+    ]
+
+    ontology = Graph()
+    levels: list[list[URIRef]] = [[] for _ in range(max(shape.hierarchy_depth, 1))]
+    for index, target in enumerate(targets):
+        levels[index * len(levels) // len(targets)].append(target)
+    for upper, lower in pairwise(levels):
+        for target in lower:
+            ontology.add((target, RDFS.subClassOf, rng.choice(upper)))
+
+    graph = Graph()
+    whole, fraction = divmod(shape.fanout, 1)
+    for concept in concepts:
+        graph.add((concept, RDF.type, DEMO.RepresentationConcept))
+        count = int(whole) + (1 if rng.random() < fraction else 0)
+        for target in rng.sample(targets, min(count, len(targets))):
+            polarity = (
+                DEMO.negative if rng.random() < shape.negative_ratio else DEMO.positive
+            )
+            node = mapping_uri(concept, target, polarity)
+            graph.add((node, RDF.type, DEMO.Mapping))
+            graph.add((node, DEMO.source, concept))
+            graph.add((node, DEMO.target, target))
+            graph.add((node, DEMO.hasMappingSource, concept))
+            graph.add((node, DEMO.hasTargetOntologyConcept, target))
+            graph.add((node, DEMO.hasPolarity, polarity))
+            graph.add((node, DEMO.hasProvenance, DEMO.asserted))
+
+    aligned = rng.sample(concepts, int(len(concepts) * shape.aligned_fraction))
+    for start in range(0, len(aligned), shape.component_size):
+        chain = aligned[start : start + shape.component_size]
+        for left, right in pairwise(chain):
+            node = alignment_uri(left, right)
+            graph.add((node, RDF.type, DEMO.Alignment))
+            graph.add((node, DEMO.source, left))
+            graph.add((node, DEMO.target, right))
+            graph.add((node, DEMO.hasAlignmentSource, left))
+            graph.add((node, DEMO.hasAlignmentTarget, right))
+            graph.add((node, DEMO.hasProvenance, DEMO.asserted))
+            graph.add((left, DEMO.aligns, right))
+            graph.add((right, DEMO.aligns, left))
+    return graph, ontology
+
+
+@contextmanager
+def timed_phases(
+    record: Callable[[tuple[str, float, float]], None], trace_memory: bool
+) -> Iterator[None]:
+    """Wrap the engine functions in ``PHASES`` so every call is measured.
+
+    ``record`` receives ``(name, seconds, peak MiB)`` for every call. The peak
+    is the traced memory the call allocated on top of what was already live
+    when it started, so the input graph and the results of earlier phases do
+    not count; it is only traced when ``trace_memory`` is set and
+    ``tracemalloc`` runs.
+
+    The rule engine looks these functions up as module globals, so replacing
+    them on the module is enough; the originals are restored on exit.
+    """
+    originals = {name: getattr(infer_rules, name) for name, _label, _counter in PHASES}
+
+    def measured(name: str, function: Callable) -> Callable:
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            baseline = 0
+            if trace_memory:
+                tracemalloc.reset_peak()
+                baseline = tracemalloc.get_traced_memory()[0]
+            started = time.perf_counter()
+            value = function(*args, **kwargs)
+            elapsed = time.perf_counter() - started
+            peak = tracemalloc.get_traced_memory()[1] - baseline if trace_memory else 0
+            record((name, elapsed, peak / (1024 * 1024)))
+            return value
+
+        return wrapper
+
+    for name, function in originals.items():
+        setattr(infer_rules, name, measured(name, function))
+    try:
+        yield
+    finally:
+        for name, function in originals.items():
+            setattr(infer_rules, name, function)
+
+
+def run_pipeline(graph: Graph, hierarchy: infer_rules.HierarchyIndex) -> dict[str, int]:
+    """Run inference and build the output graph the way ``main()`` does."""
+    result, counters, mapping_assertions, alignment_assertions, _cleanup = (
+        infer_rules.infer(
+            graph,
+            hierarchy,
+            trust_horizontal_input=False,
+            trust_bare_aligns=False,
+        )
+    )
+    _output, output_counters = infer_rules.build_output_graph(
+        graph, result, mapping_assertions, alignment_assertions, set()
+    )
+    counters.update(output_counters)
+    counters["exact_meanings"] = len(mapping_assertions)
+    return dict(counters)
+
+
+def benchmark_size(
+    shape: SyntheticShape, seed: int, repeat: int
+) -> tuple[dict[str, PhaseMeasurement], dict[str, int], float]:
+    graph, ontology = generate_graphs(shape, seed)
+    hierarchy = infer_rules.HierarchyIndex.from_graph(ontology)
+    measurements: dict[str, PhaseMeasurement] = defaultdict(PhaseMeasurement)
+
+    counters: dict[str, int] = {}
+    best_total = math.inf
+    for _ in range(repeat):
+        samples: list[tuple[str, float, float]] = []
+        started = time.perf_counter()
+        with timed_phases(samples.append, trace_memory=False):
+            counters = run_pipeline(graph, hierarchy)
+        best_total = min(best_total, time.perf_counter() - started)
+
+        run_seconds: dict[str, float] = defaultdict(float)
+        run_calls: dict[str, int] = defaultdict(int)
+        for name, seconds, _peak in samples:
+            run_seconds[name] += seconds
+            run_calls[name] += 1
+        for name, seconds in run_seconds.items():
+            measurement = measurements[name]
+            measurement.seconds = min(measurement.seconds, seconds)
+            measurement.calls = run_calls[name]
+
+    samples = []
+    tracemalloc.start()
+    try:
+        with timed_phases(samples.append, trace_memory=True):
+            run_pipeline(graph, hierarchy)
+    finally:
+        tracemalloc.stop()
+    for name, _seconds, peak in samples:
+        measurements[name].peak_mib = max(measurements[name].peak_mib, peak)
+    return measurements, counters, best_total
+
+
+def growth_exponent(small: tuple[int, float], large: tuple[int, float]) -> float | None:
+    (small_size, small_seconds), (large_size, large_seconds) = small, large
+    if (
+        large_size <= small_size
+        or min(small_seconds, large_seconds) < MIN_GROWTH_SECONDS
+    ):
+        return None
+    return math.log(large_seconds / small_seconds) / math.log(large_size / small_size)
+
+
+def print_report(
+    shape: SyntheticShape,
+    measurements: dict[str, PhaseMeasurement],
+    counters: dict[str, int],
+    total_seconds: float,
+) -> None:
+    print(
+        f"Concepts: {shape.concepts}, targets: {shape.targets}, "
+        f"exact meanings: {counters.get('exact_meanings', 0)}"
+    )
+    print(f"{'phase':<20} {'seconds':>9} {'peak MiB':>9} {'result':>9}")
+    for name, label, counter in PHASES:
+        measurement = measurements.get(name)
+        if measurement is None:
+            continue
+        result = "" if counter is None else str(counters.get(counter, 0))
+        print(
+            f"{label:<20} {measurement.seconds:>9.4f} "
+            f"{measurement.peak_mib:>9.1f} {result:>9}"
+        )
+    print(f"{'total':<20} {total_seconds:>9.4f}")
+    print()
+
+
+def main() -> int:
+    args = parse_args()
+    sizes = sorted(set(args.concepts))
+
+    runs = []
+    for size in sizes:
+        shape = SyntheticShape(
+            concepts=size,
+            targets=args.targets or size * 2,
+            fanout=args.fanout,
+            negative_ratio=args.negative_ratio,
+            aligned_fraction=args.aligned_fraction,
+            component_size=max(args.component_size, 2),
+            hierarchy_depth=args.hierarchy_depth,
+        )
+        measurements, counters, total_seconds = benchmark_size(
+            shape, args.seed, max(args.repeat, 1)
+        )
+        print_report(shape, measurements, counters, total_seconds)
+        runs.append((shape, measurements, counters, total_seconds))
+
+    violations = []
+    for (small, small_phases, _c, _t), (large, large_phases, _c2, _t2) in pairwise(
+        runs
+    ):
+        for name, label, _counter in PHASES:
+            if name not in small_phases or name not in large_phases:
+                continue
+            exponent = growth_exponent(
+                (small.concepts, small_phases[name].seconds),
+                (large.concepts, large_phases[name].seconds),
+            )
+            if exponent is None:
+                continue
+            print(
+                f"Growth {label} {small.concepts} -> {large.concepts}: n^{exponent:.2f}"
+            )
+            if (
+                args.max_growth_exponent is not None
+                and exponent > args.max_growth_exponent
+            ):
+                violations.append(
+                    f"{label} {small.concepts} -> {large.concepts}: n^{exponent:.2f}"
+                )
+
+    if args.json:
+        json_path = Path(args.json).expanduser().resolve()
+        json_path.parent.mkdir(parents=True, exist_ok=True)
+        payload = [
+            {
+                "shape": asdict(shape),
+                "total_seconds": total_seconds,
+                "counters": counters,
+                "phases": {
+                    name: asdict(measurement)
+                    for name, measurement in measurements.items()
+                },
+            }
+            for shape, measurements, counters, total_seconds in runs
+        ]
+        json_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        print(f"Measurements written to: {json_path}")
+
+    if violations:
+        print("Phases above the allowed growth exponent:", file=sys.stderr)
+        for violation in violations:
+            print(f"- {violation}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    try:
+        raise SystemExit(main())
+    except (OSError, ValueError) as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        raise SystemExit(1)
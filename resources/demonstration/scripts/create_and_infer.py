@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""Create the demo instances and infer over them in one run.
+
+This runs ``create_instances.py`` and ``infer_rules.py`` back to back without
+the intermediate ``instances.ttl``: the instance graph that ``build_graph``
+builds from the CSV inputs is handed to the rule engine in memory, and only
+the extended graph is written. The CSV inputs, validation and error messages
+are those of ``create_instances.py``; the rules, ontology support files and
+output formats are those of ``infer_rules.py``, and the output equals running
+the two scripts one after the other.
+
+Default inputs (relative to this script):
+- ../inputs/prefix.csv
+- ../inputs/input-standard.csv
+- ../inputs/input-model.csv
+- ../inputs/input-horizontal.csv
+- ../inputs/health-ri-ontology.ttl, when available
+
+Default output:
+- ../inputs/instances_extended.ttl (``instances_extended.nt`` with
+  ``--output-format nt``)
+
+Implementation notes:
+- Serializing the instance graph and parsing it again is most of the cost of
+  the two-step pipeline on large inputs; here the ``Mapping`` and
+  ``Alignment`` assertions are read from the graph ``build_graph`` returns,
+  with the same ``AssertionTable`` scan that ``infer_rules.py`` runs after
+  parsing.
+- Use the separate scripts when ``instances.ttl`` itself is needed, for
+  incremental runs, ``--serve`` or ``--explain-output``.
+
+Example:
+    python create_and_infer.py --print-inconsistencies
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from contextlib import closing
+from pathlib import Path
+
+from create_instances import (
+    EXACT_MEANING_PREDICATE,
+    ScriptError,
+    build_graph,
+    load_horizontal_table,
+    load_prefixes,
+    load_vertical_table,
+    read_csv_files,
+)
+from infer_rules import (
+    Instrumentation,
+    load_hierarchy,
+    print_inconsistencies,
+    print_inference_summary,
+    run_inference,
+    run_output_graph,
+    serialize,
+)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Create the demo instances from the CSV inputs and write the inferred "
+            "extended graph, without writing instances.ttl."
+        )
+    )
+    parser.add_argument(
+        "--standard-input",
+        default=None,
+        help="Path to input-standard.csv. Default: ../inputs/input-standard.csv relative to this script.",
+    )
+    parser.add_argument(
+        "--model-input",
+        default=None,
+        help="Path to input-model.csv. Default: ../inputs/input-model.csv relative to this script.",
+    )
+    parser.add_argument(
+        "--horizontal-input",
+        default=None,
+        help="Path to input-horizontal.csv. Default: ../inputs/input-horizontal.csv relative to this script.",
+    )
+    parser.add_argument(
+        "--prefix",
+        default=None,
+        help="Path to prefix.csv. Default: ../inputs/prefix.csv relative to this script.",
+    )
+    parser.add_argument(
+        "--delimiter",
+        default=";",
+        help="CSV delimiter used by the input files (default: ';')",
+    )
+    parser.add_argument(
+        "--import-schema",
+        action="store_true",
+        help="Add owl:imports to the schema ontology IRI.",
+    )
+    parser.add_argument(
+        "--ontology-input",
+        action="append",
+        default=[],
+        help=(
+            "Additional ontology file used only for reasoning support. May be "
+            "repeated. Default: ../inputs/health-ri-ontology.ttl when available."
+        ),
+    )
+    parser.add_argument(
+        "--hierarchy-cache-dir",
+        default=None,
+        help=(
+            "Folder for rdfs:subClassOf snapshots of the ontology inputs, keyed by "
+            "file hash. Default: ../.cache/hierarchy relative to this script."
+        ),
+    )
+    parser.add_argument(
+        "--no-hierarchy-cache",
+        action="store_true",
+        help="Always parse the ontology inputs and do not read or write snapshots.",
+    )
+    parser.add_argument(
+        "--output",
+        default=None,
+        help="Output file. Default: ../inputs/instances_extended.ttl relative to this script.",
+    )
+    parser.add_argument(
+        "--output-format",
+        choices=("turtle", "turtle-stream", "nt"),
+        default="turtle",
+        help=(
+            "Output serialization, as in infer_rules.py (default: turtle; 'nt' "
+            "defaults to ../inputs/instances_extended.nt)."
+        ),
+    )
+    parser.add_argument(
+        "--fail-on-horizontal-conflicts",
+        action="store_true",
+        help="Abort without writing output when more than one final horizontal classification holds for the same pair",
+    )
+    parser.add_argument(
+        "--trust-bare-aligns",
+        action="store_true",
+        help="Treat direct aligns triples without an Alignment node as asserted seed facts.",
+    )
+    parser.add_argument(
+        "--print-inconsistencies",
+        action="store_true",
+        help=(
+            "Print detailed inconsistency information "
+            "(R7 concepts, R8 concepts, and horizontal conflict pairs)."
+        ),
+    )
+    parser.add_argument(
+        "--metrics-output",
+        default=None,
+        help="Write phase timings, peak RSS and the inference counters to this JSON file.",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help=(
+            "Number of worker processes, used both to parse the CSV files and to "
+            "evaluate independent mapping components (default: 1)."
+        ),
+    )
+    args = parser.parse_args()
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    return args
+
+
+def resolve_path(value: str | None, default: Path) -> Path:
+    return Path(value).expanduser().resolve() if value else default.resolve()
+
+
+def main() -> int:
+    args = parse_args()
+
+    script_dir = Path(__file__).resolve().parent
+    input_dir = script_dir.parent / "inputs"
+
+    csv_paths = [
+        resolve_path(args.prefix, input_dir / "prefix.csv"),
+        resolve_path(args.standard_input, input_dir / "input-standard.csv"),
+        resolve_path(args.model_input, input_dir / "input-model.csv"),
+        resolve_path(args.horizontal_input, input_dir / "input-horizontal.csv"),
+    ]
+    extension = "nt" if args.output_format == "nt" else "ttl"
+    output_path = resolve_path(
+        args.output, input_dir / f"instances_extended.{extension}"
+    )
+
+    ontology_inputs = [
+        str(Path(path).expanduser().resolve()) for path in args.ontology_input
+    ]
+    if not ontology_inputs:
+        default_ontology_path = (input_dir / "health-ri-ontology.ttl").resolve()
+        if default_ontology_path.is_file():
+            ontology_inputs.append(str(default_ontology_path))
+
+    cache_dir = None
+    if not args.no_hierarchy_cache:
+        cache_dir = resolve_path(
+            args.hierarchy_cache_dir, script_dir.parent / ".cache" / "hierarchy"
+        )
+
+    instrumentation = Instrumentation()
+    with instrumentation.phase("create"):
+        with closing(read_csv_files(csv_paths, args.delimiter, args.jobs)) as csv_files:
+            prefixes = load_prefixes(next(csv_files))
+            standard_table = load_vertical_table(next(csv_files), "standard")
+            model_table = load_vertical_table(next(csv_files), "model")
+            horizontal_table = load_horizontal_table(next(csv_files))
+        instance_graph, skipped_predicates = build_graph(
+            vertical_tables=[standard_table, model_table],
+            horizontal_table=horizontal_table,
+            prefixes=prefixes,
+            import_schema=args.import_schema,
+        )
+
+    with instrumentation.phase("hierarchy"):
+        hierarchy = load_hierarchy(instance_graph, ontology_inputs, cache_dir)
+
+    # The instance graph is fresh, so there is no materialized horizontal
+    # input to trust and no previous run to update incrementally.
+    run = run_inference(
+        instance_graph,
+        hierarchy,
+        trust_horizontal_input=False,
+        trust_bare_aligns=args.trust_bare_aligns,
+        jobs=args.jobs,
+        instrumentation=instrumentation,
+    )
+    result, counters = run.result, run.counters
+
+    if result.conflicts and args.fail_on_horizontal_conflicts:
+        print(
+            f"Final classification conflicts detected: {len(result.conflicts)}",
+            file=sys.stderr,
+        )
+        if args.print_inconsistencies:
+            for conflict in result.conflicts:
+                print(f"- {conflict.render()}", file=sys.stderr)
+        print(
+            "Refusing to write an invalid final classification state.",
+            file=sys.stderr,
+        )
+        if args.metrics_output:
+            instrumentation.write_json(
+                Path(args.metrics_output).expanduser().resolve(), counters
+            )
+        return 2
+
+    output_graph = run_output_graph(instance_graph, run, instrumentation)
+    with instrumentation.phase("serialize"):
+        serialize(output_graph, output_path, args.output_format)
+    if args.metrics_output:
+        instrumentation.write_json(
+            Path(args.metrics_output).expanduser().resolve(), counters
+        )
+
+    exact_rows = sum(
+        table.predicate_id.count(EXACT_MEANING_PREDICATE)
+        for table in (standard_table, model_table)
+    )
+    print(f"Updated graph written to: {output_path}")
+    print(f"Standard rows: {len(standard_table)}")
+    print(f"Model rows: {len(model_table)}")
+    print(f"Horizontal rows: {len(horizontal_table)}")
+    print(f"Exact-meaning rows materialized: {exact_rows}")
+    print(f"Vertical non-exact rows skipped: {sum(skipped_predicates.values())}")
+    if skipped_predicates:
+        details = ", ".join(
+            f"{predicate}={count}"
+            for predicate, count in sorted(skipped_predicates.items())
+        )
+        print(f"Skipped predicates: {details}", file=sys.stderr)
+    print(f"Ontology support files loaded: {len(ontology_inputs)}")
+    for ontology_path in ontology_inputs:
+        print(f"- {ontology_path}")
+    print_inference_summary(counters)
+    print(f"Final classification conflicts detected: {len(result.conflicts)}")
+    if args.print_inconsistencies:
+        print_inconsistencies(result)
+
+    return 0
+
+
+if __name__ == "__main__":
+    try:
+        raise SystemExit(main())
+    except ScriptError as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        raise SystemExit(1)
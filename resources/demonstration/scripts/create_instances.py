@@ -52,6 +52,19 @@ Implementation notes
   current schema.
 - Conflicting labels for the same representation concept are treated as a data
   error and cause the script to fail.
+- Duplicate rows, conflicting labels, concepts declared as both standard and
+  model, and unresolved horizontal references are collected over all rows
+  and reported together in one error, rather than one per run.
+- With ``--jobs`` the CSV files, and byte ranges of the large ones, are parsed
+  in a process pool and joined back in file order, so row numbers are kept.
+- The CSV files are read column by column rather than into one record per row.
+  Required fields, modifiers, types and duplicates are checked over whole
+  columns, still reporting the first offending row. Each distinct concept is
+  added to the graph once, and the Mapping and Alignment nodes are minted and
+  added in batches.
+- With ``--output-format nt`` or ``turtle-stream`` no rdflib Graph is built:
+  each triple is written as it is produced, and only the triples about
+  concepts and artifacts are remembered, so repeats can be skipped.
 
 Why direct hriv:hasExactMeaning triples are NOT created
 -------------------------------------------------------
@@ -82,16 +95,22 @@ from __future__ import annotations
 
 import argparse
 import csv
-import hashlib
+import io
 import re
 import sys
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import closing
 from dataclasses import dataclass
+from itertools import islice, pairwise
 from pathlib import Path
-from typing import Iterable, Literal as TypingLiteral
+from typing import Iterable, Iterator, Literal as TypingLiteral, TextIO
 
 from rdflib import Graph, Literal, Namespace, URIRef
 from rdflib.namespace import OWL, RDF, RDFS, XSD
+from rdflib.term import Node
+
+from node_iris import NodeIriMinter
 
 SCHEMA = Namespace("https://w3id.org/health-ri/semantic-interoperability/schema/")
 HRIV = Namespace("https://w3id.org/health-ri/mapping-vocabulary/")
@@ -120,6 +139,19 @@ EXPECTED_HORIZONTAL_COLUMNS = [
 ]
 
 ALLOWED_HORIZONTAL_TYPES = {"standard", "model"}
+ALLOWED_EXACT_MEANING_MODIFIERS = {"", "Not"}
+EXACT_MEANING_PREDICATE = "hriv:hasExactMeaning"
+
+# Rows transposed into the column lists per batch while reading a CSV file.
+CSV_BATCH_ROWS = 65536
+# With --jobs, larger CSV files are parsed as byte ranges of about this size.
+CSV_CHUNK_BYTES = 1 << 24
+
+# Problems listed at most in one error message; the rest are only counted.
+MAX_REPORTED_ISSUES = 200
+
+OUTPUT_FORMATS = ("turtle", "turtle-stream", "nt")
+TURTLE_LOCAL_NAME = re.compile(r"[A-Za-z_][A-Za-z0-9_-]*")
 
 CURIE_RE = re.compile(r"^(?P<prefix>[A-Za-z][A-Za-z0-9._-]*):(?P<local>.+)$")
 QUOTED_LANGSTRING_RE = re.compile(
@@ -135,28 +167,46 @@ class ScriptError(Exception):
 
 
 @dataclass(frozen=True)
-class VerticalRow:
-    row_number: int
+class CsvColumns:
+    """A CSV file held as one list of stripped values per column."""
+
+    path: Path
+    fieldnames: list[str]
+    columns: dict[str, list[str]]
+    row_count: int
+
+
+@dataclass(frozen=True)
+class VerticalTable:
+    """The columns of one vertical input file; data row ``i`` is CSV row ``i + 2``."""
+
     source_path: str
     source_kind: TypingLiteral["standard", "model"]
-    subject_id: str
-    subject_label: str
-    predicate_id: str
-    predicate_modifier: str
-    object_id: str
-    object_label: str
+    subject_id: list[str]
+    subject_label: list[str]
+    predicate_id: list[str]
+    predicate_modifier: list[str]
+    object_id: list[str]
+    object_label: list[str]
+
+    def __len__(self) -> int:
+        return len(self.subject_id)
 
 
 @dataclass(frozen=True)
-class HorizontalRow:
-    row_number: int
+class HorizontalTable:
+    """The columns of the horizontal input file; data row ``i`` is CSV row ``i + 2``."""
+
     source_path: str
-    subject_type: TypingLiteral["standard", "model"]
-    subject_id: str
-    subject_label: str
-    object_type: TypingLiteral["standard", "model"]
-    object_id: str
-    object_label: str
+    subject_type: list[TypingLiteral["standard", "model"]]
+    subject_id: list[str]
+    subject_label: list[str]
+    object_type: list[TypingLiteral["standard", "model"]]
+    object_id: list[str]
+    object_label: list[str]
+
+    def __len__(self) -> int:
+        return len(self.subject_id)
 
 
 class PrefixMap:
@@ -184,54 +234,78 @@ class PrefixMap:
 
 
 class ConceptRegistry:
-    def __init__(self, prefixes: PrefixMap) -> None:
-        self.prefixes = prefixes
-        self.known_ids: dict[tuple[str, str], Literal] = {}
-
-    def register(
-        self,
-        kind: TypingLiteral["standard", "model"],
-        curie: str,
-        label_value: str,
-        context: str,
-    ) -> None:
-        self.prefixes.expand(curie)
-        label = parse_label_literal(label_value)
-        key = (kind, curie)
-        existing = self.known_ids.get(key)
-        if existing is not None and existing != label:
-            raise ScriptError(
-                f"Conflicting labels for {kind} concept '{curie}' in {context}: "
-                f"existing {existing.n3()} vs new {label.n3()}"
-            )
-        self.known_ids[key] = label
+    """The labels of the known representation concepts, one hash index per kind.
 
-        other_kind = "model" if kind == "standard" else "standard"
-        if (other_kind, curie) in self.known_ids:
-            raise ScriptError(
-                f"Concept '{curie}' is declared as both standard and model."
-            )
+    ``register_tables`` indexes the subjects of all vertical tables in one pass
+    and ``reference_issues`` checks every concept the horizontal table refers
+    to; both return all the problems they find instead of stopping at the
+    first. A concept is indexed once per distinct label value, however many
+    rows repeat it, and keys are bare CURIE strings.
+    """
 
-    def require(
-        self,
-        kind: TypingLiteral["standard", "model"],
-        curie: str,
-        label_value: str,
-        context: str,
-    ) -> Literal:
-        key = (kind, curie)
-        if key not in self.known_ids:
-            raise ScriptError(
-                f"{context}: referenced {kind} concept '{curie}' was not found in the corresponding vertical input file."
-            )
-        given = parse_label_literal(label_value)
-        known = self.known_ids[key]
-        if known != given:
-            raise ScriptError(
-                f"{context}: label mismatch for {kind} concept '{curie}': "
-                f"expected {known.n3()} but found {given.n3()}"
+    def __init__(self, prefixes: PrefixMap) -> None:
+        self.prefixes = prefixes
+        self.labels: dict[str, dict[str, Literal]] = {"standard": {}, "model": {}}
+
+    def register_tables(self, tables: Iterable[VerticalTable]) -> list[str]:
+        issues: list[str] = []
+        both_kinds: set[str] = set()
+        for table in tables:
+            kind = table.source_kind
+            known = self.labels[kind]
+            other = self.labels["model" if kind == "standard" else "standard"]
+            registered: set[tuple[str, str]] = set()
+            for index, key in enumerate(zip(table.subject_id, table.subject_label)):
+                if key in registered:
+                    continue
+                registered.add(key)
+                curie, label_value = key
+                context = f"{table.source_path}, row {index + 2}"
+                try:
+                    self.prefixes.expand(curie)
+                except ScriptError as exc:
+                    issues.append(f"{context}: {exc}")
+                label = parse_label_literal(label_value)
+                existing = known.setdefault(curie, label)
+                if existing != label:
+                    issues.append(
+                        f"Conflicting labels for {kind} concept '{curie}' in {context}: "
+                        f"existing {existing.n3()} vs new {label.n3()}"
+                    )
+                if curie in other and curie not in both_kinds:
+                    both_kinds.add(curie)
+                    issues.append(
+                        f"Concept '{curie}' is declared as both standard and model."
+                    )
+        return issues
+
+    def reference_issues(self, table: HorizontalTable) -> list[str]:
+        issues: list[str] = []
+        checked: set[tuple[str, str, str]] = set()
+        for index, references in enumerate(
+            zip(
+                zip(table.subject_type, table.subject_id, table.subject_label),
+                zip(table.object_type, table.object_id, table.object_label),
             )
-        return known
+        ):
+            for kind, curie, label_value in references:
+                if (kind, curie, label_value) in checked:
+                    continue
+                checked.add((kind, curie, label_value))
+                context = f"{table.source_path}, row {index + 2}"
+                known = self.labels[kind].get(curie)
+                if known is None:
+                    issues.append(
+                        f"{context}: referenced {kind} concept '{curie}' was not found in the corresponding vertical input file."
+                    )
+                    continue
+                given = parse_label_literal(label_value)
+                if known != given:
+                    issues.append(
+                        f"{context}: label mismatch for {kind} concept '{curie}': "
+                        f"expected {known.n3()} but found {given.n3()}"
+                    )
+        return issues
 
 
 def parse_args() -> argparse.Namespace:
@@ -266,25 +340,45 @@ def parse_args() -> argparse.Namespace:
         default=None,
         help="Path to the output Turtle file. Default: ../inputs/instances.ttl relative to this script.",
     )
+    parser.add_argument(
+        "--output-format",
+        choices=OUTPUT_FORMATS,
+        default="turtle",
+        help=(
+            "Output serialization: 'turtle' builds an rdflib graph and pretty-prints "
+            "it; 'turtle-stream' and 'nt' write each triple as it is produced, "
+            "without building the graph (default: turtle; 'nt' defaults to "
+            "../inputs/instances.nt)."
+        ),
+    )
     parser.add_argument(
         "--delimiter",
         default=";",
         help="CSV delimiter used by the input files (default: ';')",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help=(
+            "Number of worker processes. With more than one, the CSV files, and "
+            "byte ranges of the large ones, are parsed in parallel (default: 1)."
+        ),
+    )
     parser.add_argument(
         "--import-schema",
         action="store_true",
         help="Add owl:imports to the schema ontology IRI.",
     )
-    return parser.parse_args()
+    args = parser.parse_args()
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    return args
 
 
-def digest_token(*parts: str, length: int = 16) -> str:
-    h = hashlib.sha256()
-    for part in parts:
-        h.update(part.encode("utf-8"))
-        h.update(b"\x1f")
-    return h.hexdigest()[:length]
+MAPPING_IRIS = NodeIriMinter(f"{DEMOI}asserted-map-")
+ALIGNMENT_IRIS = NodeIriMinter(f"{DEMOI}asserted-align-")
+POLARITY_TOKENS = {SCHEMA.negative: "neg"}
 
 
 def ordered_pair(
@@ -294,48 +388,239 @@ def ordered_pair(
 
 
 def mapping_uri(source: URIRef, target: URIRef, polarity: URIRef) -> URIRef:
-    pol = "neg" if polarity == SCHEMA.negative else "pos"
-    return DEMOI[f"asserted-map-{digest_token(str(source), str(target), pol)}"]
+    return MAPPING_IRIS.mint(source, target, POLARITY_TOKENS.get(polarity, "pos"))
+
+
+def mapping_uris(keys: Iterable[tuple[URIRef, URIRef, URIRef]]) -> list[URIRef]:
+    return MAPPING_IRIS.mint_many(
+        (source, target, POLARITY_TOKENS.get(polarity, "pos"))
+        for source, target, polarity in keys
+    )
 
 
 def alignment_uri(left: URIRef, right: URIRef) -> URIRef:
-    a, b = (
-        (str(left), str(right)) if str(left) <= str(right) else (str(right), str(left))
+    return alignment_uris([(left, right)])[0]
+
+
+def alignment_uris(pairs: Iterable[tuple[URIRef, URIRef]]) -> list[URIRef]:
+    return ALIGNMENT_IRIS.mint_many(
+        (left, right) if str(left) <= str(right) else (right, left)
+        for left, right in pairs
+    )
+
+
+def csv_columns_from_rows(
+    rows: Iterable[list[str]], width: int
+) -> tuple[list[list[str]], int]:
+    """Transpose CSV rows into one list of stripped values per column.
+
+    Rows are transposed in batches of ``CSV_BATCH_ROWS``, so no per-row dict or
+    object outlives its batch. As with ``csv.DictReader``, blank lines are
+    skipped, missing trailing values read as empty strings and extra values are
+    dropped. Returns the columns and the number of rows.
+    """
+    padding = [""] * width
+    rows = (
+        row if len(row) == width else (row + padding)[:width] for row in rows if row
     )
-    return DEMOI[f"asserted-align-{digest_token(a, b)}"]
+    values: list[list[str]] = [[] for _ in range(width)]
+    row_count = 0
+    while batch := list(islice(rows, CSV_BATCH_ROWS)):
+        for column, batch_values in zip(values, zip(*batch)):
+            column.extend(map(str.strip, batch_values))
+        row_count += len(batch)
+    return values, row_count
 
 
-def read_csv_rows(path: Path, delimiter: str) -> tuple[list[str], list[dict[str, str]]]:
+def read_csv_columns(path: Path, delimiter: str) -> CsvColumns:
     try:
         with path.open("r", encoding="utf-8-sig", newline="") as handle:
-            reader = csv.DictReader(handle, delimiter=delimiter)
-            if reader.fieldnames is None:
+            reader = csv.reader(handle, delimiter=delimiter)
+            header = next(reader, None)
+            if header is None:
                 raise ScriptError(f"CSV file '{path}' is missing a header row.")
-            rows: list[dict[str, str]] = []
-            for row in reader:
-                normalized: dict[str, str] = {}
-                for key, value in row.items():
-                    if key is None:
-                        continue
-                    normalized[key.strip()] = (value or "").strip()
-                rows.append(normalized)
-            return [name.strip() for name in reader.fieldnames], rows
+            fieldnames = [name.strip() for name in header]
+            values, row_count = csv_columns_from_rows(reader, len(fieldnames))
     except FileNotFoundError as exc:
         raise ScriptError(f"File not found: {path}") from exc
+    return CsvColumns(path, fieldnames, dict(zip(fieldnames, values)), row_count)
+
+
+def csv_byte_ranges(
+    path: Path, delimiter: str, chunk_bytes: int
+) -> tuple[list[str], list[tuple[int, int]]] | None:
+    """Split the data rows of a CSV file into byte ranges that end at line breaks.
 
+    Returns the header and the ranges, or None if the file should be read in
+    one piece: it is missing, no larger than ``chunk_bytes``, or its header
+    line holds a quote and may span several lines.
+    """
+    try:
+        size = path.stat().st_size
+    except FileNotFoundError:
+        return None
+    if size <= chunk_bytes:
+        return None
+    with path.open("rb") as handle:
+        header = handle.readline()
+        if b'"' in header:
+            return None
+        fieldnames = [
+            name.strip()
+            for name in next(
+                csv.reader([header.decode("utf-8-sig")], delimiter=delimiter), []
+            )
+        ]
+        offsets = [handle.tell()]
+        while offsets[-1] + chunk_bytes < size:
+            handle.seek(offsets[-1] + chunk_bytes)
+            handle.readline()
+            offsets.append(min(handle.tell(), size))
+        if offsets[-1] < size:
+            offsets.append(size)
+    return fieldnames, list(pairwise(offsets))
+
+
+def read_csv_chunk(
+    path: Path, delimiter: str, start: int, end: int, width: int
+) -> tuple[list[list[str]], int, bool]:
+    """Parse the data rows in bytes ``[start, end)`` of a CSV file.
+
+    Returns the columns, the row count, and whether the chunk may end inside a
+    quoted value, that is, whether its last value holds a line break. In that
+    case the ranges cut a multi-line value and the file is read in one piece.
+    """
+    with path.open("rb") as handle:
+        handle.seek(start)
+        text = handle.read(end - start).decode("utf-8")
+    rows = list(csv.reader(io.StringIO(text, newline=""), delimiter=delimiter))
+    last = rows[-1][-1] if rows and rows[-1] else ""
+    values, row_count = csv_columns_from_rows(rows, width)
+    return values, row_count, "\n" in last or "\r" in last
+
+
+def merge_csv_chunks(
+    path: Path,
+    fieldnames: list[str],
+    chunks: list[tuple[list[list[str]], int, bool]],
+) -> CsvColumns | None:
+    """Concatenate the chunks of ``read_csv_chunk``, or None if one was cut."""
+    if any(cut for _values, _row_count, cut in chunks):
+        return None
+    values: list[list[str]] = [[] for _ in fieldnames]
+    for chunk_values, _row_count, _cut in chunks:
+        for column, chunk_column in zip(values, chunk_values):
+            column.extend(chunk_column)
+    row_count = sum(row_count for _values, row_count, _cut in chunks)
+    return CsvColumns(path, fieldnames, dict(zip(fieldnames, values)), row_count)
+
+
+def read_csv_files(
+    paths: list[Path], delimiter: str, jobs: int = 1
+) -> Iterator[CsvColumns]:
+    """Yield the columns of each CSV file, in the order of ``paths``.
+
+    With more than one job, every file, and every ``CSV_CHUNK_BYTES`` byte
+    range of a larger one, is parsed by a process pool. The results are taken
+    in file and range order, so row numbers, and the errors that cite them,
+    match a sequential read, and a file's read errors surface only once the
+    files before it have been yielded.
+    """
+    if jobs <= 1:
+        for path in paths:
+            yield read_csv_columns(path, delimiter)
+        return
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        try:
+            tasks = []
+            for path in paths:
+                split = csv_byte_ranges(path, delimiter, CSV_CHUNK_BYTES)
+                if split is None:
+                    tasks.append(
+                        (path, None, executor.submit(read_csv_columns, path, delimiter))
+                    )
+                    continue
+                fieldnames, ranges = split
+                chunks = [
+                    executor.submit(
+                        read_csv_chunk, path, delimiter, start, end, len(fieldnames)
+                    )
+                    for start, end in ranges
+                ]
+                tasks.append((path, fieldnames, chunks))
+
+            for path, fieldnames, work in tasks:
+                if fieldnames is None:
+                    yield work.result()
+                    continue
+                merged = merge_csv_chunks(
+                    path, fieldnames, [future.result() for future in work]
+                )
+                yield merged or read_csv_columns(path, delimiter)
+        finally:
+            executor.shutdown(cancel_futures=True)
+
+
+def first_empty(values: list[str]) -> int | None:
+    try:
+        return values.index("")
+    except ValueError:
+        return None
+
+
+def duplicate_rows(keys: list[tuple]) -> list[int]:
+    if len(set(keys)) == len(keys):
+        return []
+    seen: set[tuple] = set()
+    duplicates = []
+    for index, key in enumerate(keys):
+        if key in seen:
+            duplicates.append(index)
+        seen.add(key)
+    return duplicates
+
+
+def first_duplicate(keys: list[tuple]) -> int | None:
+    return next(iter(duplicate_rows(keys)), None)
 
-def load_prefixes(path: Path, delimiter: str) -> PrefixMap:
-    fieldnames, rows = read_csv_rows(path, delimiter)
-    if fieldnames != EXPECTED_PREFIX_COLUMNS:
+
+def raise_issues(issues: list[str]) -> None:
+    """Raise one error listing every issue, or its own message if there is one."""
+    if len(issues) == 1:
+        raise ScriptError(issues[0])
+    if issues:
+        lines = [f"{len(issues)} problems found in the input files:"]
+        lines += [f"- {issue}" for issue in issues[:MAX_REPORTED_ISSUES]]
+        if len(issues) > MAX_REPORTED_ISSUES:
+            lines.append(f"- ... and {len(issues) - MAX_REPORTED_ISSUES} more.")
+        raise ScriptError("\n".join(lines))
+
+
+def raise_first_row_error(path: Path, failures: list[tuple[int, str]]) -> None:
+    """Raise the error of the earliest failing row.
+
+    ``failures`` holds, in the order the checks apply to a row, the index of
+    the first row failing each check and its message. The earliest row wins
+    and, within a row, the earliest check, which is the error a row-by-row
+    validation would have stopped at.
+    """
+    if failures:
+        index, _order, message = min(
+            (index, order, message) for order, (index, message) in enumerate(failures)
+        )
+        raise ScriptError(f"{path.name}, row {index + 2}: {message}")
+
+
+def load_prefixes(table: CsvColumns) -> PrefixMap:
+    if table.fieldnames != EXPECTED_PREFIX_COLUMNS:
         raise ScriptError(
             "prefix.csv must have exactly these columns in this order: "
-            f"{EXPECTED_PREFIX_COLUMNS}. Found: {fieldnames}"
+            f"{EXPECTED_PREFIX_COLUMNS}. Found: {table.fieldnames}"
         )
 
     mapping: dict[str, str] = {}
-    for row in rows:
-        prefix = row.get("prefix", "")
-        url = row.get("url", "")
+    for prefix, url in zip(table.columns["prefix"], table.columns["url"]):
         if not prefix or not url:
             raise ScriptError(
                 "Every prefix.csv row must provide both 'prefix' and 'url'."
@@ -347,127 +632,105 @@ def load_prefixes(path: Path, delimiter: str) -> PrefixMap:
     return PrefixMap(mapping)
 
 
-def load_vertical_rows(
-    path: Path,
-    delimiter: str,
-    source_kind: TypingLiteral["standard", "model"],
-) -> list[VerticalRow]:
-    fieldnames, raw_rows = read_csv_rows(path, delimiter)
-    if fieldnames != EXPECTED_VERTICAL_COLUMNS:
+def load_vertical_table(
+    csv_columns: CsvColumns, source_kind: TypingLiteral["standard", "model"]
+) -> VerticalTable:
+    path = csv_columns.path
+    if csv_columns.fieldnames != EXPECTED_VERTICAL_COLUMNS:
         raise ScriptError(
             f"{path.name} must have exactly these columns in this order: "
-            f"{EXPECTED_VERTICAL_COLUMNS}. Found: {fieldnames}"
+            f"{EXPECTED_VERTICAL_COLUMNS}. Found: {csv_columns.fieldnames}"
         )
+    table = VerticalTable(
+        path.name,
+        source_kind,
+        *(csv_columns.columns[name] for name in EXPECTED_VERTICAL_COLUMNS),
+    )
 
-    rows: list[VerticalRow] = []
-    for row_number, raw in enumerate(raw_rows, start=2):
-        row = VerticalRow(
-            row_number=row_number,
-            source_path=path.name,
-            source_kind=source_kind,
-            subject_id=raw.get("subject_id", ""),
-            subject_label=raw.get("subject_label", ""),
-            predicate_id=raw.get("predicate_id", ""),
-            predicate_modifier=raw.get("predicate_modifier", ""),
-            object_id=raw.get("object_id", ""),
-            object_label=raw.get("object_label", ""),
+    failures: list[tuple[int, str]] = []
+    for name in (
+        "subject_id",
+        "subject_label",
+        "predicate_id",
+        "object_id",
+        "object_label",
+    ):
+        index = first_empty(csv_columns.columns[name])
+        if index is not None:
+            failures.append((index, f"'{name}' is required."))
+    if not set(table.predicate_modifier) <= ALLOWED_EXACT_MEANING_MODIFIERS:
+        index = next(
+            (
+                index
+                for index, (predicate, modifier) in enumerate(
+                    zip(table.predicate_id, table.predicate_modifier)
+                )
+                if predicate == EXACT_MEANING_PREDICATE
+                and modifier not in ALLOWED_EXACT_MEANING_MODIFIERS
+            ),
+            None,
         )
-        if not row.subject_id:
-            raise ScriptError(
-                f"{path.name}, row {row_number}: 'subject_id' is required."
-            )
-        if not row.subject_label:
-            raise ScriptError(
-                f"{path.name}, row {row_number}: 'subject_label' is required."
-            )
-        if not row.predicate_id:
-            raise ScriptError(
-                f"{path.name}, row {row_number}: 'predicate_id' is required."
-            )
-        if not row.object_id:
-            raise ScriptError(
-                f"{path.name}, row {row_number}: 'object_id' is required."
-            )
-        if not row.object_label:
-            raise ScriptError(
-                f"{path.name}, row {row_number}: 'object_label' is required."
-            )
-        if (
-            row.predicate_id == "hriv:hasExactMeaning"
-            and row.predicate_modifier not in {"", "Not"}
-        ):
-            raise ScriptError(
-                f"{path.name}, row {row_number}: unsupported predicate_modifier '{row.predicate_modifier}'. "
+        if index is not None:
+            message = (
+                f"unsupported predicate_modifier '{table.predicate_modifier[index]}'. "
                 "Allowed values for hriv:hasExactMeaning are empty and 'Not'."
             )
-        rows.append(row)
-    return rows
+            failures.append((index, message))
+    raise_first_row_error(path, failures)
+    return table
 
 
-def load_horizontal_rows(path: Path, delimiter: str) -> list[HorizontalRow]:
-    fieldnames, raw_rows = read_csv_rows(path, delimiter)
-    if fieldnames != EXPECTED_HORIZONTAL_COLUMNS:
+def load_horizontal_table(csv_columns: CsvColumns) -> HorizontalTable:
+    path = csv_columns.path
+    if csv_columns.fieldnames != EXPECTED_HORIZONTAL_COLUMNS:
         raise ScriptError(
             f"{path.name} must have exactly these columns in this order: "
-            f"{EXPECTED_HORIZONTAL_COLUMNS}. Found: {fieldnames}"
+            f"{EXPECTED_HORIZONTAL_COLUMNS}. Found: {csv_columns.fieldnames}"
         )
+    table = HorizontalTable(
+        path.name,
+        *(csv_columns.columns[name] for name in EXPECTED_HORIZONTAL_COLUMNS),
+    )
 
-    rows: list[HorizontalRow] = []
-    seen_pairs: set[tuple[tuple[str, str], tuple[str, str]]] = set()
-    for row_number, raw in enumerate(raw_rows, start=2):
-        subject_type = raw.get("subject_type", "")
-        object_type = raw.get("object_type", "")
-        if subject_type not in ALLOWED_HORIZONTAL_TYPES:
-            raise ScriptError(
-                f"{path.name}, row {row_number}: 'subject_type' must be exactly 'standard' or 'model'."
-            )
-        if object_type not in ALLOWED_HORIZONTAL_TYPES:
-            raise ScriptError(
-                f"{path.name}, row {row_number}: 'object_type' must be exactly 'standard' or 'model'."
+    failures: list[tuple[int, str]] = []
+    for name in ("subject_type", "object_type"):
+        values = csv_columns.columns[name]
+        if not set(values) <= ALLOWED_HORIZONTAL_TYPES:
+            index = next(
+                index
+                for index, value in enumerate(values)
+                if value not in ALLOWED_HORIZONTAL_TYPES
             )
-
-        row = HorizontalRow(
-            row_number=row_number,
-            source_path=path.name,
-            subject_type=subject_type,  # type: ignore[arg-type]
-            subject_id=raw.get("subject_id", ""),
-            subject_label=raw.get("subject_label", ""),
-            object_type=object_type,  # type: ignore[arg-type]
-            object_id=raw.get("object_id", ""),
-            object_label=raw.get("object_label", ""),
+            failures.append((index, f"'{name}' must be exactly 'standard' or 'model'."))
+    for name in ("subject_id", "subject_label", "object_id", "object_label"):
+        index = first_empty(csv_columns.columns[name])
+        if index is not None:
+            failures.append((index, f"'{name}' is required."))
+
+    subjects = list(zip(table.subject_type, table.subject_id))
+    objects = list(zip(table.object_type, table.object_id))
+    index = next(
+        (
+            index
+            for index, pair in enumerate(zip(subjects, objects))
+            if pair[0] == pair[1]
+        ),
+        None,
+    )
+    if index is not None:
+        failures.append(
+            (index, "aligns is irreflexive, so subject and object must differ.")
         )
-        if not row.subject_id:
-            raise ScriptError(
-                f"{path.name}, row {row_number}: 'subject_id' is required."
-            )
-        if not row.subject_label:
-            raise ScriptError(
-                f"{path.name}, row {row_number}: 'subject_label' is required."
-            )
-        if not row.object_id:
-            raise ScriptError(
-                f"{path.name}, row {row_number}: 'object_id' is required."
-            )
-        if not row.object_label:
-            raise ScriptError(
-                f"{path.name}, row {row_number}: 'object_label' is required."
-            )
-        if row.subject_id == row.object_id and row.subject_type == row.object_type:
-            raise ScriptError(
-                f"{path.name}, row {row_number}: aligns is irreflexive, so subject and object must differ."
-            )
-
-        pair = ordered_pair(
-            (row.subject_type, row.subject_id), (row.object_type, row.object_id)
+    pairs = list(map(ordered_pair, subjects, objects))
+    index = first_duplicate(pairs)
+    if index is not None:
+        message = (
+            "duplicate horizontal aligns pair detected "
+            f"for {pairs[index][0]} and {pairs[index][1]}."
         )
-        if pair in seen_pairs:
-            raise ScriptError(
-                f"{path.name}, row {row_number}: duplicate horizontal aligns pair detected "
-                f"for {pair[0]} and {pair[1]}."
-            )
-        seen_pairs.add(pair)
-        rows.append(row)
-    return rows
+        failures.append((index, message))
+    raise_first_row_error(path, failures)
+    return table
 
 
 def parse_label_literal(value: str) -> Literal:
@@ -497,12 +760,100 @@ def artifact_uri(kind: TypingLiteral["standard", "model"], prefix: str) -> URIRe
     return DEMOI[f"{stem}-{slugify(prefix)}"]
 
 
-def add_label(graph: Graph, subject: URIRef, label_value: str) -> None:
+def nt_term(term: Node) -> str:
+    if isinstance(term, Literal):
+        lexical = (
+            str(term)
+            .replace("\\", "\\\\")
+            .replace('"', '\\"')
+            .replace("\n", "\\n")
+            .replace("\r", "\\r")
+        )
+        if term.language:
+            return f'"{lexical}"@{term.language}'
+        if term.datatype is not None:
+            return f'"{lexical}"^^<{term.datatype}>'
+        return f'"{lexical}"'
+    return term.n3()
+
+
+class TripleWriter:
+    """Writes triples to an N-Triples or Turtle file as they are produced.
+
+    Stands in for the rdflib Graph of ``build_graph``, so the instance graph is
+    never held in memory. ``add`` and ``set`` remember what they wrote and skip
+    repeats: the builder re-adds the concept, artifact and label triples for
+    every row that mentions a concept, and this set grows with the number of
+    concepts rather than rows. ``addN`` writes the Mapping and Alignment node
+    triples unchecked, as each node is added once. In Turtle, consecutive
+    triples about the same subject share one block and IRIs are shortened with
+    the given namespaces.
+    """
+
+    def __init__(
+        self, handle: TextIO, output_format: str, namespaces: dict[str, str]
+    ) -> None:
+        self.handle = handle
+        self.turtle = output_format == "turtle-stream"
+        self.written: set[tuple[Node, Node, Node]] = set()
+        self.subject: Node | None = None
+        self.prefixes = {namespace: prefix for prefix, namespace in namespaces.items()}
+        if self.turtle:
+            handle.writelines(
+                f"@prefix {prefix}: <{namespace}> .\n"
+                for prefix, namespace in namespaces.items()
+            )
+
+    def term(self, node: Node) -> str:
+        if self.turtle and isinstance(node, URIRef):
+            split = max(node.rfind("/"), node.rfind("#")) + 1
+            prefix = self.prefixes.get(node[:split])
+            if prefix is not None and TURTLE_LOCAL_NAME.fullmatch(node, split):
+                return f"{prefix}:{node[split:]}"
+        return nt_term(node)
+
+    def write(self, subject: Node, predicate: Node, obj: Node) -> None:
+        if not self.turtle:
+            self.handle.write(
+                f"{nt_term(subject)} {nt_term(predicate)} {nt_term(obj)} .\n"
+            )
+        elif subject == self.subject:
+            self.handle.write(f" ;\n    {self.term(predicate)} {self.term(obj)}")
+        else:
+            if self.subject is not None:
+                self.handle.write(" .\n")
+            self.handle.write(
+                f"\n{self.term(subject)}\n    {self.term(predicate)} {self.term(obj)}"
+            )
+            self.subject = subject
+
+    def add(self, triple: tuple[Node, Node, Node]) -> None:
+        if triple not in self.written:
+            self.written.add(triple)
+            self.write(*triple)
+
+    def set(self, triple: tuple[Node, Node, Node]) -> None:
+        # The builder only ever sets one value per subject and predicate.
+        self.add(triple)
+
+    def addN(self, quads: Iterable[tuple[Node, Node, Node, object]]) -> None:
+        for subject, predicate, obj, _context in quads:
+            self.write(subject, predicate, obj)
+
+    def close(self) -> None:
+        if self.turtle and self.subject is not None:
+            self.handle.write(" .\n")
+
+
+TripleSink = Graph | TripleWriter
+
+
+def add_label(graph: TripleSink, subject: URIRef, label_value: str) -> None:
     graph.add((subject, RDFS.label, parse_label_literal(label_value)))
 
 
 def ensure_artifact(
-    graph: Graph, kind: TypingLiteral["standard", "model"], prefix: str
+    graph: TripleSink, kind: TypingLiteral["standard", "model"], prefix: str
 ) -> URIRef:
     artifact = artifact_uri(kind, prefix)
     if kind == "standard":
@@ -515,7 +866,7 @@ def ensure_artifact(
 
 
 def ensure_representation_concept(
-    graph: Graph,
+    graph: TripleSink,
     prefixes: PrefixMap,
     kind: TypingLiteral["standard", "model"],
     curie: str,
@@ -539,7 +890,7 @@ def ensure_representation_concept(
 
 
 def ensure_ontology_concept(
-    graph: Graph,
+    graph: TripleSink,
     prefixes: PrefixMap,
     curie: str,
     label_value: str | None,
@@ -551,45 +902,28 @@ def ensure_ontology_concept(
     return concept
 
 
-def validate_vertical_duplicates(rows: Iterable[VerticalRow]) -> None:
-    seen: set[tuple[str, str, str, str, str, str, str]] = set()
-    for row in rows:
-        key = (
-            row.source_kind,
-            row.subject_id,
-            row.subject_label,
-            row.predicate_id,
-            row.predicate_modifier,
-            row.object_id,
-            row.object_label,
-        )
-        if key in seen:
-            raise ScriptError(
-                f"Duplicate semantic row detected: {row.source_path}, row {row.row_number}."
+def vertical_duplicate_issues(tables: Iterable[VerticalTable]) -> list[str]:
+    return [
+        f"Duplicate semantic row detected: {table.source_path}, row {index + 2}."
+        for table in tables
+        for index in duplicate_rows(
+            list(
+                zip(
+                    table.subject_id,
+                    table.subject_label,
+                    table.predicate_id,
+                    table.predicate_modifier,
+                    table.object_id,
+                    table.object_label,
+                )
             )
-        seen.add(key)
-
-
-def register_known_concepts(
-    registry: ConceptRegistry, rows: Iterable[VerticalRow]
-) -> None:
-    for row in rows:
-        registry.register(
-            kind=row.source_kind,
-            curie=row.subject_id,
-            label_value=row.subject_label,
-            context=f"{row.source_path}, row {row.row_number}",
         )
+    ]
 
 
-def add_exact_meaning_row(graph: Graph, row: VerticalRow, prefixes: PrefixMap) -> None:
-    source = ensure_representation_concept(
-        graph, prefixes, row.source_kind, row.subject_id, row.subject_label
-    )
-    target = ensure_ontology_concept(graph, prefixes, row.object_id, row.object_label)
-    polarity = SCHEMA.negative if row.predicate_modifier == "Not" else SCHEMA.positive
-    mapping = mapping_uri(source, target, polarity)
-
+def add_mapping_nodes(
+    graph: TripleSink, keys: list[tuple[URIRef, URIRef, URIRef]]
+) -> None:
     # IMPORTANT MODELING DECISION
     # ---------------------------
     # We intentionally do NOT emit a direct triple:
@@ -607,108 +941,192 @@ def add_exact_meaning_row(graph: Graph, row: VerticalRow, prefixes: PrefixMap) -
     # - polarity is stored explicitly with demo:hasPolarity;
     # - consumers must use the Mapping instance, not expect direct
     #   hriv:hasExactMeaning triples in the output.
-    graph.add((mapping, RDF.type, SCHEMA.Mapping))
-    graph.add((mapping, SCHEMA.source, source))
-    graph.add((mapping, SCHEMA.target, target))
-    graph.add((mapping, SCHEMA.hasMappingSource, source))
-    graph.add((mapping, SCHEMA.hasTargetOntologyConcept, target))
-    graph.add((mapping, SCHEMA.hasPolarity, polarity))
-    graph.add((mapping, SCHEMA.hasProvenance, SCHEMA.asserted))
 
-
-def add_asserted_alignment(
-    graph: Graph,
-    prefixes: PrefixMap,
-    subject_type: TypingLiteral["standard", "model"],
-    subject_id: str,
-    subject_label: str,
-    object_type: TypingLiteral["standard", "model"],
-    object_id: str,
-    object_label: str,
-) -> None:
-    left = ensure_representation_concept(
-        graph, prefixes, subject_type, subject_id, subject_label
+    # Rows that differ only in their labels share a Mapping node.
+    nodes = dict(zip(mapping_uris(keys), keys))
+    graph.addN(
+        quad
+        for mapping, (source, target, polarity) in nodes.items()
+        for quad in (
+            (mapping, RDF.type, SCHEMA.Mapping, graph),
+            (mapping, SCHEMA.source, source, graph),
+            (mapping, SCHEMA.target, target, graph),
+            (mapping, SCHEMA.hasMappingSource, source, graph),
+            (mapping, SCHEMA.hasTargetOntologyConcept, target, graph),
+            (mapping, SCHEMA.hasPolarity, polarity, graph),
+            (mapping, SCHEMA.hasProvenance, SCHEMA.asserted, graph),
+        )
     )
-    right = ensure_representation_concept(
-        graph, prefixes, object_type, object_id, object_label
+
+
+def add_alignment_nodes(graph: TripleSink, pairs: list[tuple[URIRef, URIRef]]) -> None:
+    nodes = dict(zip(alignment_uris(pairs), pairs))
+    graph.addN(
+        quad
+        for node, (left, right) in nodes.items()
+        for quad in (
+            (node, RDF.type, SCHEMA.Alignment, graph),
+            (node, SCHEMA.source, left, graph),
+            (node, SCHEMA.target, right, graph),
+            (node, SCHEMA.hasAlignmentSource, left, graph),
+            (node, SCHEMA.hasAlignmentTarget, right, graph),
+            (node, SCHEMA.hasProvenance, SCHEMA.asserted, graph),
+            (left, SCHEMA.aligns, right, graph),
+            (right, SCHEMA.aligns, left, graph),
+        )
     )
-    if left == right:
-        raise ScriptError("aligns is irreflexive, so subject and object must differ.")
 
-    node = alignment_uri(left, right)
-    graph.add((node, RDF.type, SCHEMA.Alignment))
-    graph.add((node, SCHEMA.source, left))
-    graph.add((node, SCHEMA.target, right))
-    graph.add((node, SCHEMA.hasAlignmentSource, left))
-    graph.add((node, SCHEMA.hasAlignmentTarget, right))
-    graph.add((node, SCHEMA.hasProvenance, SCHEMA.asserted))
 
-    graph.add((left, SCHEMA.aligns, right))
-    graph.add((right, SCHEMA.aligns, left))
+def add_vertical_table(
+    graph: TripleSink, table: VerticalTable, prefixes: PrefixMap
+) -> Counter[str]:
+    """Add the concepts and exact-meaning Mappings of one vertical table.
+
+    Every distinct concept is added once instead of once per row, and the
+    Mapping nodes of all exact-meaning rows are minted and added in one batch.
+    Returns the count of the skipped non-exact predicates.
+    """
+    sources = {
+        key: ensure_representation_concept(graph, prefixes, table.source_kind, *key)
+        for key in dict.fromkeys(zip(table.subject_id, table.subject_label))
+    }
+    targets: dict[tuple[str, str], URIRef] = {}
+    keys: list[tuple[URIRef, URIRef, URIRef]] = []
+    skipped_predicates: Counter[str] = Counter()
+    for source_key, predicate, modifier, target_key in zip(
+        zip(table.subject_id, table.subject_label),
+        table.predicate_id,
+        table.predicate_modifier,
+        zip(table.object_id, table.object_label),
+    ):
+        if predicate != EXACT_MEANING_PREDICATE:
+            skipped_predicates[predicate] += 1
+            continue
+        target = targets.get(target_key)
+        if target is None:
+            target = targets[target_key] = ensure_ontology_concept(
+                graph, prefixes, *target_key
+            )
+        polarity = SCHEMA.negative if modifier == "Not" else SCHEMA.positive
+        keys.append((sources[source_key], target, polarity))
+    add_mapping_nodes(graph, keys)
+    return skipped_predicates
 
 
-def build_graph(
-    vertical_rows: list[VerticalRow],
-    horizontal_rows: list[HorizontalRow],
+def add_horizontal_table(
+    graph: TripleSink, table: HorizontalTable, prefixes: PrefixMap
+) -> None:
+    """Add the asserted alignments of the horizontal table.
+
+    Each distinct concept reference is added once; the Alignment nodes of all
+    rows are minted and added in one batch.
+    """
+    concepts: dict[tuple[str, str, str], URIRef] = {}
+    pairs: list[tuple[URIRef, URIRef]] = []
+    for references in zip(
+        zip(table.subject_type, table.subject_id, table.subject_label),
+        zip(table.object_type, table.object_id, table.object_label),
+    ):
+        for reference in references:
+            if reference not in concepts:
+                concepts[reference] = ensure_representation_concept(
+                    graph, prefixes, *reference
+                )
+        left, right = concepts[references[0]], concepts[references[1]]
+        if left == right:
+            raise ScriptError(
+                "aligns is irreflexive, so subject and object must differ."
+            )
+        pairs.append((left, right))
+    add_alignment_nodes(graph, pairs)
+
+
+def instance_namespaces(prefixes: PrefixMap) -> list[tuple[str, str]]:
+    """The namespace bindings of the instance file, in binding order."""
+    return [
+        ("demo", str(SCHEMA)),
+        ("hriv", str(HRIV)),
+        ("demoi", str(DEMOI)),
+        ("owl", str(OWL)),
+        ("rdf", str(RDF)),
+        ("rdfs", str(RDFS)),
+        ("xsd", str(XSD)),
+        *prefixes.mapping.items(),
+    ]
+
+
+def build_instances(
+    graph: TripleSink,
+    vertical_tables: list[VerticalTable],
+    horizontal_table: HorizontalTable,
     prefixes: PrefixMap,
     import_schema: bool = False,
-) -> tuple[Graph, Counter[str]]:
-    graph = Graph()
-    graph.bind("demo", SCHEMA)
-    graph.bind("hriv", HRIV)
-    graph.bind("demoi", DEMOI)
-    graph.bind("owl", OWL)
-    graph.bind("rdf", RDF)
-    graph.bind("rdfs", RDFS)
-    graph.bind("xsd", XSD)
-    for prefix, url in prefixes.mapping.items():
-        graph.bind(prefix, Namespace(url))
-
+) -> Counter[str]:
     graph.add((INSTANCES_ONTOLOGY_IRI, RDF.type, OWL.Ontology))
     if import_schema:
         graph.add((INSTANCES_ONTOLOGY_IRI, OWL.imports, SCHEMA_ONTOLOGY_IRI))
 
-    validate_vertical_duplicates(vertical_rows)
     registry = ConceptRegistry(prefixes)
-    register_known_concepts(registry, vertical_rows)
+    raise_issues(
+        [
+            *vertical_duplicate_issues(vertical_tables),
+            *registry.register_tables(vertical_tables),
+            *registry.reference_issues(horizontal_table),
+        ]
+    )
 
     skipped_predicates: Counter[str] = Counter()
-    for row in vertical_rows:
-        if row.predicate_id == "hriv:hasExactMeaning":
-            add_exact_meaning_row(graph, row, prefixes)
-        else:
-            ensure_representation_concept(
-                graph, prefixes, row.source_kind, row.subject_id, row.subject_label
-            )
-            skipped_predicates[row.predicate_id] += 1
-
-    for row in horizontal_rows:
-        registry.require(
-            row.subject_type,
-            row.subject_id,
-            row.subject_label,
-            f"{row.source_path}, row {row.row_number}",
-        )
-        registry.require(
-            row.object_type,
-            row.object_id,
-            row.object_label,
-            f"{row.source_path}, row {row.row_number}",
-        )
-        add_asserted_alignment(
-            graph,
-            prefixes,
-            row.subject_type,
-            row.subject_id,
-            row.subject_label,
-            row.object_type,
-            row.object_id,
-            row.object_label,
-        )
+    for table in vertical_tables:
+        skipped_predicates += add_vertical_table(graph, table, prefixes)
+    add_horizontal_table(graph, horizontal_table, prefixes)
+    return skipped_predicates
 
+
+def build_graph(
+    vertical_tables: list[VerticalTable],
+    horizontal_table: HorizontalTable,
+    prefixes: PrefixMap,
+    import_schema: bool = False,
+) -> tuple[Graph, Counter[str]]:
+    graph = Graph()
+    for prefix, url in instance_namespaces(prefixes):
+        graph.bind(prefix, Namespace(url))
+    skipped_predicates = build_instances(
+        graph, vertical_tables, horizontal_table, prefixes, import_schema
+    )
     return graph, skipped_predicates
 
 
+def write_instances(
+    path: Path,
+    output_format: str,
+    vertical_tables: list[VerticalTable],
+    horizontal_table: HorizontalTable,
+    prefixes: PrefixMap,
+    import_schema: bool = False,
+) -> Counter[str]:
+    """Stream the instance triples to ``path`` without building a Graph.
+
+    The triples go to a ``.partial`` file that replaces ``path`` only once
+    every row was added, so a data error leaves no truncated output behind.
+    """
+    partial = path.with_suffix(path.suffix + ".partial")
+    try:
+        with partial.open("w", encoding="utf-8", newline="\n") as handle:
+            writer = TripleWriter(
+                handle, output_format, dict(instance_namespaces(prefixes))
+            )
+            skipped_predicates = build_instances(
+                writer, vertical_tables, horizontal_table, prefixes, import_schema
+            )
+            writer.close()
+    except BaseException:
+        partial.unlink(missing_ok=True)
+        raise
+    partial.replace(path)
+    return skipped_predicates
+
+
 def main() -> int:
     args = parse_args()
 
@@ -738,32 +1156,53 @@ def main() -> int:
     output_path = (
         Path(args.output).expanduser().resolve()
         if args.output
-        else (input_dir / "instances.ttl").resolve()
+        else (
+            input_dir
+            / ("instances.nt" if args.output_format == "nt" else "instances.ttl")
+        ).resolve()
     )
 
-    prefixes = load_prefixes(prefix_path, args.delimiter)
-    standard_rows = load_vertical_rows(standard_input_path, args.delimiter, "standard")
-    model_rows = load_vertical_rows(model_input_path, args.delimiter, "model")
-    horizontal_rows = load_horizontal_rows(horizontal_input_path, args.delimiter)
+    # Closing the reader also stops its worker processes when a loader
+    # raises, instead of leaving the pool to garbage collection.
+    with closing(
+        read_csv_files(
+            [prefix_path, standard_input_path, model_input_path, horizontal_input_path],
+            args.delimiter,
+            args.jobs,
+        )
+    ) as csv_files:
+        prefixes = load_prefixes(next(csv_files))
+        standard_table = load_vertical_table(next(csv_files), "standard")
+        model_table = load_vertical_table(next(csv_files), "model")
+        horizontal_table = load_horizontal_table(next(csv_files))
 
-    graph, skipped_predicates = build_graph(
-        vertical_rows=[*standard_rows, *model_rows],
-        horizontal_rows=horizontal_rows,
-        prefixes=prefixes,
-        import_schema=args.import_schema,
-    )
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    graph.serialize(destination=output_path, format="turtle")
+    if args.output_format == "turtle":
+        graph, skipped_predicates = build_graph(
+            vertical_tables=[standard_table, model_table],
+            horizontal_table=horizontal_table,
+            prefixes=prefixes,
+            import_schema=args.import_schema,
+        )
+        graph.serialize(destination=output_path, format="turtle")
+    else:
+        skipped_predicates = write_instances(
+            output_path,
+            args.output_format,
+            vertical_tables=[standard_table, model_table],
+            horizontal_table=horizontal_table,
+            prefixes=prefixes,
+            import_schema=args.import_schema,
+        )
 
     exact_rows = sum(
-        1
-        for row in [*standard_rows, *model_rows]
-        if row.predicate_id == "hriv:hasExactMeaning"
+        table.predicate_id.count(EXACT_MEANING_PREDICATE)
+        for table in (standard_table, model_table)
     )
     print(f"Wrote {output_path}")
-    print(f"Standard rows: {len(standard_rows)}")
-    print(f"Model rows: {len(model_rows)}")
-    print(f"Horizontal rows: {len(horizontal_rows)}")
+    print(f"Standard rows: {len(standard_table)}")
+    print(f"Model rows: {len(model_table)}")
+    print(f"Horizontal rows: {len(horizontal_table)}")
     print(f"Exact-meaning rows materialized: {exact_rows}")
     print(f"Vertical non-exact rows skipped: {sum(skipped_predicates.values())}")
     if skipped_predicates:
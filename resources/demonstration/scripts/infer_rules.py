@@ -42,12 +42,31 @@ Implementation choices grounded in the current model notes:
   matching the current generator output.
 - ``R5a`` requires ontology hierarchy triples. These can be supplied with one or
   more ``--ontology-input`` files and are used for reasoning only; they are not
-  copied into the output file.
+  copied into the output file. Only their ``rdfs:subClassOf`` edges are read,
+  and these are cached in a binary snapshot keyed by the SHA-256 of the file,
+  so an unchanged ontology is not parsed again on the next run. Only the
+  latest snapshot of each file is kept, and a cache folder that cannot be
+  written is reported and skipped.
 - Because ``R4b`` and ``R5b`` are stratified, final horizontal classifications
   are recomputed from the current exact-meaning closure before materialization.
+- Only ``R2``, ``R1a`` and ``R6`` feed back into the exact-meaning closure. They
+  are saturated first with semi-naive evaluation, where each round only
+  processes the mapping keys and aligned pairs added in the previous round;
+  the remaining rules are then derived once from the saturated closure.
+- No rule relates terms that are not connected through exact meanings,
+  alignments, seed relations or the ontology hierarchy. With ``--jobs`` above
+  one, these connected components are grouped into shards that are evaluated
+  in worker processes. Mapped targets that are ancestors of other mapped
+  targets join their components, so inputs such as the demo keep most of
+  their mappings in one large shard and gain little from it.
 - ``mayAlignCandidate`` and ``partiallyAlignsCandidate`` are auxiliary and are
   not materialized to the output graph.
+- The rule engine interns every RDF term into a dense integer id
+  (``TermDictionary``) when the assertions are loaded and evaluates all rules
+  over ids; terms are decoded again only when the output graph is written.
 - ``rdfs:subClassOf`` is evaluated transitively when checking ontology relatedness.
+  The closure is precomputed once per run in a ``HierarchyIndex`` so that R5a
+  does not re-walk the hierarchy for every pair of exact meanings.
 - The XML notes state that final horizontal classifications are de facto
   disjoint. This script therefore fails by default when more than one final
   horizontal relation holds for the same pair. Use
@@ -62,32 +81,106 @@ Implementation choices grounded in the current model notes:
   reasoner with those direct horizontal facts.
 
 The script rewrites direct horizontal relation triples so that stale
-materialization from older runs is removed. Asserted Mapping and Alignment owned
-elements are preserved; inferred owned elements are regenerated.
+materialization from older runs is removed. Asserted Mapping and Alignment
+owned elements are preserved; inferred owned elements are regenerated.
+
+The output graph is built in a single pass: input triples are copied unless
+they are stale materialization, and the recomputed triples are added, instead
+of removing triples from the parsed input graph one at a time. With
+``--output-format turtle-stream`` or ``nt`` the graph is written to disk one
+subject at a time, in a deterministic order, instead of building the whole
+document in memory.
+
+Each run is instrumented with an ``Instrumentation`` recorder: parsing, the
+hierarchy, every rule, each fixpoint round of the closure, building the output
+graph and serialization are timed together with the peak RSS. Use
+``--metrics-output`` to write these records and the counters as JSON, or pass
+an ``Instrumentation`` with a callback to ``infer`` when calling it from code.
+
+``--input`` may be repeated or name a directory. Several instance files are
+parsed one after the other and reasoned over as one graph; with
+``--split-output`` the result is written back as one file per input, each
+subject going to the first input that describes it. Loading is sequential by
+design: rdflib parses in Python under the GIL, and parsing the files in worker
+processes adds the cost of sending every triple back to the main process.
+
+With ``--explain-output`` an ``ExplanationIndex`` traces every R7/R8
+inconsistency and horizontal conflict (and, with ``--explain-all``, every
+inferred fact) to the rule and premises that produce it, and writes them as
+JSON Lines. It indexes the saturated exact meanings and the aligns edges
+after the run instead of recording derivations while the rules run, so its
+memory stays proportional to the result.
+
+With ``--serve`` the script runs the full inference once and then keeps the
+graph and the hierarchy in memory behind a local HTTP endpoint
+(``InferenceService``); each posted change is applied as an incremental run.
+
+In incremental mode (``--add-assertions`` / ``--remove-assertions``) the input
+is a previous inference output. The changes are applied to it and only the
+connected components that contain a changed concept or target are recomputed
+and rewritten; rule counters and conflicts then cover those components only.
+The ontology support files must be the ones used for the previous run.
 """
 
 from __future__ import annotations
 
 import argparse
 import hashlib
+import json
+import os
+import re
+import struct
 import sys
+import tempfile
+import time
+import zlib
+from array import array
 from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, HTTPServer
 from pathlib import Path
-from typing import Iterable
+from typing import Callable, Iterable, Iterator
+from urllib.parse import parse_qs, urlsplit
+
+try:
+    import resource
+except ImportError:  # Not available on Windows; peak RSS is then not reported.
+    resource = None
 
 from rdflib import Graph, Literal, Namespace, URIRef
+from rdflib.events import Dispatcher
 from rdflib.namespace import OWL, RDF, RDFS, XSD
+from rdflib.plugins.stores.memory import Memory
+from rdflib.store import TripleAddedEvent
+from rdflib.term import Node
+
+from node_iris import NodeIriMinter
 
 DEMO = Namespace("https://w3id.org/health-ri/semantic-interoperability/schema/")
 DEMOI = Namespace("https://example.org/health-ri/demo-instance/")
 
+# Conservative subset of Turtle's PN_LOCAL that never needs escaping.
+TURTLE_LOCAL_NAME = re.compile(r"[A-Za-z_][A-Za-z0-9_-]*")
+
+# Bump the trailing version when the hierarchy snapshot layout changes.
+HIERARCHY_SNAPSHOT_MAGIC = b"HRIHIER1"
+# Files picked up from an --input directory.
+INSTANCE_FILE_SUFFIXES = (".ttl", ".nt")
+
 HORIZONTAL_PREDS = {
     "aligns": DEMO.aligns,
     "cannotAlign": DEMO.cannotAlign,
     "mayAlign": DEMO.mayAlign,
     "partiallyAligns": DEMO.partiallyAligns,
 }
+# Sorted relation names for each combination of membership bits, where bit i
+# stands for the i-th relation of HORIZONTAL_PREDS.
+HORIZONTAL_RELATION_SETS = tuple(
+    tuple(sorted(name for bit, name in enumerate(HORIZONTAL_PREDS) if mask >> bit & 1))
+    for mask in range(1 << len(HORIZONTAL_PREDS))
+)
 
 MAPPING_SOURCE_PREDS = (
     DEMO.hasMappingSource,
@@ -159,21 +252,22 @@ class HorizontalConflict:
 
 @dataclass(frozen=True)
 class InferenceResult:
-    mapping_keys: set[tuple[URIRef, URIRef, URIRef]]
-    inferred_mapping_keys: set[tuple[URIRef, URIRef, URIRef]]
-    aligns: set[tuple[URIRef, URIRef]]
-    cannot_align: set[tuple[URIRef, URIRef]]
-    may_align: set[tuple[URIRef, URIRef]]
-    partially_aligns: set[tuple[URIRef, URIRef]]
-    inferred_aligns_r2: set[tuple[URIRef, URIRef]]
-    inferred_aligns_r1a: set[tuple[URIRef, URIRef]]
-    inferred_cannot_align: set[tuple[URIRef, URIRef]]
-    may_candidates: set[tuple[URIRef, URIRef]]
-    inferred_may_align: set[tuple[URIRef, URIRef]]
-    partial_candidates: set[tuple[URIRef, URIRef]]
-    inferred_partially_aligns: set[tuple[URIRef, URIRef]]
-    inconsistent_r7: set[URIRef]
-    inconsistent_r8: set[URIRef]
+    terms: TermDictionary
+    mapping_keys: set[tuple[int, int, int]]
+    inferred_mapping_keys: set[tuple[int, int, int]]
+    aligns: AlignmentComponents
+    cannot_align: set[tuple[int, int]]
+    may_align: set[tuple[int, int]]
+    partially_aligns: set[tuple[int, int]]
+    inferred_aligns_r2: set[tuple[int, int]]
+    inferred_aligns_r1a_count: int
+    inferred_cannot_align: set[tuple[int, int]]
+    may_candidates: set[tuple[int, int]]
+    inferred_may_align: set[tuple[int, int]]
+    partial_candidates: set[tuple[int, int]]
+    inferred_partially_aligns: set[tuple[int, int]]
+    inconsistent_r7: set[int]
+    inconsistent_r8: set[int]
     conflicts: list[HorizontalConflict]
 
 
@@ -183,14 +277,100 @@ class CleanupSummary:
     removed_duplicate_alignment_nodes: int = 0
 
 
-def parse_args() -> argparse.Namespace:
+@dataclass(frozen=True)
+class RuleInput:
+    """Interned input of the rule engine, or of one independent shard of it."""
+
+    mapping_keys: set[tuple[int, int, int]]
+    asserted_aligns: set[tuple[int, int]]
+    seed_cannot: set[tuple[int, int]]
+    seed_may: set[tuple[int, int]]
+    seed_partial: set[tuple[int, int]]
+    ancestors: dict[int, frozenset[int]]
+    positive: int
+    negative: int
+
+
+def peak_rss_mib() -> float | None:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and in kilobytes elsewhere.
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+class Instrumentation:
+    """Record phase timings, fixpoint rounds and counters of one run.
+
+    Every record is a plain dict that is appended to ``records`` and passed to
+    ``callback`` when one is given, so callers can stream the records or dump
+    them as JSON at the end of the run. Nested phases are named by their path,
+    for example ``infer/rules/R5a``.
+    """
+
+    def __init__(self, callback: Callable[[dict[str, object]], None] | None = None):
+        self.callback = callback
+        self.records: list[dict[str, object]] = []
+        self.stack: list[str] = []
+
+    def emit(self, record: dict[str, object]) -> None:
+        self.records.append(record)
+        if self.callback is not None:
+            self.callback(record)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        self.stack.append(name)
+        path = "/".join(self.stack)
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stack.pop()
+            self.emit(
+                {
+                    "kind": "phase",
+                    "phase": path,
+                    "seconds": round(time.perf_counter() - started, 6),
+                    "peak_rss_mib": peak_rss_mib(),
+                }
+            )
+
+    def round(self, number: int, **sizes: int) -> None:
+        self.emit(
+            {"kind": "round", "phase": "/".join(self.stack), "round": number, **sizes}
+        )
+
+    def replay(self, records: Iterable[dict[str, object]]) -> None:
+        """Re-emit records of a worker process below the current phase."""
+        for record in records:
+            self.emit(
+                {**record, "phase": "/".join([*self.stack, str(record["phase"])])}
+            )
+
+    def write_json(self, path: Path, counters: dict[str, int]) -> None:
+        payload = {
+            "phases": [item for item in self.records if item["kind"] == "phase"],
+            "rounds": [item for item in self.records if item["kind"] == "round"],
+            "counters": dict(sorted(counters.items())),
+        }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+
+
+def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="Infer rule-based knowledge into instances.ttl"
     )
     parser.add_argument(
         "--input",
-        default=None,
-        help="Input Turtle file. Default: ../inputs/instances.ttl relative to this script.",
+        action="append",
+        default=[],
+        help=(
+            "Input Turtle file, or a directory whose .ttl and .nt files are all read. "
+            "May be repeated; the files are reasoned over as one graph. "
+            "Default: ../inputs/instances.ttl relative to this script."
+        ),
     )
     parser.add_argument(
         "--ontology-input",
@@ -203,11 +383,43 @@ def parse_args() -> argparse.Namespace:
             "'health-ri-ontology.ttl' from the same folder as this script when available."
         ),
     )
+    parser.add_argument(
+        "--hierarchy-cache-dir",
+        default=None,
+        help=(
+            "Folder for rdfs:subClassOf snapshots of the ontology inputs, keyed by "
+            "file hash. Default: ../.cache/hierarchy relative to this script."
+        ),
+    )
+    parser.add_argument(
+        "--no-hierarchy-cache",
+        action="store_true",
+        help="Always parse the ontology inputs and do not read or write snapshots.",
+    )
     parser.add_argument(
         "--output",
         default=None,
         help="Output Turtle file (default: <input>_extended.ttl)",
     )
+    parser.add_argument(
+        "--split-output",
+        action="store_true",
+        help=(
+            "Write one output file per input file instead of one merged graph. "
+            "--output then names a directory. Default: an 'extended' directory next "
+            "to each input, or the input files themselves in incremental mode."
+        ),
+    )
+    parser.add_argument(
+        "--output-format",
+        choices=("turtle", "turtle-stream", "nt"),
+        default="turtle",
+        help=(
+            "Output serialization: 'turtle' is pretty-printed by rdflib, "
+            "'turtle-stream' writes Turtle one subject at a time and 'nt' writes "
+            "sorted N-Triples (default: turtle; 'nt' defaults to <input>_extended.nt)."
+        ),
+    )
     parser.add_argument(
         "--fail-on-horizontal-conflicts",
         action="store_true",
@@ -237,39 +449,101 @@ def parse_args() -> argparse.Namespace:
             "(R7 concepts, R8 concepts, and horizontal conflict pairs)."
         ),
     )
-    return parser.parse_args()
+    parser.add_argument(
+        "--metrics-output",
+        default=None,
+        help=(
+            "Write phase timings, peak RSS, fixpoint round sizes and the "
+            "inference counters to this JSON file."
+        ),
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help=(
+            "Number of worker processes. With more than one, the mapping graph is "
+            "split into independent components that are evaluated in parallel "
+            "(default: 1)."
+        ),
+    )
+    parser.add_argument(
+        "--explain-output",
+        default=None,
+        help=(
+            "Write a JSON Lines file with the rule and premises behind every R7/R8 "
+            "inconsistency and horizontal conflict. Also adds the premises to "
+            "--print-inconsistencies."
+        ),
+    )
+    parser.add_argument(
+        "--explain-all",
+        action="store_true",
+        help="With --explain-output, also explain every inferred edge and exact meaning.",
+    )
+    parser.add_argument(
+        "--serve",
+        default=None,
+        metavar="[HOST:]PORT",
+        help=(
+            "Run the initial inference, then keep the graph and the ontology "
+            "hierarchy in memory and serve incremental updates over HTTP "
+            "(host defaults to 127.0.0.1)."
+        ),
+    )
+    parser.add_argument(
+        "--add-assertions",
+        action="append",
+        default=[],
+        help=(
+            "Turtle file with Mapping/Alignment assertions to add to the input graph. "
+            "May be repeated. Enables incremental mode, where --input is a previous "
+            "inference output and only the affected components are recomputed."
+        ),
+    )
+    parser.add_argument(
+        "--remove-assertions",
+        action="append",
+        default=[],
+        help=(
+            "Turtle file with Mapping/Alignment assertions to remove from the input "
+            "graph, matched by source, target and polarity (or by aligned pair). "
+            "May be repeated. Enables incremental mode."
+        ),
+    )
+    return parser
 
 
-def digest_token(*parts: str, length: int = 16) -> str:
-    h = hashlib.sha256()
-    for part in parts:
-        h.update(part.encode("utf-8"))
-        h.update(b"\x1f")
-    return h.hexdigest()[:length]
+MAPPING_IRIS = NodeIriMinter(f"{DEMOI}inf-map-")
+ALIGNMENT_IRIS = NodeIriMinter(f"{DEMOI}inf-align-")
+POLARITY_TOKENS = {DEMO.negative: "neg"}
 
 
 def ordered_pair(a: URIRef, b: URIRef) -> tuple[URIRef, URIRef]:
     return (a, b) if str(a) <= str(b) else (b, a)
 
 
+def id_pair(a: int, b: int) -> tuple[int, int]:
+    return (a, b) if a <= b else (b, a)
+
+
 def mapping_uri(source: URIRef, target: URIRef, polarity: URIRef) -> URIRef:
-    pol = "neg" if polarity == DEMO.negative else "pos"
-    return DEMOI[f"inf-map-{digest_token(str(source), str(target), pol)}"]
+    return MAPPING_IRIS.mint(source, target, POLARITY_TOKENS.get(polarity, "pos"))
+
+
+def mapping_uris(keys: Iterable[tuple[URIRef, URIRef, URIRef]]) -> list[URIRef]:
+    return MAPPING_IRIS.mint_many(
+        (source, target, POLARITY_TOKENS.get(polarity, "pos"))
+        for source, target, polarity in keys
+    )
 
 
 def alignment_uri(a: URIRef, b: URIRef) -> URIRef:
-    left, right = ordered_pair(a, b)
-    return DEMOI[f"inf-align-{digest_token(str(left), str(right))}"]
+    return ALIGNMENT_IRIS.mint(*ordered_pair(a, b))
 
 
-def first_uri(
-    graph: Graph, subject: URIRef, predicates: Iterable[URIRef]
-) -> URIRef | None:
-    for predicate in predicates:
-        value = next(graph.objects(subject, predicate), None)
-        if isinstance(value, URIRef):
-            return value
-    return None
+def alignment_uris(pairs: Iterable[tuple[URIRef, URIRef]]) -> list[URIRef]:
+    return ALIGNMENT_IRIS.mint_many(ordered_pair(a, b) for a, b in pairs)
 
 
 def remove_subject(graph: Graph, subject: URIRef) -> None:
@@ -311,220 +585,686 @@ def preferred_alignment_assertion(
     )
 
 
-def collect_mapping_assertions(
-    graph: Graph,
-) -> tuple[list[MappingAssertion], list[URIRef]]:
-    assertions: list[MappingAssertion] = []
+class AssertionTable:
+    """Columnar view of the ``Mapping`` and ``Alignment`` nodes of a graph.
+
+    Every predicate that describes these nodes is scanned once, keeping the
+    first object per node, instead of looking up each predicate per node. The
+    columns are built once per graph and shared by all phases that need the
+    assertions.
+    """
+
+    def __init__(self, graph: Graph) -> None:
+        self.first_values: dict[URIRef, dict[Node, Node]] = {}
+        for predicate in dict.fromkeys(
+            (
+                *MAPPING_SOURCE_PREDS,
+                *MAPPING_TARGET_PREDS,
+                *ALIGNMENT_SOURCE_PREDS,
+                *ALIGNMENT_TARGET_PREDS,
+                *POLARITY_PREDS,
+                *PROVENANCE_PREDS,
+            )
+        ):
+            column: dict[Node, Node] = {}
+            for node, value in graph.subject_objects(predicate):
+                column.setdefault(node, value)
+            self.first_values[predicate] = column
+
+        self.mapping_nodes: list[URIRef] = []
+        self.mapping_sources: list[URIRef] = []
+        self.mapping_targets: list[URIRef] = []
+        self.mapping_polarities: list[URIRef] = []
+        self.mapping_provenances: list[URIRef] = []
+        for node in graph.subjects(RDF.type, DEMO.Mapping):
+            if not isinstance(node, URIRef):
+                continue
+            source = self.first_uri(node, MAPPING_SOURCE_PREDS)
+            target = self.first_uri(node, MAPPING_TARGET_PREDS)
+            if source is None or target is None:
+                continue
+            self.mapping_nodes.append(node)
+            self.mapping_sources.append(source)
+            self.mapping_targets.append(target)
+            self.mapping_polarities.append(
+                self.first_uri(node, POLARITY_PREDS) or DEMO.positive
+            )
+            self.mapping_provenances.append(
+                self.first_uri(node, PROVENANCE_PREDS) or DEMO.asserted
+            )
 
-    for node in graph.subjects(RDF.type, DEMO.Mapping):
-        if not isinstance(node, URIRef):
-            continue
-        source = first_uri(graph, node, MAPPING_SOURCE_PREDS)
-        target = first_uri(graph, node, MAPPING_TARGET_PREDS)
-        if not isinstance(source, URIRef) or not isinstance(target, URIRef):
-            continue
-        polarity = first_uri(graph, node, POLARITY_PREDS) or DEMO.positive
-        provenance = first_uri(graph, node, PROVENANCE_PREDS) or DEMO.asserted
-        assertion = MappingAssertion(
-            source=source,
-            target=target,
-            polarity=polarity,
-            provenance=provenance,
-            origin="node",
-            node=node,
+        self.alignment_nodes: list[URIRef] = []
+        self.alignment_pairs: list[tuple[URIRef, URIRef]] = []
+        self.alignment_provenances: list[URIRef] = []
+        for node in graph.subjects(RDF.type, DEMO.Alignment):
+            if not isinstance(node, URIRef):
+                continue
+            source = self.first_uri(node, ALIGNMENT_SOURCE_PREDS)
+            target = self.first_uri(node, ALIGNMENT_TARGET_PREDS)
+            if source is None or target is None or source == target:
+                continue
+            self.alignment_nodes.append(node)
+            self.alignment_pairs.append(ordered_pair(source, target))
+            self.alignment_provenances.append(
+                self.first_uri(node, PROVENANCE_PREDS) or DEMO.asserted
+            )
+        self.bare_aligns = direct_pairs(graph, DEMO.aligns)
+
+    def first_uri(self, node: URIRef, predicates: Iterable[URIRef]) -> URIRef | None:
+        for predicate in predicates:
+            value = self.first_values[predicate].get(node)
+            if isinstance(value, URIRef):
+                return value
+        return None
+
+    def mapping_assertions(self) -> tuple[list[MappingAssertion], list[URIRef]]:
+        grouped: dict[tuple[URIRef, URIRef, URIRef], list[MappingAssertion]] = (
+            defaultdict(list)
+        )
+        for node, source, target, polarity, provenance in zip(
+            self.mapping_nodes,
+            self.mapping_sources,
+            self.mapping_targets,
+            self.mapping_polarities,
+            self.mapping_provenances,
+        ):
+            assertion = MappingAssertion(
+                source=source,
+                target=target,
+                polarity=polarity,
+                provenance=provenance,
+                origin="node",
+                node=node,
+            )
+            grouped[assertion.key].append(assertion)
+
+        kept: list[MappingAssertion] = []
+        duplicates_to_remove: list[URIRef] = []
+        for group in grouped.values():
+            winner = preferred_mapping_assertion(group)
+            kept.append(winner)
+            for assertion in group:
+                if assertion.node is not None and assertion is not winner:
+                    duplicates_to_remove.append(assertion.node)
+        return kept, duplicates_to_remove
+
+    def alignment_assertions(
+        self, trust_bare_aligns: bool
+    ) -> tuple[list[AlignmentAssertion], list[URIRef]]:
+        assertions = [
+            AlignmentAssertion(pair, provenance, node)
+            for node, pair, provenance in zip(
+                self.alignment_nodes, self.alignment_pairs, self.alignment_provenances
+            )
+        ]
+        if trust_bare_aligns:
+            seen = set(self.alignment_pairs)
+            for pair in self.bare_aligns:
+                if pair in seen:
+                    continue
+                assertions.append(AlignmentAssertion(pair, DEMO.asserted, None))
+
+        grouped: dict[tuple[URIRef, URIRef], list[AlignmentAssertion]] = defaultdict(
+            list
         )
-        assertions.append(assertion)
+        for assertion in assertions:
+            grouped[assertion.pair].append(assertion)
+
+        kept: list[AlignmentAssertion] = []
+        duplicates_to_remove: list[URIRef] = []
+        for group in grouped.values():
+            winner = preferred_alignment_assertion(group)
+            kept.append(winner)
+            for assertion in group:
+                if assertion.node is not None and assertion is not winner:
+                    duplicates_to_remove.append(assertion.node)
+        return kept, duplicates_to_remove
 
-    grouped: dict[tuple[URIRef, URIRef, URIRef], list[MappingAssertion]] = defaultdict(
-        list
-    )
-    for assertion in assertions:
-        grouped[assertion.key].append(assertion)
 
-    kept: list[MappingAssertion] = []
-    duplicates_to_remove: list[URIRef] = []
-    for group in grouped.values():
-        winner = preferred_mapping_assertion(group)
-        kept.append(winner)
-        for assertion in group:
-            if assertion.node is not None and assertion is not winner:
-                duplicates_to_remove.append(assertion.node)
-    return kept, duplicates_to_remove
+def collect_mapping_assertions(
+    graph: Graph,
+) -> tuple[list[MappingAssertion], list[URIRef]]:
+    return AssertionTable(graph).mapping_assertions()
 
 
 def collect_alignment_assertions(
     graph: Graph, trust_bare_aligns: bool
 ) -> tuple[list[AlignmentAssertion], list[URIRef]]:
-    assertions: list[AlignmentAssertion] = []
+    return AssertionTable(graph).alignment_assertions(trust_bare_aligns)
 
-    for node in graph.subjects(RDF.type, DEMO.Alignment):
-        if not isinstance(node, URIRef):
-            continue
-        source = first_uri(graph, node, ALIGNMENT_SOURCE_PREDS)
-        target = first_uri(graph, node, ALIGNMENT_TARGET_PREDS)
-        if (
-            not isinstance(source, URIRef)
-            or not isinstance(target, URIRef)
-            or source == target
-        ):
+
+def instance_files(inputs: list[str], default: Path) -> list[Path]:
+    """Expand ``--input`` values, reading the instance files of directories."""
+    paths: list[Path] = []
+    for value in inputs or [str(default)]:
+        path = Path(value).expanduser().resolve()
+        if not path.is_dir():
+            paths.append(path)
             continue
-        provenance = first_uri(graph, node, PROVENANCE_PREDS) or DEMO.asserted
-        assertions.append(
-            AlignmentAssertion(ordered_pair(source, target), provenance, node)
+        found = sorted(
+            item
+            for item in path.iterdir()
+            if item.is_file() and item.suffix in INSTANCE_FILE_SUFFIXES
         )
+        if not found:
+            raise ValueError(f"No instance files found in directory: {path}")
+        paths.extend(found)
+    return paths
+
+
+def split_output_paths(
+    input_paths: list[Path], output: str | None, incremental: bool, extension: str
+) -> list[Path]:
+    """Output file of each input file for ``--split-output``."""
+    if output is None and incremental:
+        return list(input_paths)
+    paths = []
+    for path in input_paths:
+        directory = (
+            Path(output).expanduser().resolve() if output else path.parent / "extended"
+        )
+        paths.append(directory / f"{path.stem}.{extension}")
+    if len(set(paths)) < len(paths):
+        raise ValueError(
+            "Several input files share a name and would be written to the same "
+            "output file; rename them or split the run."
+        )
+    return paths
+
+
+def load_instance_graph(
+    paths: list[Path], track_owners: bool = False
+) -> tuple[Graph, dict[Node, int]]:
+    """Parse the instance files, one after the other, into one graph.
+
+    With ``track_owners``, also returns the index of the input file that owns
+    each term: the first file with the term as a subject or, failing that, as
+    an object. The owners are recorded from the ``TripleAddedEvent`` that the
+    store dispatches for every parsed triple, so the files are still parsed
+    straight into the graph instead of being copied into it.
+    """
+    if len(paths) == 1 or not track_owners:
+        graph = Graph()
+        for path in paths:
+            graph.parse(path)
+        return graph, {}
+
+    store = Memory()
+    graph = Graph(store=store)
+    subject_owners: dict[Node, int] = {}
+    object_owners: dict[Node, int] = {}
+    index = 0
+
+    def record_owners(event: TripleAddedEvent) -> None:
+        subject, _, obj = event.triple
+        subject_owners.setdefault(subject, index)
+        object_owners.setdefault(obj, index)
+
+    store.dispatcher.subscribe(TripleAddedEvent, record_owners)
+    for index, path in enumerate(paths):
+        graph.parse(path)
+    # Later additions, such as the inferred triples, must not be recorded.
+    store.dispatcher = Dispatcher()
+    for term, owner in object_owners.items():
+        subject_owners.setdefault(term, owner)
+    return graph, subject_owners
+
+
+def subclass_edges(graph: Graph) -> list[tuple[URIRef, URIRef]]:
+    return [
+        (child, parent)
+        for child, parent in graph.subject_objects(RDFS.subClassOf)
+        if isinstance(child, URIRef) and isinstance(parent, URIRef)
+    ]
 
-    if trust_bare_aligns:
-        seen = {assertion.pair for assertion in assertions}
-        for pair in direct_pairs(graph, DEMO.aligns):
-            if pair in seen:
+
+def write_hierarchy_snapshot(path: Path, edges: list[tuple[URIRef, URIRef]]) -> None:
+    """Store ``edges`` as interned IRIs plus little-endian uint32 id pairs."""
+    ids: dict[str, int] = {}
+    pairs = array("I")
+    for child, parent in edges:
+        pairs.append(ids.setdefault(str(child), len(ids)))
+        pairs.append(ids.setdefault(str(parent), len(ids)))
+    if sys.byteorder == "big":
+        pairs.byteswap()
+    names = zlib.compress("\n".join(ids).encode("utf-8"))
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # A unique temporary file keeps concurrent runs from writing into the
+    # same partial snapshot; the rename is atomic within the folder.
+    descriptor, partial_name = tempfile.mkstemp(
+        dir=path.parent, prefix=f"{path.stem}-", suffix=".partial"
+    )
+    partial = Path(partial_name)
+    try:
+        with os.fdopen(descriptor, "wb") as handle:
+            handle.write(HIERARCHY_SNAPSHOT_MAGIC)
+            handle.write(struct.pack("<II", len(names), len(pairs)))
+            handle.write(names)
+            handle.write(zlib.compress(pairs.tobytes()))
+        partial.replace(path)
+    except BaseException:
+        partial.unlink(missing_ok=True)
+        raise
+
+
+def store_hierarchy_snapshot(path: Path, edges: list[tuple[URIRef, URIRef]]) -> None:
+    """Write the snapshot of a freshly parsed ontology and drop its older ones.
+
+    Snapshot names start with a key derived from the source path, so the
+    snapshots left over from earlier versions of the same file are found by
+    that prefix. A failure to write only costs the cache: it is reported and
+    the parsed edges are used.
+    """
+    source_key = path.stem.split("-", 1)[0]
+    try:
+        write_hierarchy_snapshot(path, edges)
+        for stale in path.parent.glob(f"{source_key}-*.hierarchy"):
+            if stale != path:
+                stale.unlink(missing_ok=True)
+    except OSError as exc:
+        print(f"Warning: hierarchy snapshot not written: {exc}", file=sys.stderr)
+
+
+def read_hierarchy_snapshot(path: Path) -> list[tuple[URIRef, URIRef]] | None:
+    """Return the edges of a snapshot, or None if it is unreadable or stale."""
+    try:
+        data = path.read_bytes()
+        if not data.startswith(HIERARCHY_SNAPSHOT_MAGIC):
+            return None
+        offset = len(HIERARCHY_SNAPSHOT_MAGIC)
+        names_size, pair_count = struct.unpack_from("<II", data, offset)
+        offset += struct.calcsize("<II")
+        names = zlib.decompress(data[offset : offset + names_size]).decode("utf-8")
+        pairs = array("I")
+        pairs.frombytes(zlib.decompress(data[offset + names_size :]))
+    except (OSError, ValueError, struct.error, zlib.error):
+        return None
+    if len(pairs) != pair_count:
+        return None
+    if sys.byteorder == "big":
+        pairs.byteswap()
+    terms = [URIRef(name) for name in names.split("\n")]
+    return [(terms[pairs[i]], terms[pairs[i + 1]]) for i in range(0, len(pairs), 2)]
+
+
+def load_ontology_edges(
+    path: Path, cache_dir: Path | None
+) -> list[tuple[URIRef, URIRef]]:
+    """Return the ``rdfs:subClassOf`` edges of an ontology file.
+
+    With a ``cache_dir`` the edges are cached in a snapshot named after the
+    SHA-256 of the resolved path and of the content of the file, so an
+    unchanged ontology is not parsed again and only its latest snapshot is
+    kept.
+    """
+    if cache_dir is None:
+        return subclass_edges(Graph().parse(path))
+    source_key = hashlib.sha256(str(path.resolve()).encode("utf-8")).hexdigest()
+    digest = hashlib.sha256(path.read_bytes()).hexdigest()
+    snapshot = cache_dir / f"{source_key[:16]}-{digest}.hierarchy"
+    if snapshot.is_file():
+        edges = read_hierarchy_snapshot(snapshot)
+        if edges is not None:
+            return edges
+    edges = subclass_edges(Graph().parse(path))
+    store_hierarchy_snapshot(snapshot, edges)
+    return edges
+
+
+def load_hierarchy(
+    instance_graph: Graph, ontology_inputs: list[str], cache_dir: Path | None = None
+) -> HierarchyIndex:
+    """Build the hierarchy index used for reasoning from the subClassOf edges.
+
+    Only ``rdfs:subClassOf`` edges of the instance graph and the ontology files
+    are used; the ontology files are not copied into the output.
+    """
+    parents: dict[URIRef, set[URIRef]] = defaultdict(set)
+    edge_lists = [subclass_edges(instance_graph)]
+    edge_lists.extend(
+        load_ontology_edges(Path(path_str), cache_dir) for path_str in ontology_inputs
+    )
+    for edges in edge_lists:
+        for child, parent in edges:
+            parents[child].add(parent)
+    return HierarchyIndex(dict(parents))
+
+
+class TermDictionary:
+    """Dense integer ids for the RDF terms handled by the rule engine.
+
+    Terms are interned once when the assertions are loaded; the rules run over
+    ids and pairs of ids, and terms are decoded again only for output.
+    """
+
+    def __init__(self) -> None:
+        self.terms: list[URIRef] = []
+        self.ids: dict[URIRef, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.terms)
+
+    def intern(self, term: URIRef) -> int:
+        term_id = self.ids.get(term)
+        if term_id is None:
+            term_id = len(self.terms)
+            self.ids[term] = term_id
+            self.terms.append(term)
+        return term_id
+
+    def intern_pair(self, left: URIRef, right: URIRef) -> tuple[int, int]:
+        return id_pair(self.intern(left), self.intern(right))
+
+    def intern_key(self, key: tuple[URIRef, URIRef, URIRef]) -> tuple[int, int, int]:
+        source, target, polarity = key
+        return (self.intern(source), self.intern(target), self.intern(polarity))
+
+    def term(self, term_id: int) -> URIRef:
+        return self.terms[term_id]
+
+    def decode_pair(self, pair: tuple[int, int]) -> tuple[URIRef, URIRef]:
+        return ordered_pair(self.terms[pair[0]], self.terms[pair[1]])
+
+    def decode_pairs(
+        self, pairs: Iterable[tuple[int, int]]
+    ) -> Iterator[tuple[URIRef, URIRef]]:
+        for pair in pairs:
+            yield self.decode_pair(pair)
+
+    def decode_key(self, key: tuple[int, int, int]) -> tuple[URIRef, URIRef, URIRef]:
+        source, target, polarity = key
+        return (self.terms[source], self.terms[target], self.terms[polarity])
+
+
+class HierarchyIndex:
+    """Precomputed ``rdfs:subClassOf`` closure used for ontology relatedness.
+
+    The closure is built once per hierarchy graph so that R5a can answer
+    ancestor/descendant questions with set lookups instead of re-walking the
+    graph for every pair of positive exact meanings.
+    """
+
+    def __init__(self, parents: dict[URIRef, set[URIRef]]) -> None:
+        self.parents = parents
+        self.ancestors: dict[URIRef, frozenset[URIRef]] = {}
+        for concept in sorted(parents, key=str):
+            self.ancestors[concept] = self._closure(concept)
+
+    @classmethod
+    def from_graph(cls, graph: Graph) -> HierarchyIndex:
+        parents: dict[URIRef, set[URIRef]] = defaultdict(set)
+        for child, parent in graph.subject_objects(RDFS.subClassOf):
+            if isinstance(child, URIRef) and isinstance(parent, URIRef):
+                parents[child].add(parent)
+        return cls(dict(parents))
+
+    def _closure(self, concept: URIRef) -> frozenset[URIRef]:
+        out: set[URIRef] = set()
+        agenda = [concept]
+        seen = {concept}
+        while agenda:
+            current = agenda.pop()
+            known = self.ancestors.get(current) if current != concept else None
+            if known is not None:
+                out |= known
                 continue
-            assertions.append(AlignmentAssertion(pair, DEMO.asserted, None))
-
-    grouped: dict[tuple[URIRef, URIRef], list[AlignmentAssertion]] = defaultdict(list)
-    for assertion in assertions:
-        grouped[assertion.pair].append(assertion)
-
-    kept: list[AlignmentAssertion] = []
-    duplicates_to_remove: list[URIRef] = []
-    for group in grouped.values():
-        winner = preferred_alignment_assertion(group)
-        kept.append(winner)
-        for assertion in group:
-            if assertion.node is not None and assertion is not winner:
-                duplicates_to_remove.append(assertion.node)
-    return kept, duplicates_to_remove
-
-
-def load_hierarchy_graph(instance_graph: Graph, ontology_inputs: list[str]) -> Graph:
-    """Build a support graph used only for hierarchy lookups during reasoning."""
-    hierarchy_graph = Graph()
-    for triple in instance_graph:
-        hierarchy_graph.add(triple)
-
-    for path_str in ontology_inputs:
-        ontology_path = Path(path_str)
-        hierarchy_graph.parse(ontology_path)
-
-    return hierarchy_graph
-
-
-def transitive_superclasses(graph: Graph, concept: URIRef) -> set[URIRef]:
-    out: set[URIRef] = set()
-    agenda = [concept]
-    seen = {concept}
-    while agenda:
-        current = agenda.pop()
-        for parent in graph.objects(current, RDFS.subClassOf):
-            if isinstance(parent, URIRef) and parent not in seen:
-                seen.add(parent)
-                out.add(parent)
-                agenda.append(parent)
-    return out
-
-
-def ontology_related(graph: Graph, left: URIRef, right: URIRef) -> bool:
-    if left == right:
-        return False
-    return right in transitive_superclasses(
-        graph, left
-    ) or left in transitive_superclasses(graph, right)
-
-
-def clique_closure(edges: set[tuple[URIRef, URIRef]]) -> set[tuple[URIRef, URIRef]]:
-    adjacency: dict[URIRef, set[URIRef]] = defaultdict(set)
-    nodes: set[URIRef] = set()
-    for left, right in edges:
-        nodes.add(left)
-        nodes.add(right)
-        adjacency[left].add(right)
-        adjacency[right].add(left)
-
-    visited: set[URIRef] = set()
-    closure: set[tuple[URIRef, URIRef]] = set()
-    for node in sorted(nodes, key=str):
-        if node in visited:
-            continue
-        component: list[URIRef] = []
-        stack = [node]
-        visited.add(node)
-        while stack:
-            current = stack.pop()
-            component.append(current)
-            for neighbor in adjacency[current]:
-                if neighbor not in visited:
-                    visited.add(neighbor)
-                    stack.append(neighbor)
-        items = sorted(component, key=str)
-        for i in range(len(items)):
-            for j in range(i + 1, len(items)):
-                closure.add((items[i], items[j]))
-    return closure
+            for parent in self.parents.get(current, ()):
+                if parent not in seen:
+                    seen.add(parent)
+                    out.add(parent)
+                    agenda.append(parent)
+        out.discard(concept)
+        return frozenset(out)
+
+    def superclasses(self, concept: URIRef) -> frozenset[URIRef]:
+        return self.ancestors.get(concept, frozenset())
+
+    def related(self, left: URIRef, right: URIRef) -> bool:
+        if left == right:
+            return False
+        return right in self.superclasses(left) or left in self.superclasses(right)
+
+    def ancestor_ids(self, terms: TermDictionary) -> dict[int, frozenset[int]]:
+        """Restrict the closure to interned terms, keyed and valued by id."""
+        out: dict[int, frozenset[int]] = {}
+        for concept, ancestors in self.ancestors.items():
+            concept_id = terms.ids.get(concept)
+            if concept_id is None:
+                continue
+            known = frozenset(terms.ids[a] for a in ancestors if a in terms.ids)
+            if known:
+                out[concept_id] = known
+        return out
+
+
+class AlignmentComponents:
+    """Union-find over representation concept ids connected by ``aligns``.
+
+    R1a makes every connected component a clique, so the closure is kept as
+    components rather than as explicit pairs. Each component is identified by
+    its root id; explicit pairs are only expanded by ``pairs()`` when the
+    output graph is written.
+    """
+
+    def __init__(self) -> None:
+        self.parent: dict[int, int] = {}
+        self.members: dict[int, list[int]] = {}
+
+    def add(self, node: int) -> bool:
+        if node in self.parent:
+            return False
+        self.parent[node] = node
+        self.members[node] = [node]
+        return True
+
+    def find(self, node: int) -> int:
+        parent = self.parent.get(node, node)
+        while parent != node:
+            grandparent = self.parent[parent]
+            self.parent[node] = grandparent
+            node, parent = parent, grandparent
+        return node
+
+    def union(self, left: int, right: int) -> tuple[int, int] | None:
+        """Merge two components and return ``(root, absorbed_root)``."""
+        self.add(left)
+        self.add(right)
+        root = self.find(left)
+        absorbed = self.find(right)
+        if root == absorbed:
+            return None
+        if len(self.members[root]) < len(self.members[absorbed]):
+            root, absorbed = absorbed, root
+        self.parent[absorbed] = root
+        self.members[root].extend(self.members.pop(absorbed))
+        return root, absorbed
+
+    def component(self, node: int) -> list[int]:
+        return self.members.get(self.find(node), [node])
+
+    def aligned(self, left: int, right: int) -> bool:
+        if left == right or left not in self.parent or right not in self.parent:
+            return False
+        return self.find(left) == self.find(right)
+
+    def __contains__(self, pair: tuple[int, int]) -> bool:
+        return self.aligned(*pair)
+
+    def __len__(self) -> int:
+        return sum(
+            len(items) * (len(items) - 1) // 2 for items in self.members.values()
+        )
+
+    def __iter__(self) -> Iterator[tuple[int, int]]:
+        return self.pairs()
+
+    def absorb(self, other: AlignmentComponents) -> None:
+        """Take over the components of ``other``, which must be disjoint."""
+        self.parent.update(other.parent)
+        self.members.update(other.members)
+
+    def root_table(self, size: int) -> list[int]:
+        """Component root of every id below ``size``, for bulk lookups.
+
+        Ids outside any component get a distinct negative entry, so two ids
+        are aligned exactly when they are different and their entries match.
+        """
+        table = list(range(-1, -size - 1, -1))
+        for root, members in self.members.items():
+            for node in members:
+                table[node] = root
+        return table
+
+    def components(self) -> list[list[int]]:
+        return sorted(
+            (sorted(items) for items in self.members.values()),
+            key=lambda items: items[0],
+        )
+
+    def pairs(self) -> Iterator[tuple[int, int]]:
+        for items in self.components():
+            for i in range(len(items)):
+                for j in range(i + 1, len(items)):
+                    yield (items[i], items[j])
+
+
+def saturate_exact_meanings(
+    mapping_keys: set[tuple[int, int, int]],
+    asserted_aligns: set[tuple[int, int]],
+    positive: int,
+    instrumentation: Instrumentation | None = None,
+) -> tuple[
+    set[tuple[int, int, int]],
+    set[tuple[int, int]],
+    AlignmentComponents,
+]:
+    """Apply R2, R1a and R6 to a fixpoint using semi-naive evaluation.
+
+    Each round only looks at the mapping keys and component merges that were
+    added in the previous round. R6 is applied per component: every component
+    keeps the union of its members' exact meanings, so a merge or a new key
+    only emits the meanings that the other members are still missing. Returns
+    the saturated mapping keys, the R2 edges and the ``aligns`` components.
+    """
+    keys: set[tuple[int, int, int]] = set()
+    targets_by_source: dict[int, set[tuple[int, int]]] = defaultdict(set)
+    positive_by_target: dict[int, set[int]] = defaultdict(set)
+    components = AlignmentComponents()
+    meanings: dict[int, set[tuple[int, int]]] = {}
+    r2_edges: set[tuple[int, int]] = set()
+
+    instrumentation = instrumentation or Instrumentation()
+    delta_keys = set(mapping_keys)
+    pending_edges = list(asserted_aligns)
+    round_number = 0
+    while delta_keys or pending_edges:
+        round_number += 1
+        instrumentation.round(
+            round_number, delta_keys=len(delta_keys), pending_edges=len(pending_edges)
+        )
+        next_delta: set[tuple[int, int, int]] = set()
+        for key in delta_keys:
+            source, target, polarity = key
+            keys.add(key)
+            targets_by_source[source].add((target, polarity))
+            # R2: new positive exact meanings align with existing ones.
+            if polarity == positive:
+                for other in positive_by_target[target]:
+                    if other != source:
+                        edge = id_pair(source, other)
+                        if edge not in r2_edges:
+                            r2_edges.add(edge)
+                            pending_edges.append(edge)
+                positive_by_target[target].add(source)
+            # R6: a new meaning of a component reaches all of its members.
+            if source in components.parent:
+                root_meanings = meanings[components.find(source)]
+                if (target, polarity) not in root_meanings:
+                    root_meanings.add((target, polarity))
+                    for member in components.component(source):
+                        next_delta.add((member, target, polarity))
+
+        # R1a + R6: a merge exchanges the meanings missing on either side.
+        for left, right in pending_edges:
+            for node in (left, right):
+                if components.add(node):
+                    meanings[node] = set(targets_by_source.get(node, ()))
+            left_root = components.find(left)
+            right_root = components.find(right)
+            if left_root == right_root:
+                continue
+            left_meanings = meanings[left_root]
+            right_meanings = meanings[right_root]
+            for target, polarity in left_meanings - right_meanings:
+                for member in components.members[right_root]:
+                    next_delta.add((member, target, polarity))
+            for target, polarity in right_meanings - left_meanings:
+                for member in components.members[left_root]:
+                    next_delta.add((member, target, polarity))
+            root, absorbed = components.union(left_root, right_root)
+            meanings[root] |= meanings.pop(absorbed)
+        pending_edges = []
+
+        delta_keys = next_delta - keys
+
+    return keys, r2_edges, components
 
 
 def detect_horizontal_conflicts(
-    aligns_total: set[tuple[URIRef, URIRef]],
-    cannot_total: set[tuple[URIRef, URIRef]],
-    may_total: set[tuple[URIRef, URIRef]],
-    partial_total: set[tuple[URIRef, URIRef]],
-) -> list[HorizontalConflict]:
-    by_pair: dict[tuple[URIRef, URIRef], set[str]] = defaultdict(set)
-    for pair in aligns_total:
-        by_pair[pair].add("aligns")
-    for pair in cannot_total:
-        by_pair[pair].add("cannotAlign")
-    for pair in may_total:
-        by_pair[pair].add("mayAlign")
-    for pair in partial_total:
-        by_pair[pair].add("partiallyAligns")
-
-    conflicts: list[HorizontalConflict] = []
-    for pair, relations in by_pair.items():
-        if len(relations) > 1:
-            conflicts.append(HorizontalConflict(pair, tuple(sorted(relations))))
-    return sorted(
-        conflicts,
-        key=lambda item: (str(item.pair[0]), str(item.pair[1]), item.relations),
+    aligns_total: AlignmentComponents,
+    cannot_total: set[tuple[int, int]],
+    may_total: set[tuple[int, int]],
+    partial_total: set[tuple[int, int]],
+) -> dict[tuple[int, int], tuple[str, ...]]:
+    # Conflicting pairs are found with set intersections, which run in C over
+    # the id pairs, and with a table of component roots for the aligns
+    # components, which are never expanded. Pairs are id_pair ordered, so a
+    # pair can only be aligned when its second, larger id is in the table.
+    # Only the conflicting pairs are then visited to label their relations.
+    size = 1 + max(aligns_total.parent, default=-1)
+    roots = aligns_total.root_table(size)
+    candidates = (
+        (cannot_total & may_total)
+        | (cannot_total & partial_total)
+        | (may_total & partial_total)
     )
+    for pairs in (cannot_total, may_total, partial_total):
+        candidates.update(
+            [
+                pair
+                for pair in pairs
+                if pair[1] < size and roots[pair[0]] == roots[pair[1]]
+            ]
+        )
 
+    conflicts: dict[tuple[int, int], tuple[str, ...]] = {}
+    for pair in candidates:
+        mask = (
+            (pair[1] < size and roots[pair[0]] == roots[pair[1]])
+            | (pair in cannot_total) << 1
+            | (pair in may_total) << 2
+            | (pair in partial_total) << 3
+        )
+        conflicts[pair] = HORIZONTAL_RELATION_SETS[mask]
+    return conflicts
 
-def derive_relations(
-    hierarchy_graph: Graph,
-    mapping_keys: set[tuple[URIRef, URIRef, URIRef]],
-    asserted_aligns: set[tuple[URIRef, URIRef]],
-    seed_cannot: set[tuple[URIRef, URIRef]],
-    seed_may: set[tuple[URIRef, URIRef]],
-    seed_partial: set[tuple[URIRef, URIRef]],
-) -> dict[str, object]:
-    positives = {
-        (source, target)
-        for source, target, polarity in mapping_keys
-        if polarity == DEMO.positive
-    }
-    negatives = {
-        (source, target)
-        for source, target, polarity in mapping_keys
-        if polarity == DEMO.negative
-    }
-
-    positive_by_target: dict[URIRef, set[URIRef]] = defaultdict(set)
-    negative_by_target: dict[URIRef, set[URIRef]] = defaultdict(set)
-    for source, target in positives:
-        positive_by_target[target].add(source)
-    for source, target in negatives:
-        negative_by_target[target].add(source)
 
-    r2_edges: set[tuple[URIRef, URIRef]] = set()
-    for concepts in positive_by_target.values():
-        items = sorted(concepts, key=str)
-        for i in range(len(items)):
-            for j in range(i + 1, len(items)):
-                r2_edges.add((items[i], items[j]))
+def decode_conflicts(
+    terms: TermDictionary, conflicts: dict[tuple[int, int], tuple[str, ...]]
+) -> list[HorizontalConflict]:
+    return sorted(
+        (
+            HorizontalConflict(terms.decode_pair(pair), relations)
+            for pair, relations in conflicts.items()
+        ),
+        key=lambda item: (str(item.pair[0]), str(item.pair[1]), item.relations),
+    )
 
-    base_align_edges = asserted_aligns | r2_edges
-    aligns_total = clique_closure(base_align_edges)
-    r1a_edges = aligns_total - base_align_edges
 
-    r3_edges: set[tuple[URIRef, URIRef]] = set()
+def rule_r3(
+    positive_by_target: dict[int, set[int]], negative_by_target: dict[int, set[int]]
+) -> set[tuple[int, int]]:
+    r3_edges: set[tuple[int, int]] = set()
     all_targets = set(positive_by_target) | set(negative_by_target)
     for target in all_targets:
         pos_items = positive_by_target.get(target, set())
@@ -532,37 +1272,61 @@ def derive_relations(
         for left in pos_items:
             for right in neg_items:
                 if left != right:
-                    r3_edges.add(ordered_pair(left, right))
-    cannot_total = seed_cannot | r3_edges
-
-    r5a_candidates: set[tuple[URIRef, URIRef]] = set()
-    positive_items = sorted(positives, key=lambda item: (str(item[0]), str(item[1])))
-    for i in range(len(positive_items)):
-        c1, o1 = positive_items[i]
-        for j in range(i + 1, len(positive_items)):
-            c2, o2 = positive_items[j]
-            if c1 == c2 or o1 == o2:
-                continue
-            if ontology_related(hierarchy_graph, o1, o2):
-                r5a_candidates.add(ordered_pair(c1, c2))
-
-    inferred_partial = {
+                    r3_edges.add(id_pair(left, right))
+    return r3_edges
+
+
+def rule_r5a(
+    ancestors: dict[int, frozenset[int]], positive_by_target: dict[int, set[int]]
+) -> set[tuple[int, int]]:
+    # R5a is evaluated as a join: every related target pair has one target as
+    # an ancestor of the other, so only the ancestors of each target that are
+    # themselves positive targets need to be visited.
+    r5a_candidates: set[tuple[int, int]] = set()
+    positive_targets = frozenset(positive_by_target)
+    for target, concepts in positive_by_target.items():
+        for ancestor in ancestors.get(target, frozenset()) & positive_targets:
+            related_concepts = positive_by_target[ancestor]
+            for left in concepts:
+                for right in related_concepts:
+                    if left != right:
+                        r5a_candidates.add(id_pair(left, right))
+    return r5a_candidates
+
+
+def rule_r5b(
+    r5a_candidates: set[tuple[int, int]],
+    aligns_total: AlignmentComponents,
+    cannot_total: set[tuple[int, int]],
+    seed_partial: set[tuple[int, int]],
+) -> set[tuple[int, int]]:
+    return {
         pair
         for pair in r5a_candidates
         if pair not in aligns_total
         and pair not in cannot_total
         and pair not in seed_partial
     }
-    partial_total = seed_partial | inferred_partial
 
-    r4a_candidates: set[tuple[URIRef, URIRef]] = set()
+
+def rule_r4a(negative_by_target: dict[int, set[int]]) -> set[tuple[int, int]]:
+    r4a_candidates: set[tuple[int, int]] = set()
     for concepts in negative_by_target.values():
-        items = sorted(concepts, key=str)
+        items = sorted(concepts)
         for i in range(len(items)):
             for j in range(i + 1, len(items)):
                 r4a_candidates.add((items[i], items[j]))
+    return r4a_candidates
+
 
-    inferred_may = {
+def rule_r4b(
+    r4a_candidates: set[tuple[int, int]],
+    aligns_total: AlignmentComponents,
+    cannot_total: set[tuple[int, int]],
+    partial_total: set[tuple[int, int]],
+    seed_may: set[tuple[int, int]],
+) -> set[tuple[int, int]]:
+    return {
         pair
         for pair in r4a_candidates
         if pair not in aligns_total
@@ -570,34 +1334,112 @@ def derive_relations(
         and pair not in partial_total
         and pair not in seed_may
     }
-    may_total = seed_may | inferred_may
 
-    inconsistent_r7: set[URIRef] = set()
-    positive_targets_by_concept: dict[URIRef, set[URIRef]] = defaultdict(set)
-    negative_targets_by_concept: dict[URIRef, set[URIRef]] = defaultdict(set)
-    for source, target in positives:
-        positive_targets_by_concept[source].add(target)
-    for source, target in negatives:
-        negative_targets_by_concept[source].add(target)
 
-    for concept, targets in positive_targets_by_concept.items():
-        if len(targets) > 1:
-            inconsistent_r7.add(concept)
+def rule_r7(positive_targets_by_concept: dict[int, set[int]]) -> set[int]:
+    return {
+        concept
+        for concept, targets in positive_targets_by_concept.items()
+        if len(targets) > 1
+    }
+
 
-    inconsistent_r8: set[URIRef] = set()
+def rule_r8(
+    positive_targets_by_concept: dict[int, set[int]],
+    negative_targets_by_concept: dict[int, set[int]],
+) -> set[int]:
+    inconsistent_r8: set[int] = set()
     for concept in set(positive_targets_by_concept) | set(negative_targets_by_concept):
         if positive_targets_by_concept.get(
             concept, set()
         ) & negative_targets_by_concept.get(concept, set()):
             inconsistent_r8.add(concept)
+    return inconsistent_r8
 
-    conflicts = detect_horizontal_conflicts(
-        aligns_total, cannot_total, may_total, partial_total
-    )
+
+def derive_relations(
+    ancestors: dict[int, frozenset[int]],
+    positive: int,
+    negative: int,
+    mapping_keys: set[tuple[int, int, int]],
+    asserted_aligns: set[tuple[int, int]],
+    r2_edges: set[tuple[int, int]],
+    aligns_total: AlignmentComponents,
+    seed_cannot: set[tuple[int, int]],
+    seed_may: set[tuple[int, int]],
+    seed_partial: set[tuple[int, int]],
+    instrumentation: Instrumentation | None = None,
+) -> dict[str, object]:
+    """Derive the stratified rules on top of a saturated exact-meaning closure.
+
+    ``r2_edges`` and ``aligns_total`` come from ``saturate_exact_meanings``,
+    which already evaluated R2 and R1a for ``mapping_keys``. All inputs are
+    term ids; ``ancestors`` is the id-level hierarchy closure.
+    """
+    instrumentation = instrumentation or Instrumentation()
+    positives = {
+        (source, target)
+        for source, target, polarity in mapping_keys
+        if polarity == positive
+    }
+    negatives = {
+        (source, target)
+        for source, target, polarity in mapping_keys
+        if polarity == negative
+    }
+
+    positive_by_target: dict[int, set[int]] = defaultdict(set)
+    negative_by_target: dict[int, set[int]] = defaultdict(set)
+    positive_targets_by_concept: dict[int, set[int]] = defaultdict(set)
+    negative_targets_by_concept: dict[int, set[int]] = defaultdict(set)
+    for source, target in positives:
+        positive_by_target[target].add(source)
+        positive_targets_by_concept[source].add(target)
+    for source, target in negatives:
+        negative_by_target[target].add(source)
+        negative_targets_by_concept[source].add(target)
+
+    # Asserted and R2 edges are part of the closure; R1a adds everything else.
+    r1a_count = len(aligns_total) - len(asserted_aligns | r2_edges)
+
+    with instrumentation.phase("R3"):
+        r3_edges = rule_r3(positive_by_target, negative_by_target)
+    cannot_total = seed_cannot | r3_edges
+
+    with instrumentation.phase("R5a"):
+        r5a_candidates = rule_r5a(ancestors, positive_by_target)
+    with instrumentation.phase("R5b"):
+        inferred_partial = rule_r5b(
+            r5a_candidates, aligns_total, cannot_total, seed_partial
+        )
+    partial_total = seed_partial | inferred_partial
+
+    with instrumentation.phase("R4a"):
+        r4a_candidates = rule_r4a(negative_by_target)
+    with instrumentation.phase("R4b"):
+        inferred_may = rule_r4b(
+            r4a_candidates, aligns_total, cannot_total, partial_total, seed_may
+        )
+    may_total = seed_may | inferred_may
+
+    with instrumentation.phase("R7"):
+        inconsistent_r7 = rule_r7(positive_targets_by_concept)
+    with instrumentation.phase("R8"):
+        inconsistent_r8 = rule_r8(
+            positive_targets_by_concept, negative_targets_by_concept
+        )
+
+    with instrumentation.phase("conflicts"):
+        conflicts = detect_horizontal_conflicts(
+            aligns_total,
+            cannot_total,
+            may_total,
+            partial_total,
+        )
 
     return {
         "r2_edges": r2_edges,
-        "r1a_edges": r1a_edges,
+        "r1a_count": r1a_count,
         "aligns_total": aligns_total,
         "r3_edges": r3_edges,
         "cannot_total": cannot_total,
@@ -613,11 +1455,144 @@ def derive_relations(
     }
 
 
+def evaluate_rules(
+    rules: RuleInput, instrumentation: Instrumentation | None = None
+) -> dict[str, object]:
+    instrumentation = instrumentation or Instrumentation()
+    with instrumentation.phase("closure"):
+        mapping_keys, r2_edges, aligns_total = saturate_exact_meanings(
+            rules.mapping_keys, rules.asserted_aligns, rules.positive, instrumentation
+        )
+    derived = derive_relations(
+        rules.ancestors,
+        rules.positive,
+        rules.negative,
+        mapping_keys,
+        rules.asserted_aligns,
+        r2_edges,
+        aligns_total,
+        rules.seed_cannot,
+        rules.seed_may,
+        rules.seed_partial,
+        instrumentation,
+    )
+    derived["mapping_keys"] = mapping_keys
+    return derived
+
+
+def evaluate_shard(rules: RuleInput) -> dict[str, object]:
+    """Evaluate one shard in a worker process and return its records too."""
+    instrumentation = Instrumentation()
+    derived = evaluate_rules(rules, instrumentation)
+    derived["records"] = instrumentation.records
+    return derived
+
+
+def dependency_partition(
+    mapping_keys: Iterable[tuple[int, int, int]],
+    pairs: Iterable[tuple[int, int]],
+    ancestors: dict[int, frozenset[int]],
+) -> AlignmentComponents:
+    """Connect the concepts and targets that a rule may relate to each other.
+
+    Concepts are connected to their exact-meaning targets, aligned or seeded
+    pairs are connected directly, and targets are connected to their
+    ancestors. No rule relates terms in different components of the result.
+    """
+    # The aligns union-find doubles as the partition over concepts and targets.
+    partition = AlignmentComponents()
+    for source, target, _polarity in mapping_keys:
+        partition.union(source, target)
+    for left, right in pairs:
+        partition.union(left, right)
+    for target, target_ancestors in ancestors.items():
+        for ancestor in target_ancestors:
+            partition.union(target, ancestor)
+    return partition
+
+
+def shard_rule_input(rules: RuleInput, shard_count: int) -> list[RuleInput]:
+    """Split ``rules`` into at most ``shard_count`` independent shards."""
+    seeds = rules.seed_cannot | rules.seed_may | rules.seed_partial
+    partition = dependency_partition(
+        rules.mapping_keys, rules.asserted_aligns | seeds, rules.ancestors
+    )
+    weights: Counter[int] = Counter()
+    for source, _target, _polarity in rules.mapping_keys:
+        weights[partition.find(source)] += 1
+
+    # Largest components first, each into the currently lightest shard.
+    shard_of: dict[int, int] = {}
+    loads = [0] * shard_count
+    for root in sorted(partition.members, key=lambda item: -weights[item]):
+        shard = loads.index(min(loads))
+        shard_of[root] = shard
+        loads[shard] += weights[root] or 1
+
+    def split(items: set[tuple[int, ...]]) -> list[set[tuple[int, ...]]]:
+        buckets: list[set[tuple[int, ...]]] = [set() for _ in range(shard_count)]
+        for item in items:
+            buckets[shard_of[partition.find(item[0])]].add(item)
+        return buckets
+
+    keys = split(rules.mapping_keys)
+    aligns = split(rules.asserted_aligns)
+    cannot = split(rules.seed_cannot)
+    may = split(rules.seed_may)
+    partial = split(rules.seed_partial)
+    shards: list[RuleInput] = []
+    for index in range(shard_count):
+        if not any(
+            (keys[index], aligns[index], cannot[index], may[index], partial[index])
+        ):
+            continue
+        targets = {target for _source, target, _polarity in keys[index]}
+        shards.append(
+            RuleInput(
+                mapping_keys=keys[index],
+                asserted_aligns=aligns[index],
+                seed_cannot=cannot[index],
+                seed_may=may[index],
+                seed_partial=partial[index],
+                ancestors={
+                    target: rules.ancestors[target]
+                    for target in targets
+                    if target in rules.ancestors
+                },
+                positive=rules.positive,
+                negative=rules.negative,
+            )
+        )
+    return shards
+
+
+def merge_derived(parts: list[dict[str, object]]) -> dict[str, object]:
+    """Merge the rule results of independent shards."""
+    merged: dict[str, object] = {}
+    for part in parts:
+        for name, value in part.items():
+            if name not in merged:
+                merged[name] = value
+            elif isinstance(value, AlignmentComponents):
+                merged[name].absorb(value)
+            elif isinstance(value, (set, dict)):
+                merged[name].update(value)
+            elif isinstance(value, list):
+                merged[name].extend(value)
+            else:
+                merged[name] += value
+    return merged
+
+
 def infer(
     instance_graph: Graph,
-    hierarchy_graph: Graph,
+    hierarchy: HierarchyIndex,
     trust_horizontal_input: bool,
     trust_bare_aligns: bool,
+    scope: set[URIRef] | None = None,
+    jobs: int = 1,
+    instrumentation: Instrumentation | None = None,
+    assertions: AssertionTable | None = None,
 ) -> tuple[
     InferenceResult,
     Counter,
@@ -625,75 +1600,70 @@ def infer(
     list[AlignmentAssertion],
     CleanupSummary,
 ]:
-    mapping_assertions, duplicate_mapping_nodes = collect_mapping_assertions(
-        instance_graph
-    )
-    alignment_assertions, duplicate_alignment_nodes = collect_alignment_assertions(
-        instance_graph, trust_bare_aligns=trust_bare_aligns
-    )
+    instrumentation = instrumentation or Instrumentation()
+    with instrumentation.phase("collect assertions"):
+        assertions = assertions or AssertionTable(instance_graph)
+        mapping_assertions, duplicate_mapping_nodes = assertions.mapping_assertions()
+        alignment_assertions, duplicate_alignment_nodes = (
+            assertions.alignment_assertions(trust_bare_aligns=trust_bare_aligns)
+        )
 
     cleanup = CleanupSummary(
         removed_duplicate_mapping_nodes=len(duplicate_mapping_nodes),
         removed_duplicate_alignment_nodes=len(duplicate_alignment_nodes),
     )
-
-    asserted_mapping_keys = {item.key for item in mapping_assertions if item.asserted}
+    if scope is not None:
+        mapping_assertions = [
+            item for item in mapping_assertions if item.source in scope
+        ]
+        alignment_assertions = [
+            item for item in alignment_assertions if item.pair[0] in scope
+        ]
+
+    terms = TermDictionary()
+    positive = terms.intern(DEMO.positive)
+    asserted_mapping_keys = {
+        terms.intern_key(item.key) for item in mapping_assertions if item.asserted
+    }
     asserted_alignment_pairs = {
-        item.pair for item in alignment_assertions if item.asserted
+        terms.intern_pair(*item.pair) for item in alignment_assertions if item.asserted
     }
+    seed_cannot: set[tuple[int, int]] = set()
+    seed_may: set[tuple[int, int]] = set()
+    seed_partial: set[tuple[int, int]] = set()
     if trust_horizontal_input:
-        seed_cannot = direct_pairs(instance_graph, DEMO.cannotAlign)
-        seed_may = direct_pairs(instance_graph, DEMO.mayAlign)
-        seed_partial = direct_pairs(instance_graph, DEMO.partiallyAligns)
-    else:
-        seed_cannot = set()
-        seed_may = set()
-        seed_partial = set()
-
-    mapping_keys = set(asserted_mapping_keys)
-    while True:
-        derived = derive_relations(
-            hierarchy_graph,
-            mapping_keys,
-            asserted_alignment_pairs,
-            seed_cannot,
-            seed_may,
-            seed_partial,
-        )
-
-        aligns_total = derived["aligns_total"]
-        new_keys: set[tuple[URIRef, URIRef, URIRef]] = set()
-        existing_by_source: dict[URIRef, list[tuple[URIRef, URIRef]]] = defaultdict(
-            list
-        )
-        for source, target, polarity in mapping_keys:
-            existing_by_source[source].append((target, polarity))
-
-        for left, right in aligns_total:
-            for target, polarity in existing_by_source.get(left, []):
-                key = (right, target, polarity)
-                if key not in mapping_keys:
-                    new_keys.add(key)
-            for target, polarity in existing_by_source.get(right, []):
-                key = (left, target, polarity)
-                if key not in mapping_keys:
-                    new_keys.add(key)
-
-        if not new_keys:
-            break
-        mapping_keys |= new_keys
-
-    final = derive_relations(
-        hierarchy_graph,
-        mapping_keys,
-        asserted_alignment_pairs,
-        seed_cannot,
-        seed_may,
-        seed_partial,
+        for seeds, predicate in (
+            (seed_cannot, DEMO.cannotAlign),
+            (seed_may, DEMO.mayAlign),
+            (seed_partial, DEMO.partiallyAligns),
+        ):
+            for left, right in direct_pairs(instance_graph, predicate):
+                if scope is None or left in scope:
+                    seeds.add(terms.intern_pair(left, right))
+
+    rules = RuleInput(
+        mapping_keys=asserted_mapping_keys,
+        asserted_aligns=asserted_alignment_pairs,
+        seed_cannot=seed_cannot,
+        seed_may=seed_may,
+        seed_partial=seed_partial,
+        ancestors=hierarchy.ancestor_ids(terms),
+        positive=positive,
+        negative=terms.intern(DEMO.negative),
     )
-
+    with instrumentation.phase("rules"):
+        shards = shard_rule_input(rules, jobs * 4) if jobs > 1 else [rules]
+        if len(shards) > 1:
+            with ProcessPoolExecutor(max_workers=jobs) as executor:
+                final = merge_derived(list(executor.map(evaluate_shard, shards)))
+            instrumentation.replay(final.pop("records"))
+        else:
+            final = evaluate_rules(rules, instrumentation)
+
+    mapping_keys = final["mapping_keys"]
     inferred_mapping_keys = mapping_keys - asserted_mapping_keys
     result = InferenceResult(
+        terms=terms,
         mapping_keys=mapping_keys,
         inferred_mapping_keys=inferred_mapping_keys,
         aligns=final["aligns_total"],
@@ -701,7 +1671,7 @@ def infer(
         may_align=final["may_total"],
         partially_aligns=final["partial_total"],
         inferred_aligns_r2=final["r2_edges"] - asserted_alignment_pairs,
-        inferred_aligns_r1a=final["r1a_edges"],
+        inferred_aligns_r1a_count=final["r1a_count"],
         inferred_cannot_align=final["r3_edges"] - seed_cannot,
         may_candidates=final["r4a_candidates"],
         inferred_may_align=final["inferred_may"],
@@ -709,12 +1679,12 @@ def infer(
         inferred_partially_aligns=final["inferred_partial"],
         inconsistent_r7=final["inconsistent_r7"],
         inconsistent_r8=final["inconsistent_r8"],
-        conflicts=final["conflicts"],
+        conflicts=decode_conflicts(terms, final["conflicts"]),
     )
 
     counters = Counter()
     counters["R2"] = len(result.inferred_aligns_r2)
-    counters["R1a"] = len(result.inferred_aligns_r1a)
+    counters["R1a"] = result.inferred_aligns_r1a_count
     counters["R3"] = len(result.inferred_cannot_align)
     counters["R4a"] = len(result.may_candidates)
     counters["R4b"] = len(result.inferred_may_align)
@@ -733,80 +1703,149 @@ def infer(
     return result, counters, mapping_assertions, alignment_assertions, cleanup
 
 
-def rewrite_direct_horizontal(
-    graph: Graph, predicate: URIRef, pairs: set[tuple[URIRef, URIRef]]
-) -> int:
-    initial = {
-        (s, o)
-        for s, o in graph.subject_objects(predicate)
-        if isinstance(s, URIRef) and isinstance(o, URIRef)
+def apply_assertion_changes(
+    graph: Graph, additions: list[Graph], removals: list[Graph]
+) -> set[URIRef]:
+    """Apply added/removed assertions to ``graph`` and return the touched terms.
+
+    Removals are matched by mapping key or aligned pair, so the change files do
+    not need to reuse the node IRIs of the graph being updated.
+    """
+    touched: set[URIRef] = set()
+    removed_keys: set[tuple[URIRef, URIRef, URIRef]] = set()
+    removed_pairs: set[tuple[URIRef, URIRef]] = set()
+    for removal in removals:
+        mappings, _duplicates = collect_mapping_assertions(removal)
+        alignments, _duplicates = collect_alignment_assertions(
+            removal, trust_bare_aligns=True
+        )
+        removed_keys.update(item.key for item in mappings)
+        removed_pairs.update(item.pair for item in alignments)
+    if removed_keys or removed_pairs:
+        mappings, _duplicates = collect_mapping_assertions(graph)
+        for item in mappings:
+            if item.key in removed_keys and item.node is not None:
+                remove_subject(graph, item.node)
+        alignments, _duplicates = collect_alignment_assertions(
+            graph, trust_bare_aligns=False
+        )
+        for item in alignments:
+            if item.pair in removed_pairs and item.node is not None:
+                remove_subject(graph, item.node)
+        for left, right in removed_pairs:
+            graph.remove((left, DEMO.aligns, right))
+            graph.remove((right, DEMO.aligns, left))
+    for source, target, _polarity in removed_keys:
+        touched.update((source, target))
+    for pair in removed_pairs:
+        touched.update(pair)
+
+    for addition in additions:
+        mappings, _duplicates = collect_mapping_assertions(addition)
+        alignments, _duplicates = collect_alignment_assertions(
+            addition, trust_bare_aligns=True
+        )
+        for item in mappings:
+            touched.update((item.source, item.target))
+        for item in alignments:
+            touched.update(item.pair)
+        for triple in addition:
+            graph.add(triple)
+    return touched
+
+
+def affected_concepts(
+    graph: Graph,
+    hierarchy: HierarchyIndex,
+    touched: set[URIRef],
+    trust_horizontal_input: bool,
+    trust_bare_aligns: bool,
+    assertions: AssertionTable | None = None,
+) -> set[URIRef]:
+    """Return the concepts whose inferences may change after ``touched`` changed.
+
+    Every rule only relates concepts that are connected through asserted exact
+    meanings to the same or hierarchy-related targets, asserted alignments or
+    seed relations. Recomputing the connected components that contain a
+    touched term therefore gives the same result as a full run.
+    """
+    assertions = assertions or AssertionTable(graph)
+    mapping_assertions, _duplicates = assertions.mapping_assertions()
+    alignment_assertions, _duplicates = assertions.alignment_assertions(
+        trust_bare_aligns=trust_bare_aligns
+    )
+    terms = TermDictionary()
+    mapping_keys = [
+        terms.intern_key(item.key) for item in mapping_assertions if item.asserted
+    ]
+    pairs = [
+        terms.intern_pair(*item.pair) for item in alignment_assertions if item.asserted
+    ]
+    if trust_horizontal_input:
+        for predicate in (DEMO.cannotAlign, DEMO.mayAlign, DEMO.partiallyAligns):
+            pairs.extend(
+                terms.intern_pair(left, right)
+                for left, right in direct_pairs(graph, predicate)
+            )
+    partition = dependency_partition(mapping_keys, pairs, hierarchy.ancestor_ids(terms))
+    concept_ids = {source for source, _target, _polarity in mapping_keys}
+    concept_ids.update(concept for pair in pairs for concept in pair)
+
+    roots = {partition.find(terms.ids[term]) for term in touched if term in terms.ids}
+    affected = {
+        terms.term(concept)
+        for concept in concept_ids
+        if partition.find(concept) in roots
     }
-    for triple in list(graph.triples((None, predicate, None))):
-        graph.remove(triple)
-    added = 0
-    for left, right in pairs:
-        if (left, predicate, right) not in initial:
-            added += 1
-        if (right, predicate, left) not in initial:
-            added += 1
-        graph.add((left, predicate, right))
-        graph.add((right, predicate, left))
-    return added
+    return affected | touched
 
 
-def remove_duplicate_nodes(graph: Graph, nodes: Iterable[URIRef]) -> int:
-    count = 0
-    for node in nodes:
-        if (node, None, None) in graph or (None, None, node) in graph:
-            remove_subject(graph, node)
-            count += 1
-    return count
+def existing_nodes(graph: Graph, nodes: Iterable[URIRef]) -> set[URIRef]:
+    return {
+        node
+        for node in nodes
+        if (node, None, None) in graph or (None, None, node) in graph
+    }
 
 
-def rewrite_inferred_mapping_nodes(
-    graph: Graph,
-    mapping_assertions: list[MappingAssertion],
-    inferred_mapping_keys: set[tuple[URIRef, URIRef, URIRef]],
-) -> None:
-    for assertion in mapping_assertions:
-        if assertion.node is not None and not assertion.asserted:
-            remove_subject(graph, assertion.node)
+def horizontal_triples(
+    predicate: URIRef, pairs: Iterable[tuple[URIRef, URIRef]]
+) -> Iterator[tuple[URIRef, URIRef, URIRef]]:
+    for left, right in pairs:
+        yield (left, predicate, right)
+        yield (right, predicate, left)
+
 
-    for source, target, polarity in sorted(
+def inferred_mapping_triples(
+    inferred_mapping_keys: Iterable[tuple[URIRef, URIRef, URIRef]],
+) -> Iterator[tuple[URIRef, URIRef, URIRef]]:
+    keys = sorted(
         inferred_mapping_keys,
         key=lambda item: (str(item[0]), str(item[1]), str(item[2])),
-    ):
-        node = mapping_uri(source, target, polarity)
-        graph.add((node, RDF.type, DEMO.Mapping))
-        graph.add((node, DEMO.source, source))
-        graph.add((node, DEMO.hasMappingSource, source))
-        graph.add((node, DEMO.target, target))
-        graph.add((node, DEMO.hasTargetOntologyConcept, target))
-        graph.add((node, DEMO.hasPolarity, polarity))
-        graph.add((node, DEMO.hasProvenance, DEMO.inferred))
+    )
+    for (source, target, polarity), node in zip(keys, mapping_uris(keys)):
+        yield (node, RDF.type, DEMO.Mapping)
+        yield (node, DEMO.source, source)
+        yield (node, DEMO.hasMappingSource, source)
+        yield (node, DEMO.target, target)
+        yield (node, DEMO.hasTargetOntologyConcept, target)
+        yield (node, DEMO.hasPolarity, polarity)
+        yield (node, DEMO.hasProvenance, DEMO.inferred)
 
 
-def rewrite_inferred_alignment_nodes(
-    graph: Graph,
+def inferred_alignment_triples(
     alignment_assertions: list[AlignmentAssertion],
-    aligns_total: set[tuple[URIRef, URIRef]],
-) -> None:
+    aligns_total: Iterable[tuple[URIRef, URIRef]],
+) -> Iterator[tuple[URIRef, URIRef, URIRef]]:
     asserted_pairs = {item.pair for item in alignment_assertions if item.asserted}
-    for assertion in alignment_assertions:
-        if assertion.node is not None and not assertion.asserted:
-            remove_subject(graph, assertion.node)
-
-    inferred_pairs = aligns_total - asserted_pairs
-    for left, right in sorted(
-        inferred_pairs, key=lambda item: (str(item[0]), str(item[1]))
-    ):
-        node = alignment_uri(left, right)
-        graph.add((node, RDF.type, DEMO.Alignment))
-        graph.add((node, DEMO.source, left))
-        graph.add((node, DEMO.hasAlignmentSource, left))
-        graph.add((node, DEMO.target, right))
-        graph.add((node, DEMO.hasAlignmentTarget, right))
-        graph.add((node, DEMO.hasProvenance, DEMO.inferred))
+    pairs = [pair for pair in aligns_total if pair not in asserted_pairs]
+    for (left, right), node in zip(pairs, alignment_uris(pairs)):
+        yield (node, RDF.type, DEMO.Alignment)
+        yield (node, DEMO.source, left)
+        yield (node, DEMO.hasAlignmentSource, left)
+        yield (node, DEMO.target, right)
+        yield (node, DEMO.hasAlignmentTarget, right)
+        yield (node, DEMO.hasProvenance, DEMO.inferred)
 
 
 def collect_representation_concepts(
@@ -833,75 +1872,959 @@ def collect_representation_concepts(
     return concepts
 
 
-def normalize_consistency(
-    graph: Graph, concepts: set[URIRef], inconsistent_concepts: set[URIRef]
-) -> int:
-    changed = 0
-    final_values = {
-        concept: Literal(concept not in inconsistent_concepts, datatype=XSD.boolean)
-        for concept in concepts
+def build_output_graph(
+    graph: Graph,
+    result: InferenceResult,
+    mapping_assertions: list[MappingAssertion],
+    alignment_assertions: list[AlignmentAssertion],
+    duplicate_nodes: set[URIRef],
+    scope: set[URIRef] | None = None,
+    instrumentation: Instrumentation | None = None,
+) -> tuple[Graph, Counter[str]]:
+    """Build the output graph in one pass instead of rewriting ``graph`` in place.
+
+    Input triples are copied unless they belong to a duplicate or previously
+    inferred node, or are direct horizontal triples that are recomputed. The
+    materialized relations and nodes are then added, and ``isConsistent`` is
+    normalized for every representation concept in ``scope``.
+    """
+    instrumentation = instrumentation or Instrumentation()
+    terms = result.terms
+    dropped_nodes = set(duplicate_nodes)
+    for assertion in [*mapping_assertions, *alignment_assertions]:
+        if assertion.node is not None and not assertion.asserted:
+            dropped_nodes.add(assertion.node)
+    horizontal_predicates = set(HORIZONTAL_PREDS.values())
+
+    output = Graph()
+    for prefix, namespace in graph.namespaces():
+        output.bind(prefix, namespace)
+    existing_consistency: dict[Node, list[Node]] = defaultdict(list)
+    with instrumentation.phase("copy input"):
+        for triple in graph:
+            subject, predicate, obj = triple
+            if subject in dropped_nodes or obj in dropped_nodes:
+                continue
+            if predicate in horizontal_predicates and (
+                scope is None or subject in scope
+            ):
+                continue
+            if predicate == DEMO.isConsistent:
+                existing_consistency[subject].append(obj)
+                continue
+            output.add(triple)
+
+    counters: Counter[str] = Counter()
+    with instrumentation.phase("R1"):
+        for predicate, pairs in (
+            (DEMO.aligns, result.aligns),
+            (DEMO.cannotAlign, result.cannot_align),
+            (DEMO.mayAlign, result.may_align),
+            (DEMO.partiallyAligns, result.partially_aligns),
+        ):
+            for triple in horizontal_triples(predicate, terms.decode_pairs(pairs)):
+                output.add(triple)
+                counters["R1"] += 1
+    with instrumentation.phase("inferred nodes"):
+        for triple in inferred_mapping_triples(
+            terms.decode_key(key) for key in result.inferred_mapping_keys
+        ):
+            output.add(triple)
+        for triple in inferred_alignment_triples(
+            alignment_assertions, terms.decode_pairs(result.aligns)
+        ):
+            output.add(triple)
+
+    concepts = collect_representation_concepts(
+        output, mapping_assertions, alignment_assertions
+    )
+    concepts.update(
+        concept for concept in existing_consistency if isinstance(concept, URIRef)
+    )
+    if scope is not None:
+        concepts &= scope
+    inconsistent = {
+        terms.term(concept)
+        for concept in result.inconsistent_r7 | result.inconsistent_r8
     }
-    for concept in concepts:
-        existing = list(graph.objects(concept, DEMO.isConsistent))
-        wanted = final_values[concept]
-        if len(existing) != 1 or existing[0] != wanted:
-            changed += 1
-        for obj in existing:
-            graph.remove((concept, DEMO.isConsistent, obj))
-        graph.add((concept, DEMO.isConsistent, wanted))
-    return changed
-
-
-def serialize(graph: Graph, path: Path) -> None:
+    with instrumentation.phase("consistency"):
+        for concept in concepts:
+            wanted = Literal(concept not in inconsistent, datatype=XSD.boolean)
+            if existing_consistency.pop(concept, []) != [wanted]:
+                counters["consistency_updates"] += 1
+            output.add((concept, DEMO.isConsistent, wanted))
+        for subject, values in existing_consistency.items():
+            for value in values:
+                output.add((subject, DEMO.isConsistent, value))
+    return output, counters
+
+
+@dataclass(frozen=True)
+class InferenceRun:
+    assertions: AssertionTable
+    scope: set[URIRef] | None
+    result: InferenceResult
+    counters: Counter
+    mapping_assertions: list[MappingAssertion]
+    alignment_assertions: list[AlignmentAssertion]
+
+
+def run_inference(
+    instance_graph: Graph,
+    hierarchy: HierarchyIndex,
+    trust_horizontal_input: bool,
+    trust_bare_aligns: bool,
+    touched: set[URIRef] | None = None,
+    jobs: int = 1,
+    instrumentation: Instrumentation | None = None,
+) -> InferenceRun:
+    """Run the rules over ``instance_graph``, which is not modified.
+
+    ``touched`` holds the terms changed by ``apply_assertion_changes`` in
+    incremental mode; only the components that contain them are recomputed.
+    """
+    instrumentation = instrumentation or Instrumentation()
+    # The graph is not modified from here on, so one assertion table serves
+    # the incremental scope, inference and the duplicate cleanup.
+    with instrumentation.phase("assertions"):
+        assertions = AssertionTable(instance_graph)
+
+    scope = None
+    if touched is not None:
+        with instrumentation.phase("incremental scope"):
+            scope = affected_concepts(
+                instance_graph,
+                hierarchy,
+                touched,
+                trust_horizontal_input=trust_horizontal_input,
+                trust_bare_aligns=trust_bare_aligns,
+                assertions=assertions,
+            )
+
+    with instrumentation.phase("infer"):
+        result, counters, mapping_assertions, alignment_assertions, _cleanup = infer(
+            instance_graph,
+            hierarchy,
+            trust_horizontal_input=trust_horizontal_input,
+            trust_bare_aligns=trust_bare_aligns,
+            scope=scope,
+            jobs=jobs,
+            instrumentation=instrumentation,
+            assertions=assertions,
+        )
+    return InferenceRun(
+        assertions=assertions,
+        scope=scope,
+        result=result,
+        counters=counters,
+        mapping_assertions=mapping_assertions,
+        alignment_assertions=alignment_assertions,
+    )
+
+
+def run_output_graph(
+    instance_graph: Graph,
+    run: InferenceRun,
+    instrumentation: Instrumentation | None = None,
+) -> Graph:
+    """Build the output graph of ``run`` and add its counters to the run's."""
+    instrumentation = instrumentation or Instrumentation()
+    with instrumentation.phase("cleanup"):
+        _mapping_assertions, duplicate_mapping_nodes = (
+            run.assertions.mapping_assertions()
+        )
+        _alignment_assertions, duplicate_alignment_nodes = (
+            run.assertions.alignment_assertions(trust_bare_aligns=True)
+        )
+        duplicate_mapping_nodes = existing_nodes(
+            instance_graph, duplicate_mapping_nodes
+        )
+        duplicate_alignment_nodes = existing_nodes(
+            instance_graph, duplicate_alignment_nodes
+        )
+    run.counters["removed_duplicate_mapping_nodes"] = len(duplicate_mapping_nodes)
+    run.counters["removed_duplicate_alignment_nodes"] = len(duplicate_alignment_nodes)
+
+    with instrumentation.phase("output graph"):
+        output_graph, output_counters = build_output_graph(
+            instance_graph,
+            run.result,
+            run.mapping_assertions,
+            run.alignment_assertions,
+            duplicate_mapping_nodes | duplicate_alignment_nodes,
+            scope=run.scope,
+            instrumentation=instrumentation,
+        )
+    run.counters.update(output_counters)
+    return output_graph
+
+
+def split_output_graph(
+    graph: Graph, owners: dict[Node, int], count: int
+) -> list[Graph]:
+    """Split the output graph into one graph per input file.
+
+    Each subject goes to the input file that owns it (see
+    ``load_instance_graph``), so a subject described in several files is
+    written to the first of them. Mapping and Alignment nodes created by the
+    inference follow their source concept; anything else goes to the first
+    file.
+    """
+    parts = [Graph() for _ in range(count)]
+    for part in parts:
+        for prefix, namespace in graph.namespaces():
+            part.bind(prefix, namespace)
+    subject_index: dict[Node, int] = {}
+    for triple in graph:
+        subject = triple[0]
+        index = subject_index.get(subject)
+        if index is None:
+            index = owners.get(subject)
+            if index is None:
+                source = graph.value(subject, DEMO.hasMappingSource) or graph.value(
+                    subject, DEMO.hasAlignmentSource
+                )
+                index = owners.get(source, 0)
+            subject_index[subject] = index
+        parts[index].add(triple)
+    return parts
+
+
+def nt_term(term: Node) -> str:
+    if isinstance(term, Literal):
+        lexical = (
+            str(term)
+            .replace("\\", "\\\\")
+            .replace('"', '\\"')
+            .replace("\n", "\\n")
+            .replace("\r", "\\r")
+        )
+        if term.language:
+            return f'"{lexical}"@{term.language}'
+        if term.datatype is not None:
+            return f'"{lexical}"^^<{term.datatype}>'
+        return f'"{lexical}"'
+    return term.n3()
+
+
+def subject_blocks(graph: Graph) -> Iterator[tuple[Node, list[tuple[Node, Node]]]]:
+    """Yield each subject with its sorted predicate/object pairs, by N-Triples form.
+
+    Subjects are sorted up front, but the triples of only one subject are held
+    at a time. Concatenating the blocks gives the same order as sorting all
+    N-Triples lines, because no subject term is a prefix of another.
+    """
+    subjects = sorted((nt_term(subject), subject) for subject in set(graph.subjects()))
+    for _key, subject in subjects:
+        pairs = sorted(
+            graph.predicate_objects(subject),
+            key=lambda item: (nt_term(item[0]), nt_term(item[1])),
+        )
+        yield subject, pairs
+
+
+def ntriples_lines(graph: Graph) -> Iterator[str]:
+    for subject, pairs in subject_blocks(graph):
+        for predicate, obj in pairs:
+            yield f"{nt_term(subject)} {nt_term(predicate)} {nt_term(obj)} .\n"
+
+
+def turtle_chunks(graph: Graph) -> Iterator[str]:
+    """Yield a Turtle document one subject block at a time.
+
+    Unlike rdflib's pretty printer this writer does not nest blank nodes or
+    group objects; it only shortens IRIs with the prefixes bound on ``graph``.
+    """
+    prefixes = sorted(
+        ((str(namespace), prefix) for prefix, namespace in graph.namespaces()),
+        key=lambda item: -len(item[0]),
+    )
+
+    def qname(node: Node) -> tuple[str, str] | None:
+        if isinstance(node, URIRef):
+            for namespace, prefix in prefixes:
+                local = node[len(namespace) :]
+                if node.startswith(namespace) and TURTLE_LOCAL_NAME.fullmatch(local):
+                    return prefix, local
+        return None
+
+    def term(node: Node) -> str:
+        name = qname(node)
+        return f"{name[0]}:{name[1]}" if name else nt_term(node)
+
+    # Only declare the prefixes that are used, as rdflib's serializer does.
+    used = {qname(node) for node in {*graph.all_nodes(), *graph.predicates()}}
+    used_prefixes = {name[0] for name in used if name}
+    for namespace, prefix in sorted(prefixes, key=lambda item: item[1]):
+        if prefix in used_prefixes:
+            yield f"@prefix {prefix}: <{namespace}> .\n"
+    for subject, pairs in subject_blocks(graph):
+        lines = [f"    {term(predicate)} {term(obj)}" for predicate, obj in pairs]
+        yield f"\n{term(subject)}\n" + " ;\n".join(lines) + " .\n"
+
+
+def serialize(graph: Graph, path: Path, output_format: str = "turtle") -> None:
     graph.bind("demo", DEMO)
     graph.bind("demoi", DEMOI)
     graph.bind("owl", OWL)
     graph.bind("rdf", RDF)
     graph.bind("rdfs", RDFS)
     graph.bind("xsd", XSD)
-    data = graph.serialize(format="turtle")
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(data, encoding="utf-8")
-
+    if output_format == "turtle":
+        # rdflib writes to the destination as it goes, without building the
+        # whole document as one string first.
+        graph.serialize(destination=path, format="turtle", encoding="utf-8")
+        return
+    lines = ntriples_lines(graph) if output_format == "nt" else turtle_chunks(graph)
+    with path.open("w", encoding="utf-8", newline="\n") as handle:
+        handle.writelines(lines)
+
+
+class ExplanationIndex:
+    """Rule and premises behind the derived facts of one inference run.
+
+    Nothing is recorded while the rules run. The saturated exact meanings are
+    indexed per concept and polarity, and the asserted and R2 ``aligns`` edges
+    per concept; each derived fact is then traced to the first rule instance
+    that produces it with a few set lookups. The index holds one entry per
+    mapping key and per aligns edge, which the result already holds, so its
+    memory stays proportional to the result however many facts are explained.
+
+    Premises point at the Mapping and Alignment nodes of the output graph, and
+    at ``rdfs:subClassOf`` paths for R5a.
+    """
+
+    def __init__(
+        self,
+        result: InferenceResult,
+        hierarchy: HierarchyIndex,
+        mapping_assertions: list[MappingAssertion],
+        alignment_assertions: list[AlignmentAssertion],
+    ) -> None:
+        terms = result.terms
+        self.result = result
+        self.terms = terms
+        self.hierarchy = hierarchy
+        self.positive = terms.intern(DEMO.positive)
+        self.negative = terms.intern(DEMO.negative)
+
+        self.targets: dict[tuple[int, int], set[int]] = defaultdict(set)
+        for source, target, polarity in result.mapping_keys:
+            self.targets[(source, polarity)].add(target)
+        self.asserted_sources: dict[tuple[int, int], set[int]] = defaultdict(set)
+        self.mapping_nodes: dict[tuple[int, int, int], URIRef] = {}
+        for item in mapping_assertions:
+            if not item.asserted:
+                continue
+            key = terms.intern_key(item.key)
+            self.asserted_sources[(key[1], key[2])].add(key[0])
+            if item.node is not None:
+                self.mapping_nodes.setdefault(key, item.node)
+
+        self.alignment_nodes: dict[tuple[int, int], URIRef | None] = {}
+        for item in alignment_assertions:
+            if item.asserted:
+                self.alignment_nodes.setdefault(
+                    terms.intern_pair(*item.pair), item.node
+                )
+        self.edges: dict[int, list[int]] = defaultdict(list)
+        for left, right in set(self.alignment_nodes) | result.inferred_aligns_r2:
+            self.edges[left].append(right)
+            self.edges[right].append(left)
+        for neighbours in self.edges.values():
+            neighbours.sort()
+        self._tree_root: int | None = None
+        self._tree: dict[int, int] = {}
+
+    def first(self, ids: Iterable[int]) -> int | None:
+        return min(ids, key=lambda term_id: str(self.terms.term(term_id)), default=None)
+
+    def aligns_tree(self, root: int) -> dict[int, int]:
+        """Breadth-first parents of the aligns edges reachable from ``root``.
+
+        Only the last tree is kept; callers that explain many pairs visit them
+        grouped by their first concept.
+        """
+        if self._tree_root != root:
+            tree = {root: root}
+            agenda = [root]
+            for current in agenda:
+                for neighbour in self.edges.get(current, ()):
+                    if neighbour not in tree:
+                        tree[neighbour] = current
+                        agenda.append(neighbour)
+            self._tree_root = root
+            self._tree = tree
+        return self._tree
+
+    def mapping_premise(self, key: tuple[int, int, int]) -> dict[str, object]:
+        source, target, polarity = self.terms.decode_key(key)
+        node = self.mapping_nodes.get(key) or mapping_uri(source, target, polarity)
+        return {
+            "mapping": str(node),
+            "source": str(source),
+            "target": str(target),
+            "polarity": str(polarity),
+        }
+
+    def alignment_premise(self, left: int, right: int) -> dict[str, object]:
+        pair = id_pair(left, right)
+        source, target = self.terms.decode_pair(pair)
+        if pair in self.alignment_nodes:
+            node = self.alignment_nodes[pair]
+        else:
+            node = alignment_uri(source, target)
+        return {
+            "alignment": str(node) if node is not None else None,
+            "source": str(source),
+            "target": str(target),
+        }
+
+    def fact(
+        self,
+        pair: tuple[int, int],
+        predicate: str,
+        rule: str,
+        premises: list[dict[str, object]],
+    ) -> dict[str, object]:
+        left, right = self.terms.decode_pair(pair)
+        return {
+            "subject": str(left),
+            "predicate": predicate,
+            "object": str(right),
+            "rule": rule,
+            "premises": premises,
+        }
+
+    def explain_aligns(self, pair: tuple[int, int]) -> dict[str, object]:
+        left, right = pair
+        if pair in self.alignment_nodes:
+            return self.fact(pair, "aligns", "asserted", [])
+        if pair in self.result.inferred_aligns_r2:
+            target = self.first(
+                self.targets[(left, self.positive)]
+                & self.targets[(right, self.positive)]
+            )
+            return self.fact(
+                pair,
+                "aligns",
+                "R2",
+                [
+                    self.mapping_premise((left, target, self.positive)),
+                    self.mapping_premise((right, target, self.positive)),
+                ],
+            )
+        via = self.aligns_tree(left)[right]
+        return self.fact(
+            pair,
+            "aligns",
+            "R1a",
+            [self.alignment_premise(left, via), self.alignment_premise(via, right)],
+        )
 
-def print_inconsistencies(result: InferenceResult) -> None:
-    if result.inconsistent_r7:
-        print(f"R7 inconsistent concepts: {len(result.inconsistent_r7)}")
-        for concept in sorted(result.inconsistent_r7, key=str):
-            print(f"- R7: {concept.n3()}")
-    else:
-        print("R7 inconsistent concepts: 0")
+    def explain_mapping(self, key: tuple[int, int, int]) -> dict[str, object]:
+        source, target, polarity = key
+        decoded = self.terms.decode_key(key)
+        fact = {
+            "subject": str(decoded[0]),
+            "predicate": "exactMeaning",
+            "object": str(decoded[1]),
+            "polarity": str(decoded[2]),
+        }
+        holders = self.asserted_sources[(target, polarity)]
+        if source in holders:
+            return {**fact, "rule": "asserted", "premises": []}
+        holder = self.first(
+            other for other in holders if self.result.aligns.aligned(source, other)
+        )
+        return {
+            **fact,
+            "rule": "R6",
+            "premises": [
+                self.alignment_premise(source, holder),
+                self.mapping_premise((holder, target, polarity)),
+            ],
+        }
+
+    def opposite_meanings(
+        self, pair: tuple[int, int]
+    ) -> list[dict[str, object]] | None:
+        for left, right in (pair, pair[::-1]):
+            target = self.first(
+                self.targets[(left, self.positive)]
+                & self.targets[(right, self.negative)]
+            )
+            if target is not None:
+                return [
+                    self.mapping_premise((left, target, self.positive)),
+                    self.mapping_premise((right, target, self.negative)),
+                ]
+        return None
+
+    def explain_cannot(self, pair: tuple[int, int]) -> dict[str, object]:
+        if pair not in self.result.inferred_cannot_align:
+            return self.fact(pair, "cannotAlign", "seed", [])
+        return self.fact(pair, "cannotAlign", "R3", self.opposite_meanings(pair))
+
+    def explain_may(self, pair: tuple[int, int]) -> dict[str, object]:
+        if pair not in self.result.inferred_may_align:
+            return self.fact(pair, "mayAlign", "seed", [])
+        left, right = pair
+        target = self.first(
+            self.targets[(left, self.negative)] & self.targets[(right, self.negative)]
+        )
+        return self.fact(
+            pair,
+            "mayAlign",
+            "R4a+R4b",
+            [
+                self.mapping_premise((left, target, self.negative)),
+                self.mapping_premise((right, target, self.negative)),
+            ],
+        )
 
-    if result.inconsistent_r8:
-        print(f"R8 inconsistent concepts: {len(result.inconsistent_r8)}")
-        for concept in sorted(result.inconsistent_r8, key=str):
-            print(f"- R8: {concept.n3()}")
-    else:
-        print("R8 inconsistent concepts: 0")
+    def explain_partial(self, pair: tuple[int, int]) -> dict[str, object]:
+        if pair not in self.result.inferred_partially_aligns:
+            return self.fact(pair, "partiallyAligns", "seed", [])
+        left, right = pair
+        terms = self.terms
+        for left_target in sorted(
+            self.targets[(left, self.positive)], key=lambda item: str(terms.term(item))
+        ):
+            for right_target in sorted(
+                self.targets[(right, self.positive)],
+                key=lambda item: str(terms.term(item)),
+            ):
+                child, parent = terms.term(left_target), terms.term(right_target)
+                if not self.hierarchy.related(child, parent):
+                    continue
+                if child in self.hierarchy.superclasses(parent):
+                    child, parent = parent, child
+                return self.fact(
+                    pair,
+                    "partiallyAligns",
+                    "R5a+R5b",
+                    [
+                        self.mapping_premise((left, left_target, self.positive)),
+                        self.mapping_premise((right, right_target, self.positive)),
+                        {"subClassOf": [str(child), str(parent)]},
+                    ],
+                )
+        return self.fact(pair, "partiallyAligns", "R5a+R5b", [])
+
+    def explain_inconsistency(self, rule: str, concept: int) -> dict[str, object]:
+        positive = self.targets[(concept, self.positive)]
+        if rule == "R7":
+            targets = sorted(positive, key=lambda item: str(self.terms.term(item)))[:2]
+            premises = [
+                self.mapping_premise((concept, target, self.positive))
+                for target in targets
+            ]
+        else:
+            premises = self.opposite_meanings((concept, concept)) or []
+        return {
+            "subject": str(self.terms.term(concept)),
+            "predicate": "isConsistent",
+            "object": False,
+            "rule": rule,
+            "premises": premises,
+        }
+
+    def explain_conflict(self, conflict: HorizontalConflict) -> dict[str, object]:
+        pair = self.terms.intern_pair(*conflict.pair)
+        explainers = {
+            "aligns": self.explain_aligns,
+            "cannotAlign": self.explain_cannot,
+            "mayAlign": self.explain_may,
+            "partiallyAligns": self.explain_partial,
+        }
+        return {
+            "conflict": [str(term) for term in conflict.pair],
+            "relations": list(conflict.relations),
+            "explanations": [
+                explainers[relation](pair) for relation in conflict.relations
+            ],
+        }
+
+    def records(self, explain_all: bool = False) -> Iterator[dict[str, object]]:
+        """Explanations of the R7/R8 flags and conflicts, then of every
+        inferred fact when ``explain_all`` is set."""
+        result = self.result
+        terms = self.terms
+
+        def by_term(items: Iterable[int]) -> list[int]:
+            return sorted(items, key=lambda item: str(terms.term(item)))
+
+        def by_pair(items: Iterable[tuple[int, int]]) -> list[tuple[int, int]]:
+            return sorted(
+                items, key=lambda pair: tuple(map(str, terms.decode_pair(pair)))
+            )
 
-    if result.conflicts:
-        print(f"Horizontal classification conflicts: {len(result.conflicts)}")
+        for concept in by_term(result.inconsistent_r7):
+            yield self.explain_inconsistency("R7", concept)
+        for concept in by_term(result.inconsistent_r8):
+            yield self.explain_inconsistency("R8", concept)
         for conflict in result.conflicts:
-            print(f"- {conflict.render()}")
-    else:
-        print("Horizontal classification conflicts: 0")
+            yield self.explain_conflict(conflict)
+        if not explain_all:
+            return
+
+        for key in sorted(
+            result.inferred_mapping_keys,
+            key=lambda key: tuple(map(str, terms.decode_key(key))),
+        ):
+            yield self.explain_mapping(key)
+        for pair in by_pair(result.inferred_aligns_r2):
+            yield self.explain_aligns(pair)
+        for members in result.aligns.components():
+            for i, left in enumerate(members):
+                for right in members[i + 1 :]:
+                    pair = (left, right)
+                    if (
+                        pair not in self.alignment_nodes
+                        and pair not in result.inferred_aligns_r2
+                    ):
+                        yield self.explain_aligns(pair)
+        for pair in by_pair(result.inferred_cannot_align):
+            yield self.explain_cannot(pair)
+        for pair in by_pair(result.inferred_may_align):
+            yield self.explain_may(pair)
+        for pair in by_pair(result.inferred_partially_aligns):
+            yield self.explain_partial(pair)
+
+    def write_jsonl(self, path: Path, explain_all: bool = False) -> int:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        count = 0
+        with path.open("w", encoding="utf-8") as handle:
+            for record in self.records(explain_all):
+                handle.write(json.dumps(record, ensure_ascii=False))
+                handle.write("\n")
+                count += 1
+        return count
+
+
+def render_premise(premise: dict[str, object]) -> str:
+    if "subClassOf" in premise:
+        child, parent = premise["subClassOf"]
+        return f"<{child}> rdfs:subClassOf+ <{parent}>"
+    if "mapping" in premise:
+        polarity = (
+            "negative" if premise["polarity"] == str(DEMO.negative) else "positive"
+        )
+        return f"<{premise['source']}> exactMeaning ({polarity}) <{premise['target']}>"
+    return f"<{premise['source']}> aligns <{premise['target']}>"
+
+
+def explanation_lines(record: dict[str, object]) -> Iterator[str]:
+    for item in record.get("explanations", [record]):
+        if "conflict" in record:
+            yield f"  {item['predicate']} by {item['rule']}"
+        for premise in item["premises"]:
+            yield f"    because {render_premise(premise)}"
+
+
+def print_inference_summary(counters: Counter) -> None:
+    print("Inference summary:")
+    for rule_id in [
+        "R1",
+        "R1a",
+        "R2",
+        "R3",
+        "R4a",
+        "R4b",
+        "R5a",
+        "R5b",
+        "R6",
+        "R7",
+        "R8",
+    ]:
+        print(f"- {rule_id}: {counters.get(rule_id, 0)}")
+    print(f"- consistency normalizations: {counters.get('consistency_updates', 0)}")
+    print(
+        f"- duplicate Mapping nodes removed: {counters.get('removed_duplicate_mapping_nodes', 0)}"
+    )
+    print(
+        f"- duplicate Alignment nodes removed: {counters.get('removed_duplicate_alignment_nodes', 0)}"
+    )
+
+
+def print_inconsistencies(
+    result: InferenceResult, explanations: ExplanationIndex | None = None
+) -> None:
+    terms = result.terms
+    for rule_id, concepts in (
+        ("R7", result.inconsistent_r7),
+        ("R8", result.inconsistent_r8),
+    ):
+        print(f"{rule_id} inconsistent concepts: {len(concepts)}")
+        for concept in sorted(concepts, key=lambda item: str(terms.term(item))):
+            print(f"- {rule_id}: {terms.term(concept).n3()}")
+            if explanations is not None:
+                record = explanations.explain_inconsistency(rule_id, concept)
+                for line in explanation_lines(record):
+                    print(line)
+
+    print(f"Horizontal classification conflicts: {len(result.conflicts)}")
+    for conflict in result.conflicts:
+        print(f"- {conflict.render()}")
+        if explanations is not None:
+            for line in explanation_lines(explanations.explain_conflict(conflict)):
+                print(line)
+
+
+class InferenceService:
+    """Warm inference state for ``--serve``.
+
+    The hierarchy is loaded once and the current graph always holds a complete
+    inference output, so each update is an incremental run over it: the rules
+    are only evaluated for the components touched by the change. The rest of
+    an update still costs time in proportion to the whole graph: the change is
+    applied to a copy of the graph, the assertion table scans all of it, and
+    the output graph copies every triple. The copy makes updates
+    transactional: it replaces the current graph only once the run succeeded.
+    Requests are handled one at a time, so updates never overlap.
+    """
+
+    def __init__(
+        self,
+        graph: Graph,
+        hierarchy: HierarchyIndex,
+        trust_horizontal_input: bool,
+        trust_bare_aligns: bool,
+        output_paths: list[Path],
+        output_format: str = "turtle",
+        owners: dict[Node, int] | None = None,
+        jobs: int = 1,
+    ) -> None:
+        self.graph = graph
+        self.hierarchy = hierarchy
+        self.trust_horizontal_input = trust_horizontal_input
+        self.trust_bare_aligns = trust_bare_aligns
+        self.output_paths = output_paths
+        self.output_format = output_format
+        self.owners = owners or {}
+        self.jobs = jobs
+        self.updates = 0
+
+    def run(
+        self, graph: Graph | None = None, touched: set[URIRef] | None = None
+    ) -> dict[str, object]:
+        """Run the rules over ``graph``, by default the current graph.
+
+        The output graph becomes the current graph only after the whole run,
+        report included, succeeded.
+        """
+        started = time.perf_counter()
+        graph = self.graph if graph is None else graph
+        run = run_inference(
+            graph,
+            self.hierarchy,
+            trust_horizontal_input=self.trust_horizontal_input,
+            trust_bare_aligns=self.trust_bare_aligns,
+            touched=touched,
+            jobs=self.jobs,
+        )
+        output_graph = run_output_graph(graph, run)
+        result = run.result
+        terms = result.terms
+        explanations = ExplanationIndex(
+            result, self.hierarchy, run.mapping_assertions, run.alignment_assertions
+        )
+        report = {
+            "affected_terms": len(run.scope) if run.scope is not None else None,
+            "counters": dict(sorted(run.counters.items())),
+            "inconsistent": {
+                "R7": sorted(str(terms.term(item)) for item in result.inconsistent_r7),
+                "R8": sorted(str(terms.term(item)) for item in result.inconsistent_r8),
+            },
+            "conflicts": [
+                {
+                    "pair": [str(term) for term in conflict.pair],
+                    "relations": list(conflict.relations),
+                }
+                for conflict in result.conflicts
+            ],
+            "explanations": list(explanations.records()),
+        }
+        self.graph = output_graph
+        report["seconds"] = round(time.perf_counter() - started, 6)
+        return report
+
+    def update(self, additions: Graph, removals: Graph) -> dict[str, object]:
+        graph = Graph()
+        for prefix, namespace in self.graph.namespaces():
+            graph.bind(prefix, namespace)
+        graph.addN((*triple, graph) for triple in self.graph)
+        touched = apply_assertion_changes(graph, [additions], [removals])
+        report = self.run(graph, touched)
+        self.updates += 1
+        return report
+
+    def state(self) -> dict[str, object]:
+        inconsistent = self.graph.subjects(
+            DEMO.isConsistent, Literal(False, datatype=XSD.boolean)
+        )
+        return {
+            "triples": len(self.graph),
+            "updates": self.updates,
+            "inconsistent": sorted(str(concept) for concept in inconsistent),
+        }
+
+    def save(self) -> list[str]:
+        if len(self.output_paths) > 1:
+            parts = split_output_graph(self.graph, self.owners, len(self.output_paths))
+        else:
+            parts = [self.graph]
+        for part, path in zip(parts, self.output_paths):
+            serialize(part, path, self.output_format)
+        return [str(path) for path in self.output_paths]
+
+
+class InferenceRequestHandler(BaseHTTPRequestHandler):
+    """HTTP front end of an ``InferenceService``, set as ``server.service``.
+
+    - ``GET /state``: size of the current graph and its inconsistent concepts.
+    - ``GET /graph``: the current graph as Turtle, or N-Triples with
+      ``?format=nt``.
+    - ``POST /update``: a JSON object with optional ``add`` and ``remove``
+      Turtle documents; applies them and returns the rule counters,
+      inconsistencies, conflicts and explanations of the recomputed
+      components.
+    - ``POST /save``: writes the current graph to the output file(s).
+    """
+
+    def send_body(self, status: int, body: bytes, content_type: str) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_json(self, status: int, payload: object) -> None:
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_body(status, body, "application/json; charset=utf-8")
+
+    def do_GET(self) -> None:
+        service: InferenceService = self.server.service
+        url = urlsplit(self.path)
+        if url.path == "/state":
+            self.send_json(200, service.state())
+        elif url.path == "/graph":
+            if parse_qs(url.query).get("format") == ["nt"]:
+                body = "".join(ntriples_lines(service.graph))
+                self.send_body(200, body.encode("utf-8"), "application/n-triples")
+            else:
+                body = service.graph.serialize(format="turtle")
+                self.send_body(200, body.encode("utf-8"), "text/turtle; charset=utf-8")
+        else:
+            self.send_json(404, {"error": f"Unknown path: {url.path}"})
+
+    def do_POST(self) -> None:
+        service: InferenceService = self.server.service
+        url = urlsplit(self.path)
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length)
+        if url.path == "/save":
+            try:
+                written = service.save()
+            except Exception as exc:  # noqa: BLE001
+                # Any failure must reach the client as a response; an
+                # exception escaping the handler drops the connection.
+                self.send_json(500, {"error": f"Save failed: {exc}"})
+                return
+            self.send_json(200, {"written": written})
+            return
+        if url.path != "/update":
+            self.send_json(404, {"error": f"Unknown path: {url.path}"})
+            return
+        try:
+            payload = json.loads(body or b"{}")
+            if not isinstance(payload, dict):
+                raise ValueError("the body must be a JSON object")
+            documents = [payload.get(key) or "" for key in ("add", "remove")]
+            if not all(isinstance(document, str) for document in documents):
+                raise ValueError("'add' and 'remove' must be Turtle strings")
+            additions, removals = (
+                Graph().parse(data=document, format="turtle") for document in documents
+            )
+        except (IndexError, SyntaxError, ValueError) as exc:
+            # rdflib raises SyntaxError (BadSyntax) for invalid Turtle and
+            # IndexError for some truncated documents.
+            self.send_json(400, {"error": f"Invalid update request: {exc}"})
+            return
+        try:
+            report = service.update(additions, removals)
+        except Exception as exc:  # noqa: BLE001
+            # The update runs on a copy, so the state is unchanged whatever
+            # failed, including a worker pool with --jobs.
+            self.send_json(500, {"error": f"Update failed: {exc}"})
+            return
+        self.send_json(200, report)
+
+
+def parse_serve_address(value: str) -> tuple[str, int]:
+    host, _, port = value.rpartition(":")
+    return host or "127.0.0.1", int(port)
+
+
+def serve(service: InferenceService, address: tuple[str, int]) -> None:
+    server = HTTPServer(address, InferenceRequestHandler)
+    server.service = service
+    host, port = server.server_address[:2]
+    print(f"Serving inference on http://{host}:{port}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
 
 
 def main() -> int:
-    args = parse_args()
+    parser = build_parser()
+    args = parser.parse_args()
 
     script_dir = Path(__file__).resolve().parent
     input_dir = script_dir.parent / "inputs"
 
-    input_path = (
-        Path(args.input).expanduser().resolve()
-        if args.input
-        else (input_dir / "instances.ttl").resolve()
-    )
-    default_output = input_path.with_name(f"{input_path.stem}_extended.ttl")
-    output_path = (
-        Path(args.output).expanduser().resolve() if args.output else default_output
-    )
+    incremental = bool(args.add_assertions or args.remove_assertions)
+    extension = "nt" if args.output_format == "nt" else "ttl"
+    try:
+        input_paths = instance_files(args.input, input_dir / "instances.ttl")
+    except ValueError as exc:
+        parser.error(str(exc))
+    if args.split_output:
+        try:
+            output_paths = split_output_paths(
+                input_paths, args.output, incremental, extension
+            )
+        except ValueError as exc:
+            parser.error(str(exc))
+    elif args.output:
+        output_path = Path(args.output).expanduser().resolve()
+    elif len(input_paths) > 1:
+        parser.error(
+            "--output is required when several input files are merged; "
+            "use --split-output to write one output file per input."
+        )
+    elif incremental:
+        output_path = input_paths[0]
+    else:
+        output_path = input_paths[0].with_name(
+            f"{input_paths[0].stem}_extended.{extension}"
+        )
+
+    if args.serve and incremental:
+        parser.error(
+            "--serve cannot be combined with --add-assertions or "
+            "--remove-assertions; post the changes to /update instead."
+        )
+    if args.serve and args.fail_on_horizontal_conflicts:
+        parser.error(
+            "--serve reports conflicts in its responses and cannot refuse them; "
+            "drop --fail-on-horizontal-conflicts."
+        )
 
     ontology_inputs = [
         str(Path(path).expanduser().resolve()) for path in args.ontology_input
@@ -911,17 +2834,75 @@ def main() -> int:
         if default_ontology_path.is_file():
             ontology_inputs.append(str(default_ontology_path))
 
-    instance_graph = Graph()
-    instance_graph.parse(input_path)
+    cache_dir = None
+    if not args.no_hierarchy_cache:
+        cache_dir = (
+            Path(args.hierarchy_cache_dir).expanduser().resolve()
+            if args.hierarchy_cache_dir
+            else (script_dir.parent / ".cache" / "hierarchy").resolve()
+        )
 
-    hierarchy_graph = load_hierarchy_graph(instance_graph, ontology_inputs)
+    instrumentation = Instrumentation()
+    with instrumentation.phase("parse"):
+        instance_graph, owners = load_instance_graph(
+            input_paths, track_owners=args.split_output
+        )
 
-    result, counters, mapping_assertions, alignment_assertions, _cleanup = infer(
+    with instrumentation.phase("hierarchy"):
+        hierarchy = load_hierarchy(instance_graph, ontology_inputs, cache_dir)
+
+    if args.serve:
+        service = InferenceService(
+            instance_graph,
+            hierarchy,
+            trust_horizontal_input=args.trust_horizontal_input,
+            trust_bare_aligns=args.trust_bare_aligns,
+            output_paths=output_paths if args.split_output else [output_path],
+            output_format=args.output_format,
+            owners=owners,
+            jobs=args.jobs,
+        )
+        report = service.run()
+        print(
+            f"Initial inference: {len(service.graph)} triples, "
+            f"{len(report['conflicts'])} conflicts, "
+            f"{len(report['inconsistent']['R7']) + len(report['inconsistent']['R8'])} "
+            "inconsistency flags"
+        )
+        serve(service, parse_serve_address(args.serve))
+        return 0
+
+    touched: set[URIRef] | None = None
+    if incremental:
+        with instrumentation.phase("apply changes"):
+            touched = apply_assertion_changes(
+                instance_graph,
+                additions=[Graph().parse(path) for path in args.add_assertions],
+                removals=[Graph().parse(path) for path in args.remove_assertions],
+            )
+
+    run = run_inference(
         instance_graph,
-        hierarchy_graph,
+        hierarchy,
         trust_horizontal_input=args.trust_horizontal_input,
         trust_bare_aligns=args.trust_bare_aligns,
+        touched=touched,
+        jobs=args.jobs,
+        instrumentation=instrumentation,
     )
+    result, counters, scope = run.result, run.counters, run.scope
+
+    explanations = None
+    explain_path = None
+    if args.explain_output:
+        explain_path = Path(args.explain_output).expanduser().resolve()
+        with instrumentation.phase("explain"):
+            explanations = ExplanationIndex(
+                result, hierarchy, run.mapping_assertions, run.alignment_assertions
+            )
+            counters["explanations"] = explanations.write_jsonl(
+                explain_path, explain_all=args.explain_all
+            )
 
     if result.conflicts:
         if args.fail_on_horizontal_conflicts:
@@ -932,94 +2913,66 @@ def main() -> int:
             if args.print_inconsistencies:
                 for conflict in result.conflicts:
                     print(f"- {conflict.render()}", file=sys.stderr)
+                    if explanations is not None:
+                        for line in explanation_lines(
+                            explanations.explain_conflict(conflict)
+                        ):
+                            print(line, file=sys.stderr)
             print(
                 "Refusing to write an invalid final classification state.",
                 file=sys.stderr,
             )
+            # The refused run is the one whose timings are wanted most.
+            if args.metrics_output:
+                instrumentation.write_json(
+                    Path(args.metrics_output).expanduser().resolve(), counters
+                )
             return 2
 
-    # Refresh collections after inference for cleanup/rematerialization.
-    _mapping_assertions2, duplicate_mapping_nodes = collect_mapping_assertions(
-        instance_graph
-    )
-    _alignment_assertions2, duplicate_alignment_nodes = collect_alignment_assertions(
-        instance_graph,
-        trust_bare_aligns=True,
-    )
-    counters["removed_duplicate_mapping_nodes"] = remove_duplicate_nodes(
-        instance_graph, duplicate_mapping_nodes
-    )
-    counters["removed_duplicate_alignment_nodes"] = remove_duplicate_nodes(
-        instance_graph, duplicate_alignment_nodes
-    )
-
-    counters["R1"] = 0
-    counters["R1"] += rewrite_direct_horizontal(
-        instance_graph, DEMO.aligns, result.aligns
-    )
-    counters["R1"] += rewrite_direct_horizontal(
-        instance_graph, DEMO.cannotAlign, result.cannot_align
-    )
-    counters["R1"] += rewrite_direct_horizontal(
-        instance_graph, DEMO.mayAlign, result.may_align
-    )
-    counters["R1"] += rewrite_direct_horizontal(
-        instance_graph, DEMO.partiallyAligns, result.partially_aligns
-    )
-    rewrite_inferred_mapping_nodes(
-        instance_graph, mapping_assertions, result.inferred_mapping_keys
-    )
-    rewrite_inferred_alignment_nodes(
-        instance_graph, alignment_assertions, result.aligns
-    )
-
-    representation_concepts = collect_representation_concepts(
-        instance_graph,
-        mapping_assertions,
-        alignment_assertions,
-    )
-    counters["consistency_updates"] = normalize_consistency(
-        instance_graph,
-        representation_concepts,
-        result.inconsistent_r7 | result.inconsistent_r8,
-    )
-
-    serialize(instance_graph, output_path)
+    output_graph = run_output_graph(instance_graph, run, instrumentation)
+
+    with instrumentation.phase("serialize"):
+        if args.split_output:
+            parts = split_output_graph(output_graph, owners, len(input_paths))
+            for part, path in zip(parts, output_paths):
+                serialize(part, path, args.output_format)
+        else:
+            serialize(output_graph, output_path, args.output_format)
+    if args.metrics_output:
+        instrumentation.write_json(
+            Path(args.metrics_output).expanduser().resolve(), counters
+        )
 
-    print(f"Updated graph written to: {output_path}")
+    if args.split_output:
+        print(f"Updated graphs written: {len(output_paths)}")
+        for path in output_paths:
+            print(f"- {path}")
+    else:
+        print(f"Updated graph written to: {output_path}")
+    if len(input_paths) > 1:
+        print(f"Instance files loaded: {len(input_paths)}")
+    if scope is not None:
+        print(f"Incremental update: {len(scope)} affected terms recomputed")
     if ontology_inputs:
         print(f"Ontology support files loaded: {len(ontology_inputs)}")
         for ontology_path in ontology_inputs:
             print(f"- {ontology_path}")
     else:
         print("Ontology support files loaded: 0")
-    print("Inference summary:")
-    for rule_id in [
-        "R1",
-        "R1a",
-        "R2",
-        "R3",
-        "R4a",
-        "R4b",
-        "R5a",
-        "R5b",
-        "R6",
-        "R7",
-        "R8",
-    ]:
-        print(f"- {rule_id}: {counters.get(rule_id, 0)}")
-    print(f"- consistency normalizations: {counters.get('consistency_updates', 0)}")
-    print(
-        f"- duplicate Mapping nodes removed: {counters.get('removed_duplicate_mapping_nodes', 0)}"
-    )
-    print(
-        f"- duplicate Alignment nodes removed: {counters.get('removed_duplicate_alignment_nodes', 0)}"
-    )
+    print_inference_summary(counters)
 
     print(f"Final classification conflicts detected: {len(result.conflicts)}")
+    if explain_path is not None:
+        print(
+            f"Explanations written to: {explain_path} ({counters['explanations']} records)"
+        )
+    if args.metrics_output:
+        print(
+            f"Run metrics written to: {Path(args.metrics_output).expanduser().resolve()}"
+        )
 
     if args.print_inconsistencies:
-        print_inconsistencies(result)
+        print_inconsistencies(result, explanations)
 
     return 0
 
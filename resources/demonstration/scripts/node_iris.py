@@ -0,0 +1,49 @@
+"""Digest-based IRIs of the reified Mapping and Alignment nodes.
+
+``create_instances.py`` and ``infer_rules.py`` name these nodes after the
+SHA-256 of their key, so the same key always gives the same IRI, in either
+script and on every run. Both mint them through ``NodeIriMinter``, which keeps
+the IRIs already minted and hashes a batch of keys in one loop.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Iterable
+
+from rdflib import URIRef
+
+
+class NodeIriMinter:
+    """Digest-based node IRIs, memoized per key in a bounded cache.
+
+    A key is a tuple of strings (terms included). Its IRI is the prefix
+    followed by the first 16 hex digits of the SHA-256 of the parts, each
+    part followed by ``\\x1f``. The cache is emptied whenever it reaches
+    ``max_size`` keys, which bounds it in the ``infer_rules.py --serve``
+    service.
+    """
+
+    def __init__(self, prefix: str, max_size: int = 1 << 16) -> None:
+        self.prefix = prefix
+        self.max_size = max_size
+        self.cache: dict[tuple[str, ...], URIRef] = {}
+
+    def mint(self, *parts: str) -> URIRef:
+        return self.mint_many([parts])[0]
+
+    def mint_many(self, keys: Iterable[tuple[str, ...]]) -> list[URIRef]:
+        cache = self.cache
+        prefix = self.prefix
+        sha256 = hashlib.sha256
+        iris = []
+        for parts in keys:
+            iri = cache.get(parts)
+            if iri is None:
+                if len(cache) >= self.max_size:
+                    cache.clear()
+                data = "\x1f".join(parts) + "\x1f"
+                iri = URIRef(prefix + sha256(data.encode("utf-8")).hexdigest()[:16])
+                cache[parts] = iri
+            iris.append(iri)
+        return iris
@@ -11,31 +11,67 @@ Example:
 
 This will create:
     query-output.csv
+
+``--input`` may be repeated or name a directory, whose ``.rq`` files are all
+run. The graphs are then loaded once, every query is parsed against them
+before any is run, and one CSV is written per query, followed by a timing
+summary. With ``--threads`` the queries run in a thread pool over the shared
+graph, which is not modified once loaded. rdflib evaluates queries in Python
+under the GIL, so the threads mainly overlap writing the result files.
+
+Each graph file is cached in a binary snapshot under ../.cache/graphs, named
+after the SHA-256 of the file. The snapshot stores every distinct term once
+and the triples as integer ids, so later runs over an unchanged file skip the
+Turtle parser and only rebuild the in-memory graph. A changed file gets a new
+hash and is parsed again, and its older snapshot is deleted. The query still
+runs, without a snapshot, when the cache folder cannot be written.
 """
 
 from __future__ import annotations
 
 import argparse
 import csv
+import hashlib
+import json
+import os
+import struct
 import sys
+import tempfile
+import time
+import zlib
+from array import array
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from rdflib import BNode, Graph, Literal, URIRef
+from rdflib.plugins.sparql import prepareQuery
+from rdflib.plugins.sparql.sparql import Query
+from rdflib.term import Node
+
+GRAPH_SNAPSHOT_MAGIC = b"HRIGRPH1"
 
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
-        description="Run a SPARQL SELECT query over the demo TTL files and export the result to CSV."
+        description="Run SPARQL SELECT queries over the demo TTL files and export each result to CSV."
     )
     parser.add_argument(
         "--input",
+        action="append",
         required=True,
-        help="Path to the file containing the SPARQL query to execute.",
+        help=(
+            "Path to the file containing the SPARQL query to execute, or a directory "
+            "whose .rq files are all executed. May be repeated; the graphs are "
+            "loaded once for all queries."
+        ),
     )
     parser.add_argument(
         "--output",
         default=None,
-        help="Path to the output CSV file. Default: ../outputs/<input-stem>-output.csv relative to this script.",
+        help=(
+            "Path to the output CSV file, or the output folder when several queries "
+            "are run. Default: ../outputs/<input-stem>-output.csv relative to this script."
+        ),
     )
     parser.add_argument(
         "--schema",
@@ -52,6 +88,32 @@ def parse_args() -> argparse.Namespace:
         default=None,
         help="Path to instances_extended.ttl. Default: ../inputs/instances_extended.ttl relative to this script.",
     )
+    parser.add_argument(
+        "--graph-cache-dir",
+        default=None,
+        help=(
+            "Folder for the parsed snapshots of the graph files, keyed by file "
+            "hash. Default: ../.cache/graphs relative to this script."
+        ),
+    )
+    parser.add_argument(
+        "--no-graph-cache",
+        action="store_true",
+        help="Always parse the graph files and do not read or write snapshots.",
+    )
+    parser.add_argument(
+        "--threads",
+        type=int,
+        default=1,
+        help=(
+            "Number of threads that run the queries over the shared graph (default: 1)."
+        ),
+    )
+    parser.add_argument(
+        "--timings-output",
+        default=None,
+        help="Write the load time and the rows and time of every query to this CSV file.",
+    )
     return parser.parse_args()
 
 
@@ -70,6 +132,23 @@ def resolve_existing_file(
     return path
 
 
+def query_files(inputs: list[str]) -> list[Path]:
+    """Expand ``--input`` values, reading the ``.rq`` files of directories."""
+    paths: list[Path] = []
+    for value in inputs:
+        path = Path(value).expanduser().resolve()
+        if not path.is_dir():
+            paths.append(resolve_existing_file(value))
+            continue
+        found = sorted(
+            item for item in path.iterdir() if item.is_file() and item.suffix == ".rq"
+        )
+        if not found:
+            raise ValueError(f"No query files found in directory: {path}")
+        paths.extend(found)
+    return paths
+
+
 def resolve_output_path(
     output_str: str | None, query_path: Path, output_dir: Path
 ) -> Path:
@@ -78,10 +157,169 @@ def resolve_output_path(
     return (output_dir / f"{query_path.stem}-output.csv").resolve()
 
 
-def load_graph(paths: list[Path]) -> Graph:
+def resolve_output_paths(
+    output_str: str | None, query_paths: list[Path], output_dir: Path, batch: bool
+) -> list[Path]:
+    """Output CSV of each query; in a batch ``output_str`` names a folder."""
+    if not batch:
+        return [resolve_output_path(output_str, query_paths[0], output_dir)]
+    if output_str:
+        output_dir = Path(output_str).expanduser().resolve()
+    paths = [resolve_output_path(None, path, output_dir) for path in query_paths]
+    if len(set(paths)) < len(paths):
+        raise ValueError(
+            "Several query files share a name and would be written to the same "
+            "output file; rename them or split the run."
+        )
+    return paths
+
+
+def write_graph_snapshot(path: Path, graph: Graph) -> bool:
+    """Store ``graph`` as a term table plus little-endian uint32 id triples.
+
+    Returns False, without writing anything, when the graph holds a term that
+    the snapshot cannot represent.
+    """
+    ids: dict[Node, int] = {}
+    triples = array("I")
+    for triple in graph:
+        for term in triple:
+            term_id = ids.get(term)
+            if term_id is None:
+                term_id = ids[term] = len(ids)
+            triples.append(term_id)
+
+    terms: list[list[str | None]] = []
+    for term in ids:
+        if isinstance(term, URIRef):
+            terms.append(["u", str(term)])
+        elif isinstance(term, BNode):
+            terms.append(["b", str(term)])
+        elif isinstance(term, Literal):
+            datatype = str(term.datatype) if term.datatype is not None else None
+            terms.append(["l", str(term), term.language, datatype])
+        else:
+            return False
+    if sys.byteorder == "big":
+        triples.byteswap()
+    header = {
+        "namespaces": [[prefix, str(uri)] for prefix, uri in graph.namespaces()],
+        "terms": terms,
+    }
+    names = zlib.compress(json.dumps(header, ensure_ascii=False).encode("utf-8"))
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # A unique temporary file keeps concurrent runs from writing into the
+    # same partial snapshot; the rename is atomic within the folder.
+    descriptor, partial_name = tempfile.mkstemp(
+        dir=path.parent, prefix=f"{path.stem}-", suffix=".partial"
+    )
+    partial = Path(partial_name)
+    try:
+        with os.fdopen(descriptor, "wb") as handle:
+            handle.write(GRAPH_SNAPSHOT_MAGIC)
+            handle.write(struct.pack("<II", len(names), len(triples)))
+            handle.write(names)
+            handle.write(zlib.compress(triples.tobytes()))
+        partial.replace(path)
+    except BaseException:
+        partial.unlink(missing_ok=True)
+        raise
+    return True
+
+
+def store_graph_snapshot(path: Path, graph: Graph) -> None:
+    """Write the snapshot of a freshly parsed file and drop its older ones.
+
+    Snapshot names start with a key derived from the source path, so the
+    snapshots left over from earlier versions of the same file are found by
+    that prefix. A failure to write only costs the cache: it is reported and
+    the graph is used as parsed.
+    """
+    source_key = path.stem.split("-", 1)[0]
+    try:
+        if not write_graph_snapshot(path, graph):
+            return
+        for stale in path.parent.glob(f"{source_key}-*.graph"):
+            if stale != path:
+                stale.unlink(missing_ok=True)
+    except OSError as exc:
+        print(f"Warning: graph snapshot not written: {exc}", file=sys.stderr)
+
+
+def read_graph_snapshot(path: Path, graph: Graph) -> bool:
+    """Add the triples of a snapshot to ``graph``.
+
+    Returns False, leaving ``graph`` untouched, if the snapshot is unreadable
+    or stale.
+    """
+    try:
+        data = path.read_bytes()
+        if not data.startswith(GRAPH_SNAPSHOT_MAGIC):
+            return False
+        offset = len(GRAPH_SNAPSHOT_MAGIC)
+        names_size, id_count = struct.unpack_from("<II", data, offset)
+        offset += struct.calcsize("<II")
+        header = json.loads(zlib.decompress(data[offset : offset + names_size]))
+        triples = array("I")
+        triples.frombytes(zlib.decompress(data[offset + names_size :]))
+        terms: list[Node] = []
+        for kind, value, *literal in header["terms"]:
+            if kind == "u":
+                terms.append(URIRef(value))
+            elif kind == "b":
+                terms.append(BNode(value))
+            else:
+                language, datatype = literal
+                terms.append(
+                    Literal(
+                        value,
+                        lang=language,
+                        datatype=URIRef(datatype) if datatype is not None else None,
+                    )
+                )
+    except (OSError, ValueError, KeyError, struct.error, zlib.error):
+        return False
+    if len(triples) != id_count or (triples and max(triples) >= len(terms)):
+        return False
+    if sys.byteorder == "big":
+        triples.byteswap()
+
+    for prefix, uri in header["namespaces"]:
+        graph.bind(prefix, uri)
+    ids = iter(triples)
+    graph.addN(
+        (terms[subject], terms[predicate], terms[obj], graph)
+        for subject, predicate, obj in zip(ids, ids, ids)
+    )
+    return True
+
+
+def load_graph(paths: list[Path], cache_dir: Path | None = None) -> Graph:
+    """Parse ``paths`` into one graph, through snapshots in ``cache_dir`` if given.
+
+    Each file has its own snapshot, named after the SHA-256 of its resolved
+    path and of its content, so an unchanged schema or ontology is reused when
+    only the instances changed, and only the latest snapshot of each file is
+    kept.
+    """
     graph = Graph()
     for path in paths:
-        graph.parse(path, format="turtle")
+        if cache_dir is None:
+            graph.parse(path, format="turtle")
+            continue
+        source_key = hashlib.sha256(str(path.resolve()).encode("utf-8")).hexdigest()
+        digest = hashlib.sha256(path.read_bytes()).hexdigest()
+        snapshot = cache_dir / f"{source_key[:16]}-{digest}.graph"
+        if snapshot.is_file() and read_graph_snapshot(snapshot, graph):
+            continue
+        # Without the rdflib default bindings, the parsed graph holds the
+        # prefixes of the file only; they are bound again on every load, as
+        # the parser itself does.
+        parsed = Graph(bind_namespaces="none").parse(path, format="turtle")
+        store_graph_snapshot(snapshot, parsed)
+        for prefix, uri in parsed.namespaces():
+            graph.bind(prefix, uri)
+        graph.addN((*triple, graph) for triple in parsed)
     return graph
 
 
@@ -97,6 +335,26 @@ def term_to_csv_value(term: object) -> str:
     return str(term)
 
 
+def read_query_text(path: Path) -> str:
+    query_text = path.read_text(encoding="utf-8").strip()
+    if not query_text:
+        raise ValueError(f"Query file is empty: {path}")
+    return query_text
+
+
+def prepare_select_query(query_text: str, query_path: Path, graph: Graph) -> Query:
+    """Parse a query with the prefixes of ``graph``, as ``Graph.query`` does."""
+    try:
+        query = prepareQuery(query_text, initNs=dict(graph.namespaces()))
+    except Exception as exc:
+        raise ValueError(f"Invalid SPARQL query in {query_path}: {exc}") from exc
+    if query.algebra.name != "SelectQuery":
+        raise ValueError(
+            f"Only SPARQL SELECT queries can be exported to CSV: {query_path}"
+        )
+    return query
+
+
 def write_select_result_to_csv(result, output_path: Path) -> int:
     if getattr(result, "type", None) != "SELECT":
         raise ValueError("Only SPARQL SELECT queries can be exported to CSV.")
@@ -118,6 +376,32 @@ def write_select_result_to_csv(result, output_path: Path) -> int:
     return row_count
 
 
+def run_select_query(
+    graph: Graph, query: Query, output_path: Path
+) -> tuple[int, float]:
+    started = time.perf_counter()
+    row_count = write_select_result_to_csv(graph.query(query), output_path)
+    return row_count, time.perf_counter() - started
+
+
+def write_timings(
+    path: Path,
+    load_seconds: float,
+    query_paths: list[Path],
+    output_paths: list[Path],
+    results: list[tuple[int, float]],
+) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8", newline="") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(["query", "output", "rows", "seconds"])
+        writer.writerow(["(load graphs)", "", "", f"{load_seconds:.3f}"])
+        for query_path, output_path, (row_count, seconds) in zip(
+            query_paths, output_paths, results
+        ):
+            writer.writerow([query_path, output_path, row_count, f"{seconds:.3f}"])
+
+
 def main() -> int:
     args = parse_args()
 
@@ -125,8 +409,9 @@ def main() -> int:
     input_dir = script_dir.parent / "inputs"
     output_dir = script_dir.parent / "outputs"
 
-    query_path = resolve_existing_file(args.input)
-    output_path = resolve_output_path(args.output, query_path, output_dir)
+    batch = len(args.input) > 1 or Path(args.input[0]).expanduser().is_dir()
+    query_paths = query_files(args.input)
+    output_paths = resolve_output_paths(args.output, query_paths, output_dir, batch)
 
     schema_path = resolve_existing_file(args.schema, "demo-schema.ttl", input_dir)
     ontology_path = resolve_existing_file(
@@ -136,21 +421,68 @@ def main() -> int:
         args.instances, "instances_extended.ttl", input_dir
     )
 
-    query_text = query_path.read_text(encoding="utf-8").strip()
-    if not query_text:
-        raise ValueError(f"Query file is empty: {query_path}")
-
-    graph = load_graph([schema_path, ontology_path, instances_path])
-    result = graph.query(query_text)
-    row_count = write_select_result_to_csv(result, output_path)
+    query_texts = [read_query_text(path) for path in query_paths]
+
+    cache_dir = None
+    if not args.no_graph_cache:
+        cache_dir = (
+            Path(args.graph_cache_dir).expanduser().resolve()
+            if args.graph_cache_dir
+            else (script_dir.parent / ".cache" / "graphs").resolve()
+        )
+
+    started = time.perf_counter()
+    graph = load_graph([schema_path, ontology_path, instances_path], cache_dir)
+    load_seconds = time.perf_counter() - started
+
+    # Every query is parsed before any runs, so a typo in the last query of a
+    # batch is reported before the others spend their time.
+    queries = [
+        prepare_select_query(text, path, graph)
+        for text, path in zip(query_texts, query_paths)
+    ]
+    if args.threads > 1 and len(queries) > 1:
+        with ThreadPoolExecutor(max_workers=args.threads) as executor:
+            results = list(
+                executor.map(
+                    run_select_query, [graph] * len(queries), queries, output_paths
+                )
+            )
+    else:
+        results = [
+            run_select_query(graph, query, output_path)
+            for query, output_path in zip(queries, output_paths)
+        ]
+    if args.timings_output:
+        write_timings(
+            Path(args.timings_output).expanduser().resolve(),
+            load_seconds,
+            query_paths,
+            output_paths,
+            results,
+        )
 
     print("Loaded graph files:")
     print(f"- {schema_path}")
     print(f"- {ontology_path}")
     print(f"- {instances_path}")
-    print(f"Query file: {query_path}")
-    print(f"Output CSV: {output_path}")
-    print(f"Rows written: {row_count}")
+    if not batch:
+        print(f"Query file: {query_paths[0]}")
+        print(f"Output CSV: {output_paths[0]}")
+        print(f"Rows written: {results[0][0]}")
+    else:
+        print(f"Graphs loaded in {load_seconds:.2f}s")
+        print(f"Queries run: {len(queries)}")
+        for query_path, output_path, (row_count, seconds) in zip(
+            query_paths, output_paths, results
+        ):
+            print(
+                f"- {query_path.name}: {row_count} rows in {seconds:.2f}s -> {output_path}"
+            )
+        total = sum(seconds for _row_count, seconds in results)
+        print(f"Total query time: {total:.2f}s")
+    if args.timings_output:
+        print(f"Timings written to: {Path(args.timings_output).expanduser().resolve()}")
 
     return 0
 